@@ -8,12 +8,13 @@ for AWS cost data. It's designed to work with the aws_cost_monitor.py script.
 
 import os
 import json
+import time
 import datetime
 from pathlib import Path
 from typing import List, Dict, Any, Tuple, Optional
 
 # For HTML generation
-from jinja2 import Template
+from jinja2 import Environment, select_autoescape
 
 # For chart generation
 try:
@@ -24,6 +25,17 @@ try:
 except ImportError:
     PLOTLY_AVAILABLE = False
 
+# Shared Jinja2 environment: trim/lstrip block whitespace and decide
+# autoescaping once at the environment level instead of per render.
+# The report is built with from_string, which stays unescaped like the
+# original bare Template: its variables carry prebuilt HTML fragments.
+_ENV = Environment(
+    trim_blocks=True,
+    lstrip_blocks=True,
+    autoescape=select_autoescape(['html'], default_for_string=False),
+    auto_reload=False,
+    cache_size=400
+)
 
 class HTMLReportGenerator:
     """Generate beautiful HTML reports for AWS cost data."""
@@ -37,6 +49,7 @@ class HTMLReportGenerator:
         self.title = title
         self.report_data = {}
         self.charts = []
+        self._tctx = None
         
         # Check if required libraries are available
         if not PLOTLY_AVAILABLE:
@@ -341,6 +354,27 @@ class HTMLReportGenerator:
                     'html': fig.to_html(full_html=False, include_plotlyjs='cdn')
                 })
     
+    def _time_context(self) -> Dict[str, Any]:
+        """Get the date strings used by the report, recomputed at most once a minute.
+        
+        Returns:
+            Dict[str, Any]: Formatted dates and generation time for the template
+        """
+        if self._tctx is None or time.time() - self._tctx['ts'] > 60:
+            today = datetime.datetime.now()
+            last_month = today.month - 1 if today.month > 1 else 12
+            last_month_year = today.year if today.month > 1 else today.year - 1
+            self._tctx = {
+                'ts': time.time(),
+                'today_date': today.strftime("%Y-%m-%d"),
+                'first_day_last_month': datetime.datetime(last_month_year, last_month, 1).strftime("%Y-%m-%d"),
+                'generation_time': today.strftime("%b %d, %Y at %I:%M %p"),  # More readable format (Apr 10, 2025 at 4:52 PM)
+                'current_year': today.year,
+                'current_month': today.strftime("%B"),
+                'last_month': (today.replace(day=1) - datetime.timedelta(days=1)).strftime("%B")
+            }
+        return self._tctx
+    
     def generate_html(self) -> str:
         """Generate the HTML report.
         
@@ -1459,25 +1493,20 @@ class HTMLReportGenerator:
         """
         
         # Create the template
-        template = Template(template_str)
+        template = _ENV.from_string(template_str)
         
         # Get today's date and the first day of last month
-        today = datetime.datetime.now()
-        last_month = today.month - 1 if today.month > 1 else 12
-        last_month_year = today.year if today.month > 1 else today.year - 1
-        first_day_last_month = datetime.datetime(last_month_year, last_month, 1).strftime("%Y-%m-%d")
-        today_date = today.strftime("%Y-%m-%d")
-        generation_time = today.strftime("%b %d, %Y at %I:%M %p")  # More readable format (Apr 10, 2025 at 4:52 PM)
+        time_ctx = self._time_context()
         
         # Render the template with data
         html = template.render(
             title=self.title,
-            generation_time=generation_time,
-            today_date=today_date,
-            first_day_last_month=first_day_last_month,
-            current_year=datetime.datetime.now().year,
-            current_month=datetime.datetime.now().strftime("%B"),
-            last_month=(datetime.datetime.now().replace(day=1) - datetime.timedelta(days=1)).strftime("%B"),
+            generation_time=time_ctx['generation_time'],
+            today_date=time_ctx['today_date'],
+            first_day_last_month=time_ctx['first_day_last_month'],
+            current_year=time_ctx['current_year'],
+            current_month=time_ctx['current_month'],
+            last_month=time_ctx['last_month'],
             charts=self.charts,
             monthly_costs=self.report_data.get('monthly_costs', []),
             service_costs=self.report_data.get('service_costs', []),
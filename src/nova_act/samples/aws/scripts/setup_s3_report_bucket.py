@@ -2,32 +2,131 @@
 """
 S3 Report Bucket Setup Script
 
-This script uses the Nova Act browser automation tool to:
-1. Log into the AWS console
-2. Create an S3 bucket for hosting AWS cost reports
-3. Configure the bucket with appropriate public read permissions
+This script uses the AWS SDK (boto3) to:
+1. Create an S3 bucket for hosting AWS cost reports
+2. Configure the bucket with appropriate public read permissions
+3. Enable static website hosting on the bucket
 4. Update the .env file with the bucket name
 
+If API credentials are not available, pass --use-browser to perform the same
+steps through the AWS console with the Nova Act browser automation tool.
+
 Usage:
-    python setup_s3_report_bucket.py --bucket_name="my-reports-bucket" [--region="us-east-1"]
+    python setup_s3_report_bucket.py --bucket_name="my-reports-bucket" [--region="us-east-1"] [--use-browser [--headed]]
 """
 
 import os
 import sys
 import re
+import json
 import time
-import random
-import string
+import secrets
 import argparse
+import functools
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from dotenv import load_dotenv
+import boto3
+from botocore.exceptions import ClientError, EndpointConnectionError
+from retry import retry
+
+from nova_act import (
+    BOOL_SCHEMA,
+    ActAgentError,
+    ActExceededMaxStepsError,
+    ActInternalServerError,
+    ActRateLimitExceededError,
+    ActTimeoutError,
+    NovaAct,
+)
+from nova_act.types.act_errors import ActServiceUnavailableError
+
+
+@functools.lru_cache(maxsize=8)
+def _load_env(path_str, mtime_ns):
+    """Parse the KEY=VALUE lines of a .env file once per (path, modification time)."""
+    values = {}
+    for line in Path(path_str).read_text().splitlines():
+        line = line.strip()
+        if not line or line.startswith('#') or '=' not in line:
+            continue
+        key, _, value = line.partition('=')
+        value = value.strip()
+        if value[:1] in ('"', "'"):
+            # Keep what lies between the quotes; anything after the closing quote
+            # (such as an inline comment) is dropped
+            end = value.find(value[0], 1)
+            value = value[1:end] if end != -1 else value[1:]
+        else:
+            # Drop inline comments such as the one update_env_file writes
+            value = value.split(' #', 1)[0].rstrip()
+        values[key.strip()] = value
+    return values
 
-from nova_act import NovaAct
 
-# Load environment variables
+# Load environment variables (existing variables take precedence, as with load_dotenv)
 dotenv_path = Path(__file__).parent / '.env'
-load_dotenv(dotenv_path)
+if dotenv_path.exists():
+    for key, value in _load_env(str(dotenv_path), os.stat(dotenv_path).st_mtime_ns).items():
+        os.environ.setdefault(key, value)
+
+# S3 error codes worth retrying; other client errors (AccessDenied, BucketAlreadyExists,
+# MalformedPolicy, ...) are permanent and fail immediately
+_RETRYABLE_AWS_CODES = frozenset({
+    'SlowDown', 'Throttling', 'ThrottlingException', 'RequestLimitExceeded', 'OperationAborted'
+})
+
+
+class _TransientAWSError(Exception):
+    """A retryable AWS failure; the original ClientError is its __cause__"""
+
+
+def _retry_aws(func):
+    """
+    Retry transient AWS failures up to 3 times with exponential backoff (2s, 4s, ... capped at 30s)
+    
+    Throttling codes, OperationAborted, 5xx responses and connection errors are
+    retried; once the attempts run out, the original error is re-raised.
+    """
+    @retry(exceptions=(_TransientAWSError, EndpointConnectionError), tries=3, delay=2, backoff=2, max_delay=30)
+    def attempt(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        except ClientError as e:
+            status = e.response.get('ResponseMetadata', {}).get('HTTPStatusCode', 0)
+            if e.response.get('Error', {}).get('Code') in _RETRYABLE_AWS_CODES or status >= 500:
+                raise _TransientAWSError(str(e)) from e
+            raise
+    
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return attempt(*args, **kwargs)
+        except _TransientAWSError as e:
+            error = e.__cause__
+        # Raised outside the handler so the original error carries no chain back to the wrapper
+        raise error
+    
+    return wrapper
+
+
+# Act failures that just mean the page is still loading or the service is busy;
+# anything else (auth, guardrails, a cancel, a closed browser) fails immediately
+_TRANSIENT_ACT_ERRORS = (
+    ActAgentError,
+    ActExceededMaxStepsError,
+    ActInternalServerError,
+    ActRateLimitExceededError,
+    ActServiceUnavailableError,
+    ActTimeoutError,
+)
+
+_retry_act = retry(exceptions=_TRANSIENT_ACT_ERRORS, tries=3, delay=2, backoff=2, max_delay=30)
+
+# Characters S3 does not allow in bucket names
+_BUCKET_SANITIZE = re.compile(r'[^a-z0-9-]')
 
 # Get AWS credentials from environment variables
 AWS_ACCOUNT = os.getenv('AWS_ACCOUNT')
@@ -41,17 +140,45 @@ def generate_bucket_name(base_name=None):
         base_name = 'aws-cost-reports'
     
     # Clean the base name to conform to S3 bucket naming rules
-    base_name = re.sub(r'[^a-z0-9-]', '-', base_name.lower())
+    base_name = _BUCKET_SANITIZE.sub('-', base_name.lower())
     
     # Add timestamp and random suffix for uniqueness
     timestamp = datetime.now().strftime('%Y%m%d')
-    rand_suffix = ''.join(random.choices(string.ascii_lowercase + string.digits, k=6))
+    rand_suffix = secrets.token_hex(3)
     
     # Combine to create unique bucket name (limited to 63 characters)
     bucket_name = f"{base_name}-{timestamp}-{rand_suffix}"
     return bucket_name[:63]
 
 
+def wait_for(n, description, timeout=15, interval=0.25):
+    """
+    Poll the page until the described element is visible.
+    
+    Returns True as soon as Nova Act reports the element as visible. Raises
+    TimeoutError once the timeout expires, so the setup stops instead of acting
+    on a page that never loaded.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            result = n.act(f"Is the {description} visible on the page?", schema=BOOL_SCHEMA)
+            if result.matches_schema and result.parsed_response:
+                return True
+        except _TRANSIENT_ACT_ERRORS:
+            # The page may still be transitioning; keep polling until the deadline
+            pass
+        if time.monotonic() >= deadline:
+            raise TimeoutError(f"Timed out waiting for: {description}")
+        time.sleep(interval)
+
+
+@_retry_act
+def _act(n, prompt):
+    """Run a Nova Act step, retrying only the transient failures in _TRANSIENT_ACT_ERRORS."""
+    return n.act(prompt)
+
+
 def update_env_file(bucket_name):
     """Update the .env file with the S3 bucket name."""
     env_path = Path(__file__).parent / '.env'
@@ -60,121 +187,220 @@ def update_env_file(bucket_name):
         print(f"Error: .env file not found at {env_path}")
         return False
     
-    # Read the current content
-    with open(env_path, 'r') as f:
-        content = f.read()
-    
-    # Check if AWS_REPORT_BUCKET already exists
-    if 'AWS_REPORT_BUCKET=' in content:
-        # Replace the existing value
-        content = re.sub(
-            r'AWS_REPORT_BUCKET=.*',
-            f'AWS_REPORT_BUCKET={bucket_name}  # S3 bucket for hosting cost reports',
-            content
-        )
-    else:
-        # Add the new variable
-        content += f'\n# S3 bucket for hosting cost reports\nAWS_REPORT_BUCKET={bucket_name}\n'
-    
-    # Write the updated content
-    with open(env_path, 'w') as f:
-        f.write(content)
+    # Stream the file into a temp file in the same directory, replacing only the
+    # AWS_REPORT_BUCKET line, then atomically swap it into place
+    replaced = False
+    tmp = tempfile.NamedTemporaryFile('w', dir=env_path.parent, prefix='.env.', delete=False)
+    try:
+        with open(env_path, 'r') as src, tmp:
+            for line in src:
+                if line.startswith('AWS_REPORT_BUCKET='):
+                    tmp.write(f'AWS_REPORT_BUCKET={bucket_name}  # S3 bucket for hosting cost reports\n')
+                    replaced = True
+                else:
+                    tmp.write(line)
+            
+            if not replaced:
+                # Add the new variable
+                tmp.write(f'\n# S3 bucket for hosting cost reports\nAWS_REPORT_BUCKET={bucket_name}\n')
+        
+        shutil.copymode(env_path, tmp.name)
+        os.replace(tmp.name, env_path)
+    except BaseException:
+        # Don't leave a partial copy next to .env
+        os.unlink(tmp.name)
+        raise
     
     print(f"Updated .env file with bucket name: {bucket_name}")
     return True
 
 
-def setup_s3_bucket(bucket_name=None, region="us-east-1"):
-    """Set up an S3 bucket for AWS cost reports using Nova Act."""
+def setup_s3_bucket_boto3(bucket_name=None, region="us-east-1"):
+    """Set up an S3 bucket for AWS cost reports using direct boto3 API calls."""
+    if not bucket_name:
+        bucket_name = generate_bucket_name()
+    
+    print(f"Setting up S3 bucket: {bucket_name} in region {region}")
+    
+    try:
+        s3 = boto3.client('s3', region_name=region)
+        
+        @_retry_aws
+        def create_bucket():
+            try:
+                # us-east-1 does not accept a location constraint
+                if region == 'us-east-1':
+                    s3.create_bucket(Bucket=bucket_name)
+                else:
+                    s3.create_bucket(
+                        Bucket=bucket_name,
+                        CreateBucketConfiguration={'LocationConstraint': region}
+                    )
+            except ClientError as e:
+                # An earlier attempt may have succeeded before the error surfaced
+                if e.response['Error']['Code'] != 'BucketAlreadyOwnedByYou':
+                    raise
+        
+        # Create the bucket
+        print(f"Creating new bucket: {bucket_name}...")
+        create_bucket()
+        
+        bucket_policy = {
+            "Version": "2012-10-17",
+            "Statement": [
+                {
+                    "Sid": "PublicReadGetObject",
+                    "Effect": "Allow",
+                    "Principal": "*",
+                    "Action": "s3:GetObject",
+                    "Resource": f"arn:aws:s3:::{bucket_name}/*"
+                }
+            ]
+        }
+        
+        @_retry_aws
+        def enable_website_hosting():
+            s3.put_bucket_website(
+                Bucket=bucket_name,
+                WebsiteConfiguration={
+                    'IndexDocument': {'Suffix': 'index.html'},
+                    'ErrorDocument': {'Key': 'index.html'}
+                }
+            )
+        
+        @_retry_aws
+        def allow_public_read():
+            # The public access block must be relaxed before S3 accepts a public policy
+            s3.put_public_access_block(
+                Bucket=bucket_name,
+                PublicAccessBlockConfiguration={
+                    'BlockPublicAcls': False,
+                    'IgnorePublicAcls': False,
+                    'BlockPublicPolicy': False,
+                    'RestrictPublicBuckets': False
+                }
+            )
+            s3.put_bucket_policy(Bucket=bucket_name, Policy=json.dumps(bucket_policy))
+        
+        # Website hosting is independent of the access settings, so configure both concurrently
+        print("Configuring static website hosting and public read access...")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(enable_website_hosting),
+                executor.submit(allow_public_read)
+            ]
+            for future in futures:
+                future.result()
+        
+        # The endpoint follows the format: http://bucket-name.s3-website-region.amazonaws.com
+        bucket_endpoint = f"http://{bucket_name}.s3-website-{region}.amazonaws.com"
+        print(f"Bucket website endpoint: {bucket_endpoint}")
+        
+        # Success
+        print(f"S3 bucket '{bucket_name}' created successfully")
+        print(f"Reports will be accessible at: {bucket_endpoint}/cost_reports/")
+        
+        # Update .env file
+        update_env_file(bucket_name)
+        
+        return {
+            "success": True,
+            "bucket_name": bucket_name,
+            "region": region,
+            "endpoint": bucket_endpoint
+        }
+    
+    except Exception as e:
+        print(f"Error: {str(e)}")
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+def setup_s3_bucket(bucket_name=None, region="us-east-1", headless=True, nova_act=None):
+    """
+    Set up an S3 bucket for AWS cost reports using Nova Act.
+    
+    The browser runs headless by default. Console pages occasionally render
+    differently without a window; if element lookups start failing, rerun
+    with headless=False (--headed on the command line).
+    
+    Pass an already started NovaAct client as
+    nova_act to reuse its browser; it is left running for the caller.
+    
+    Use setup_s3_bucket_boto3 instead when AWS API credentials are available.
+    """
     if not bucket_name:
         bucket_name = generate_bucket_name()
     
     print(f"Setting up S3 bucket: {bucket_name} in region {region}")
     
-    # Initialize Nova Act
-    print("Starting browser automation with Nova Act...")
-    n = NovaAct(starting_page="https://console.aws.amazon.com/console/home")
+    owns_browser = nova_act is None
+    if owns_browser:
+        if headless:
+            # Avoid /dev/shm exhaustion in containers; user-provided args take precedence
+            os.environ.setdefault("NOVA_ACT_BROWSER_ARGS", "--disable-dev-shm-usage")
+        
+        # Initialize Nova Act
+        print("Starting browser automation with Nova Act...")
+        n = NovaAct(starting_page="https://console.aws.amazon.com/console/home", headless=headless)
+    else:
+        n = nova_act
     
     try:
-        # Start the browser
-        n.start()
-        print("Browser started successfully")
+        if owns_browser:
+            # Start the browser
+            n.start()
+            print("Browser started successfully")
         
         # Log in to AWS Console
         print("Logging into AWS Console...")
-        n.act("Input my AWS account email")
-        time.sleep(1)
-        n.act(f"Type {AWS_ACCOUNT}")
-        time.sleep(1)
-        n.act("Click Next")
-        time.sleep(2)
-        n.act("Input my AWS password")
-        time.sleep(1)
-        n.act(f"Type {AWS_PASSWORD}")
-        time.sleep(1)
-        n.act("Click Sign in")
-        time.sleep(5)
+        _act(n, f"Enter {AWS_ACCOUNT} in the AWS account email field and click Next")
+        wait_for(n, "password field")
+        _act(n, f"Enter {AWS_PASSWORD} in the password field and click Sign in")
+        wait_for(n, "AWS console search bar", timeout=30)
         
         # Navigate to S3
         print("Navigating to S3 service...")
-        n.act("Search for S3 in the AWS console search bar")
-        time.sleep(2)
-        n.act("Click on S3 in the search results")
-        time.sleep(5)
+        _act(n, "Search for S3 in the AWS console search bar and click on S3 in the search results")
+        wait_for(n, "Create bucket button", timeout=30)
         
-        # Create a new bucket
+        # Create a new bucket with public read allowed for report hosting
         print(f"Creating new bucket: {bucket_name}...")
-        n.act("Click Create bucket")
-        time.sleep(2)
-        n.act(f"Type {bucket_name} in the bucket name field")
-        time.sleep(1)
-        
-        # Set region
-        n.act(f"Select {region} as the AWS Region")
-        time.sleep(1)
-        
-        # Configure bucket settings for report hosting
-        n.act("Scroll down to 'Block Public Access settings for this bucket'")
-        time.sleep(1)
-        n.act("Uncheck 'Block all public access' to allow public read of reports")
-        time.sleep(1)
-        n.act("Check the acknowledgment checkbox for public access")
-        time.sleep(1)
-        
-        # Complete bucket creation
-        n.act("Scroll to the bottom and click Create bucket")
-        time.sleep(5)
+        _act(n, "Click Create bucket")
+        wait_for(n, "bucket name field")
+        _act(
+            n,
+            f"Type {bucket_name} in the bucket name field, select {region} as the AWS Region, "
+            "scroll down to 'Block Public Access settings for this bucket', uncheck 'Block all public access' "
+            "and check the acknowledgment checkbox for public access"
+        )
+        _act(n, "Scroll to the bottom and click Create bucket")
+        wait_for(n, "bucket list search field", timeout=30)
         
         # Verify bucket creation
-        n.act(f"Search for {bucket_name} in the bucket list")
-        time.sleep(3)
+        _act(n, f"Search for {bucket_name} in the bucket list and click on the bucket named {bucket_name}")
+        wait_for(n, "Properties tab")
         
         # Configure bucket for static website hosting
         print("Configuring bucket for static website hosting...")
-        n.act(f"Click on the bucket named {bucket_name}")
-        time.sleep(2)
-        n.act("Click on the Properties tab")
-        time.sleep(2)
-        n.act("Scroll down to Static website hosting")
-        time.sleep(1)
-        n.act("Click Edit")
-        time.sleep(1)
-        n.act("Select 'Enable' for Static website hosting")
-        time.sleep(1)
-        n.act("Type index.html for both the index and error document")
-        time.sleep(1)
-        n.act("Click Save changes")
-        time.sleep(3)
+        _act(n, "Click on the Properties tab, scroll down to Static website hosting and click Edit")
+        wait_for(n, "'Enable' option for Static website hosting")
+        _act(
+            n,
+            "Select 'Enable' for Static website hosting, type index.html for both the index "
+            "and error document, and click Save changes"
+        )
+        wait_for(n, "Permissions tab")
         
         # Set bucket policy for public read
         print("Setting bucket policy for public read access...")
-        n.act("Go to the Permissions tab")
-        time.sleep(2)
-        n.act("Scroll down to Bucket policy and click Edit")
-        time.sleep(2)
+        _act(n, "Go to the Permissions tab, scroll down to Bucket policy and click Edit")
+        wait_for(n, "bucket policy editor")
         
-        bucket_policy = """
-        {
+        # Compact JSON keeps the text Nova Act has to type short
+        bucket_policy = json.dumps({
             "Version": "2012-10-17",
             "Statement": [
                 {
@@ -182,23 +408,12 @@ def setup_s3_bucket(bucket_name=None, region="us-east-1"):
                     "Effect": "Allow",
                     "Principal": "*",
                     "Action": "s3:GetObject",
-                    "Resource": "arn:aws:s3:::%s/*"
+                    "Resource": f"arn:aws:s3:::{bucket_name}/*"
                 }
             ]
-        }
-        """ % bucket_name
+        }, separators=(",", ":"))
         
-        n.act(f"In the policy editor, type or paste the following policy: {bucket_policy}")
-        time.sleep(2)
-        n.act("Click Save changes")
-        time.sleep(3)
-        
-        # Get the website endpoint
-        n.act("Go back to the Properties tab")
-        time.sleep(2)
-        n.act("Scroll down to Static website hosting")
-        time.sleep(1)
-        n.act("Copy the bucket website endpoint")
+        _act(n, f"In the policy editor, type or paste the following policy and click Save changes: {bucket_policy}")
         
         # The endpoint follows the format: http://bucket-name.s3-website-region.amazonaws.com
         bucket_endpoint = f"http://{bucket_name}.s3-website-{region}.amazonaws.com"
@@ -225,12 +440,13 @@ def setup_s3_bucket(bucket_name=None, region="us-east-1"):
             "error": str(e)
         }
     finally:
-        # Clean up
-        try:
-            n.stop()
-            print("Browser closed")
-        except:
-            pass
+        # Clean up the browser only if this call started it
+        if owns_browser:
+            try:
+                n.stop()
+                print("Browser closed")
+            except:
+                pass
 
 
 def parse_arguments():
@@ -251,6 +467,18 @@ def parse_arguments():
         help="AWS region for the bucket (default: us-east-1)"
     )
     
+    parser.add_argument(
+        "--use-browser",
+        action="store_true",
+        help="Create the bucket through the AWS console with Nova Act instead of the AWS API"
+    )
+    
+    parser.add_argument(
+        "--headed",
+        action="store_true",
+        help="Show the browser window when using --use-browser (default: headless)"
+    )
+    
     return parser.parse_args()
 
 
@@ -258,10 +486,17 @@ def main():
     """Main function to run the script."""
     args = parse_arguments()
     
-    result = setup_s3_bucket(
-        bucket_name=args.bucket_name,
-        region=args.region
-    )
+    if args.use_browser:
+        result = setup_s3_bucket(
+            bucket_name=args.bucket_name,
+            region=args.region,
+            headless=not args.headed
+        )
+    else:
+        result = setup_s3_bucket_boto3(
+            bucket_name=args.bucket_name,
+            region=args.region
+        )
     
     if result["success"]:
         print("\nS3 bucket setup completed successfully!")
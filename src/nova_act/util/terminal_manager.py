@@ -11,16 +11,20 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import io
 import os
 import sys
+import threading
+from types import ModuleType
 
 DEFAULT_TERMINAL_COLS = 80
 
-if os.name == "nt":
-    # Windows-specific keyboard handling
-    import msvcrt  # noqa: F401
-else:
-    import termios
+# Whether stdin is an interactive terminal, determined once per process
+try:
+    _IS_INTERACTIVE = sys.stdin.isatty()
+except (AttributeError, ValueError, OSError, io.UnsupportedOperation):
+    # stdin is missing (None), closed, or a stand-in without a real file
+    _IS_INTERACTIVE = False
 
 
 class TerminalInputManager:
@@ -29,13 +33,18 @@ class TerminalInputManager:
     """
 
     fd: int
+    _termios: ModuleType
     new_term: list
     old_term: list
     is_interactive: bool = False
+    # Per fd: [number of active managers, settings read when the first of them entered].
+    # Nested managers reuse the snapshot; it is refreshed once no manager is active.
+    _active_terms: dict[int, list] = {}
+    _active_terms_lock = threading.Lock()
 
-    def __init__(self):
-        # Check if running in an interactive terminal
-        self.is_interactive = sys.stdin.isatty() and os.isatty(sys.stdin.fileno())
+    def __init__(self, is_interactive: bool = _IS_INTERACTIVE):
+        # Whether running in an interactive terminal; overridable for tests
+        self.is_interactive = is_interactive
 
     def __enter__(self):
         if not self.is_interactive:
@@ -45,17 +54,38 @@ class TerminalInputManager:
             # No equivalent setup required for Windows.
             pass
         else:
+            # Only needed once a POSIX terminal is actually being configured
+            import termios
+
+            self._termios = termios
             try:
-                # Save the terminal settings
                 self.fd = sys.stdin.fileno()
-                self.new_term = termios.tcgetattr(self.fd)
-                self.old_term = termios.tcgetattr(self.fd)
+            except (AttributeError, ValueError, OSError, io.UnsupportedOperation):
+                # stdin was replaced after import (e.g. pytest capture) and has no descriptor
+                self.is_interactive = False
+                return self
 
-                # New terminal setting unbuffered
-                self.new_term[3] = self.new_term[3] & ~termios.ICANON & ~termios.ECHO
-                termios.tcsetattr(self.fd, termios.TCSAFLUSH, self.new_term)
+            try:
+                # Save the terminal settings, unless an active manager already holds them
+                with TerminalInputManager._active_terms_lock:
+                    active = TerminalInputManager._active_terms.get(self.fd)
+                    if active is None:
+                        active = [0, termios.tcgetattr(self.fd)]
+                        TerminalInputManager._active_terms[self.fd] = active
+                    active[0] += 1
+                self.old_term = active[1]
+                # Copy (including the control-character list) so changes don't leak into the cache
+                self.new_term = list(self.old_term)
+                self.new_term[6] = list(self.old_term[6])
+
+                # New terminal setting unbuffered: return each keystroke as soon as it arrives
+                self.new_term[3] &= ~(termios.ICANON | termios.ECHO)
+                self.new_term[6][termios.VMIN] = 1
+                self.new_term[6][termios.VTIME] = 0
+                termios.tcsetattr(self.fd, termios.TCSANOW, self.new_term)
             except termios.error:
                 # Handle case where terminal manipulation fails
+                self._release_term()
                 self.is_interactive = False
 
         return self
@@ -65,7 +95,23 @@ class TerminalInputManager:
             return
 
         if os.name != "nt":
+            termios = self._termios
+            if not self._release_term():
+                # An outer manager is still active and restores the settings when it exits
+                return
             try:
                 termios.tcsetattr(self.fd, termios.TCSAFLUSH, self.old_term)
             except termios.error:
                 pass  # Ignore errors when restoring terminal settings
+
+    def _release_term(self) -> bool:
+        """Drop this manager's hold on the fd's snapshot; True once no manager is active."""
+        with TerminalInputManager._active_terms_lock:
+            active = TerminalInputManager._active_terms.get(self.fd)
+            if active is None:
+                return True
+            active[0] -= 1
+            if active[0] > 0:
+                return False
+            del TerminalInputManager._active_terms[self.fd]
+            return True
@@ -8,21 +8,38 @@ clear separation of concerns and high testability.
 
 __version__ = "1.0.0"
 
-# Convenience imports for public API
-from .adapters.cli_adapter import main
-from .domain.services import CostAnalysisService
-from .adapters.aws_cost_adapter import AWSCostAdapter
-from .adapters.html_report_adapter import HTMLReportAdapter
-from .api.service_cancellation import ServiceCancellationAPI, cancel_service_directly
+import functools
+import importlib
 
+# Convenience exports for the public API, imported on first attribute access
+# (PEP 562) so that importing the package does not pull in boto3 or Jinja2
+_LAZY_IMPORTS = {
+    "main": ".adapters.cli_adapter",
+    "CostAnalysisService": ".domain.services",
+    "AWSCostAdapter": ".adapters.aws_cost_adapter",
+    "HTMLReportAdapter": ".adapters.html_report_adapter",
+    "ServiceCancellationAPI": ".api.service_cancellation",
+    "cancel_service_directly": ".api.service_cancellation",
+}
 
-def create_service():
-    """
-    Factory method to create the main domain service with required adapters.
+
+def __getattr__(name):
+    """Resolve the lazily imported public API names."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_service():
+    """Build the domain service once and reuse it for subsequent calls."""
+    from .domain.services import CostAnalysisService
+    from .adapters.aws_cost_adapter import AWSCostAdapter
+    from .adapters.html_report_adapter import HTMLReportAdapter
     
-    Returns:
-        Configured CostAnalysisService instance
-    """
     cost_adapter = AWSCostAdapter()
     report_adapter = HTMLReportAdapter(cost_adapter)
     
@@ -33,6 +50,30 @@ def create_service():
     )
 
 
+def create_service():
+    """
+    Factory method to create the main domain service with required adapters.
+    
+    The service (and the boto3 clients behind its adapters) is built on the
+    first call and shared afterwards; use reset_service() to discard it.
+    
+    Returns:
+        Configured CostAnalysisService instance
+    """
+    return _cached_service()
+
+
+def reset_service():
+    """
+    Discard the cached domain service so the next create_service() call
+    builds a fresh one (e.g. after changing credentials or in tests).
+    """
+    if _cached_service.cache_info().currsize:
+        # Release the query threads of the adapter being discarded
+        _cached_service().cost_data_port.close()
+    _cached_service.cache_clear()
+
+
 def generate_report(days_back=30, output_path=None, open_report=True):
     """
     Generate an AWS cost report.
@@ -94,6 +135,7 @@ def cancel_service(service_name, service_id=None, region="us-east-1"):
     Returns:
         Dictionary with cancellation status and details
     """
+    from .api.service_cancellation import cancel_service_directly
     return cancel_service_directly(service_name, service_id, region)
 
 
@@ -102,6 +144,7 @@ __all__ = [
     "AWSCostAdapter", 
     "HTMLReportAdapter",
     "create_service",
+    "reset_service",
     "generate_report",
     "analyze_costs",
     "run_api",
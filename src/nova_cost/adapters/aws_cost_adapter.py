@@ -6,67 +6,430 @@ bridging between the domain logic and the AWS-specific API according to
 Hexagonal Architecture principles.
 """
 import os
+import json
+import functools
+import time
+import hashlib
+import threading
 import boto3
 import datetime
-from typing import Dict, List, Tuple, Any, Optional
+from operator import itemgetter
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from typing import Dict, List, Mapping, Tuple, Any, Optional
 from pathlib import Path
-from dotenv import load_dotenv
 import logging
 
 from ..domain.ports import CostDataPort
 from ..utils.aws_resource_scanner import AWSResourceScanner
 from ..utils.aws_billing_detective import AWSBillingDetective
 from ..utils.aws_service_classifier import AWSServiceClassifier
+from ..utils.aws_identity import credential_scope
+from ..utils.botocore_json import use_fast_json_parser
+from ..utils.env import load_env
+from ..utils.text_match import KeywordMatcher
+
+logger = logging.getLogger(__name__)
 
 # Load environment variables from .env file
-dotenv_path = Path(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))).joinpath('.env')
-if dotenv_path.exists():
-    load_dotenv(dotenv_path=dotenv_path)
-    print(f"Loaded environment variables from: {dotenv_path}")
-else:
-    print(f"Warning: No .env file found at {dotenv_path}")
+load_env()
+
+# NOVA_LOG_LEVEL overrides the adapter's log level at runtime (e.g. DEBUG or 10)
+_log_level = os.getenv('NOVA_LOG_LEVEL')
+if _log_level:
+    logger.setLevel(int(_log_level) if _log_level.isdigit() else _log_level.upper())
+
+# Service name fragments in priority order, with the details shown for each;
+# the first fragment in this order that occurs anywhere in the name wins
+_DETAILS_MAP = {
+    "OpenSearch": "Domain storage and instance hours",
+    "Skill Builder": "Learning subscription",
+    "Cost Explorer": "Usage and API requests",
+    "Bedrock": "Model inference, tokens, API usage",
+    "Claude": "Token usage and API calls",
+    "Lambda": "Compute time and requests",
+    "S3": "Storage and requests",
+    "EC2": "Compute instances and related services",
+    "DynamoDB": "NoSQL database usage",
+    "CloudWatch": "Monitoring and observability",
+    "Tax": "Applicable taxes on services",
+    "Simple": "Service usage",
+    "Data Transfer": "Data transfer and bandwidth",
+}
+_DETAILS_MATCHER = KeywordMatcher(_DETAILS_MAP)
+
+# Metrics requested on the service cost query; CE charges per request, not per metric,
+# so the unblended and amortized figures come along for free
+_COST_METRICS = ['BlendedCost', 'UnblendedCost', 'AmortizedCost']
+
+
+# Cost Explorer error codes worth retrying, and those that mean missing permissions
+_THROTTLING_CODES = frozenset({'ThrottlingException', 'LimitExceededException', 'RequestLimitExceeded'})
+_ACCESS_DENIED_CODES = frozenset({'AccessDeniedException', 'UnauthorizedOperation', 'AccessDenied'})
+
+
+class CostExplorerError(Exception):
+    """Base class for Cost Explorer failures raised by the AWS adapter"""
+
+
+class RetryableCEError(CostExplorerError):
+    """Cost Explorer throttled the request; it can be retried after a backoff"""
+
+
+class AccessDeniedError(CostExplorerError):
+    """The credentials lack permission for the Cost Explorer request"""
+
+
+# Month abbreviations for report labels (fixed English, unlike the locale-dependent %b)
+_MONTHS = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+
+def _blended_cost(metrics: Dict[str, Any]) -> float:
+    """Parse the BlendedCost amount from a Cost Explorer Total or Metrics mapping"""
+    return float(metrics['BlendedCost']['Amount'])
+
+
+# orjson is optional; the response cache falls back to the standard json module
+try:
+    import orjson
+    
+    def _json_dumps(obj: Any) -> bytes:
+        """Serialize obj to JSON bytes with sorted keys"""
+        return orjson.dumps(obj, default=str, option=orjson.OPT_SORT_KEYS)
+    
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        """Serialize obj to JSON bytes with sorted keys"""
+        return json.dumps(obj, sort_keys=True, default=str).encode()
+    
+    _json_loads = json.loads
+
+# pandas is optional; daily aggregation falls back to plain Python without it
+try:
+    import pandas as pd
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
 
 class AWSCostAdapter(CostDataPort):
     """Adapter for AWS Cost Explorer to implement the CostDataPort"""
     
-    def __init__(self):
-        """Initialize the AWS adapter with boto3 client"""
+    # On-disk cache for Cost Explorer responses (every CE request is billed),
+    # with one subdirectory per profile, region and set of credentials
+    _CE_CACHE_DIR = Path.home() / '.cache' / 'nova_cost' / 'ce'
+    
+    # Windows that include today can still change, so they expire after an hour
+    _CE_CURRENT_TTL = 3600
+    
+    # CE still revises recent days and posts credits and refunds late, so even
+    # windows that ended before today are refreshed daily
+    _CE_COMPLETE_TTL = 86400
+    
+    # Responses (and per-request locks) kept in memory per adapter
+    _CE_MEMORY_ENTRIES = 256
+    
+    # Resource scans used for service details are reused for five minutes
+    _SCAN_TTL = 300
+    
+    # Services that are taxes and can never be cancelled
+    _TAX_NAMES = frozenset({"Tax", "AWS Tax", "Tax on AWS services"})
+    
+    # Known cancelled services, by name fragment and by exact name
+    _CANCELLED_HINTS = ("Claude", "Bedrock")
+    _CANCELLED_SERVICES = frozenset({"Amazon Simple Storage Service"})
+    
+    # Date recorded for the known cancelled services (seen in screenshots)
+    _CANCELLED_ON = "2025-04-21"
+    
+    # Report status for each AWSServiceClassifier classification; anything else is Active
+    _CLASSIFICATION_STATUS = {
+        'Pay-As-You-Go': 'Pay-As-You-Go',
+        'Required': 'Required'
+    }
+    
+    # Services that are always billed pay-as-you-go
+    _FORCED_PAY_AS_YOU_GO = frozenset({
+        'Amazon Rekognition', 'Amazon Transcribe', 'Amazon Polly',
+        'Amazon Textract', 'Amazon Comprehend', 'Amazon Translate'
+    })
+    
+    # Service relationships for consolidation, shared read-only across instances
+    _service_consolidation = MappingProxyType({})
+    
+    # Service categorization
+    pay_as_you_go_services = (
+        'Amazon Rekognition',
+        'Amazon Transcribe',
+        'Amazon Polly',
+        'Amazon Textract',
+        'Amazon Comprehend',
+        'Amazon Translate',
+        'Amazon Lex',
+        'AWS CodeWhisperer',
+        'Amazon Kendra'
+    )
+    
+    required_services = (
+        'Tax',
+        'AWS Tax',
+        'Tax on AWS services'
+    )
+    
+    def __init__(self, include_billing_console: Optional[bool] = None):
+        """
+        Initialize the AWS adapter; AWS clients and helpers are created on first use
+        
+        Args:
+            include_billing_console: Also add services found in the AWS Billing console;
+                defaults to whether NOVA_DEEP_SCAN=1 is set
+        """
         self.session = boto3.Session()
-        self.ce_client = self.session.client('ce')
+        if include_billing_console is None:
+            include_billing_console = os.getenv('NOVA_DEEP_SCAN') == '1'
+        self.include_billing_console = include_billing_console
+        
+        # In-memory layer of the Cost Explorer response cache: key -> (expires_at, response)
+        self._ce_cache = {}
+        self._ce_cache_lock = threading.Lock()
+        self._ce_key_locks = {}
         
-        # Service paths with 2025 AWS Console URLs
+        # Recent resource scans: (service, resource_type) -> (expires_at, resources)
+        self._scan_cache = {}
+        
+        # Service paths with 2025 AWS Console URLs; filled in per instance as services are discovered
         self._service_paths = {}
         
-        # Service relationships for consolidation
-        self._service_consolidation = {}
+        # Console URLs by service name (a method lru_cache would keep every adapter alive)
+        self._console_urls = {}
         
         # Service classifier for dynamic categorization
         self.service_classifier = AWSServiceClassifier()
+    
+    @functools.cached_property
+    def _executor(self) -> ThreadPoolExecutor:
+        """Pool for independent Cost Explorer queries (boto3 clients are thread-safe); see close()"""
+        return ThreadPoolExecutor(max_workers=8, thread_name_prefix='nova-cost-ce')
+    
+    def close(self) -> None:
+        """Shut down the query pool's threads; the adapter starts a new pool if used again"""
+        executor = self.__dict__.pop('_executor', None)
+        if executor is not None:
+            executor.shutdown(wait=True)
+    
+    def __enter__(self) -> 'AWSCostAdapter':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    @functools.cached_property
+    def ce_client(self):
+        """Cost Explorer client; adaptive retries absorb throttling when queries run concurrently"""
+        return use_fast_json_parser(self.session.client('ce', config=Config(
+            max_pool_connections=16,
+            retries={'max_attempts': 5, 'mode': 'adaptive'},
+            connect_timeout=5,
+            read_timeout=30
+        )))
+    
+    @functools.cached_property
+    def aws_resource_scanner(self) -> AWSResourceScanner:
+        """AWS Resource Scanner, created on first use since it enumerates regions"""
+        return AWSResourceScanner()
+    
+    @functools.cached_property
+    def aws_billing_detective(self) -> AWSBillingDetective:
+        """AWS Billing Detective, created on first use"""
+        return AWSBillingDetective()
+    
+    @functools.cached_property
+    def _ce_cache_dir(self) -> Path:
+        """Disk cache directory for this adapter's profile, region and credentials"""
+        return self._CE_CACHE_DIR / credential_scope(self.session)
+    
+    def _ce_call(self, op_name: str, **params) -> Dict[str, Any]:
+        """
+        Call a Cost Explorer operation through the memory and disk response cache
         
-        # Initialize AWS Resource Scanner
-        self.aws_resource_scanner = AWSResourceScanner()
-        
-        # Initialize AWS Billing Detective
-        self.aws_billing_detective = AWSBillingDetective()
-        
-        # Service categorization
-        self.pay_as_you_go_services = [
-            'Amazon Rekognition', 
-            'Amazon Transcribe',
-            'Amazon Polly',
-            'Amazon Textract',
-            'Amazon Comprehend',
-            'Amazon Translate',
-            'Amazon Lex',
-            'AWS CodeWhisperer',
-            'Amazon Kendra'
-        ]
+        Windows that end before today expire after _CE_COMPLETE_TTL seconds;
+        windows that include today expire after _CE_CURRENT_TTL seconds.
         
-        self.required_services = [
-            'Tax', 
-            'AWS Tax', 
-            'Tax on AWS services'
-        ]
+        Args:
+            op_name: Name of the ce_client operation, e.g. 'get_cost_and_usage'
+            **params: Keyword arguments for the operation
+            
+        Returns:
+            The operation response
+        """
+        key = hashlib.blake2b(_json_dumps([op_name, params])).hexdigest()
+        now = time.time()
+        
+        with self._ce_cache_lock:
+            entry = self._ce_cache.get(key)
+            key_lock = self._ce_key_locks.setdefault(key, threading.Lock())
+            if len(self._ce_key_locks) > self._CE_MEMORY_ENTRIES:
+                # Forget the locks nobody is holding; at worst a request is fetched twice
+                for idle in [k for k, lock in self._ce_key_locks.items() if k != key and not lock.locked()]:
+                    del self._ce_key_locks[idle]
+        if entry is not None and entry[0] > now:
+            return entry[1]
+        
+        # Concurrent callers of the same request wait for a single fetch
+        with key_lock:
+            with self._ce_cache_lock:
+                entry = self._ce_cache.get(key)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+            return self._ce_load_or_request(key, now, op_name, params)
+    
+    def _ce_remember(self, key: str, entry: Tuple[float, Dict[str, Any]]) -> None:
+        """Keep a response in memory, dropping the oldest once _CE_MEMORY_ENTRIES is reached"""
+        with self._ce_cache_lock:
+            self._ce_cache.pop(key, None)
+            self._ce_cache[key] = entry
+            while len(self._ce_cache) > self._CE_MEMORY_ENTRIES:
+                del self._ce_cache[next(iter(self._ce_cache))]
+    
+    def _ce_load_or_request(self, key: str, now: float, op_name: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Serve a Cost Explorer response from the disk cache, or request and cache it"""
+        cache_dir = self._ce_cache_dir
+        cache_file = cache_dir / f"{key}.json"
+        try:
+            with open(cache_file, 'rb') as f:
+                entry = tuple(_json_loads(f.read()))
+            if entry[0] is not None and entry[0] > now:
+                self._ce_remember(key, entry)
+                return entry[1]
+        except (OSError, ValueError, TypeError):
+            pass
+        
+        response = self._ce_request(op_name, **params)
+        if not isinstance(response, dict):
+            return response
+        
+        end_date = params.get('TimePeriod', {}).get('End', '')
+        is_complete = end_date < datetime.date.today().isoformat()
+        expires_at = now + (self._CE_COMPLETE_TTL if is_complete else self._CE_CURRENT_TTL)
+        response = {k: v for k, v in response.items() if k != 'ResponseMetadata'}
+        entry = (expires_at, response)
+        
+        self._ce_remember(key, entry)
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_file, 'wb') as f:
+                f.write(_json_dumps(entry))
+            os.replace(tmp_file, cache_file)
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Could not write Cost Explorer cache entry: {e}")
+        
+        return response
+    
+    def _ce_request(self, op_name: str, **params) -> Dict[str, Any]:
+        """
+        Send a Cost Explorer request, translating client errors into typed exceptions
+        
+        Throttling is retried by the client's adaptive retry mode; RetryableCEError
+        is raised only once those attempts are used up.
+        
+        Args:
+            op_name: Name of the ce_client operation
+            **params: Keyword arguments for the operation
+            
+        Returns:
+            The operation response
+        """
+        try:
+            return getattr(self.ce_client, op_name)(**params)
+        except ClientError as e:
+            code = e.response.get('Error', {}).get('Code', '')
+            if code in _THROTTLING_CODES:
+                raise RetryableCEError(f"Cost Explorer throttled {op_name}: {code}") from e
+            if code in _ACCESS_DENIED_CODES:
+                raise AccessDeniedError(f"Access denied for Cost Explorer {op_name}: {code}") from e
+            raise
+    
+    def _ce_paginate(self, op_name: str, **params):
+        """
+        Yield every page of a Cost Explorer operation, following NextPageToken
+        
+        boto3 has no paginator for Cost Explorer, so the token is threaded by hand.
+        Each page is fetched through the response cache.
+        
+        Args:
+            op_name: Name of the ce_client operation
+            **params: Keyword arguments for the operation
+        """
+        while True:
+            response = self._ce_call(op_name, **params)
+            yield response
+            token = response.get('NextPageToken')
+            if not token:
+                break
+            params['NextPageToken'] = token
+    
+    def _get_cost_and_usage(self, **params) -> Dict[str, Any]:
+        """
+        Get a complete get_cost_and_usage response across all pages
+        
+        Groups for a time period may be split across pages, so they are merged
+        back under a single ResultsByTime entry per period.
+        
+        Args:
+            **params: Keyword arguments for get_cost_and_usage
+            
+        Returns:
+            Response dictionary with the merged ResultsByTime
+        """
+        results_by_start = {}
+        for page in self._ce_paginate('get_cost_and_usage', **params):
+            for result in page.get('ResultsByTime', []):
+                start = result['TimePeriod']['Start']
+                if start in results_by_start:
+                    results_by_start[start].setdefault('Groups', []).extend(result.get('Groups', []))
+                else:
+                    results_by_start[start] = dict(result, Groups=list(result.get('Groups', [])))
+        return {'ResultsByTime': list(results_by_start.values())}
+    
+    def _scan_for_resources(self, service: str, resource_type: str) -> List[Dict[str, Any]]:
+        """
+        Scan for resources through a short-lived cache so repeated reports
+        in the same process don't repeat the describe/list API calls
+        
+        Args:
+            service: AWS service to scan, e.g. 'lambda'
+            resource_type: Resource type to scan, e.g. 'functions'
+            
+        Returns:
+            List of resources as returned by AWSResourceScanner.scan_for_resources
+        """
+        key = (service, resource_type)
+        now = time.time()
+        entry = self._scan_cache.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+        
+        resources = self.aws_resource_scanner.scan_for_resources(service, resource_type)
+        self._scan_cache[key] = (now + self._SCAN_TTL, resources)
+        return resources
+    
+    def _get_console_url(self, service_name: str) -> str:
+        """
+        Get the AWS Console URL for a service, memoized per adapter since service names recur
+        
+        Args:
+            service_name: Name of the AWS service
+            
+        Returns:
+            URL to the AWS Console for the service
+        """
+        url = self._console_urls.get(service_name)
+        if url is None:
+            url = self._console_urls[service_name] = self.aws_resource_scanner.get_console_url(service_name)
+        return url
     
     def get_date_range(self, days_back: int = 30) -> Tuple[str, str]:
         """
@@ -95,8 +458,9 @@ class AWSCostAdapter(CostDataPort):
         start_date, end_date = self.get_date_range(days_back)
         
         try:
-            # First get total costs by day
-            response_total = self.ce_client.get_cost_and_usage(
+            # Get total costs by day and costs broken down by service for each day concurrently
+            total_future = self._executor.submit(
+                self._get_cost_and_usage,
                 TimePeriod={
                     'Start': start_date,
                     'End': end_date
@@ -104,9 +468,8 @@ class AWSCostAdapter(CostDataPort):
                 Granularity='DAILY',
                 Metrics=['BlendedCost']
             )
-            
-            # Then get costs broken down by service for each day
-            response_by_service = self.ce_client.get_cost_and_usage(
+            by_service_future = self._executor.submit(
+                self._get_cost_and_usage,
                 TimePeriod={
                     'Start': start_date,
                     'End': end_date
@@ -118,47 +481,164 @@ class AWSCostAdapter(CostDataPort):
                     'Key': 'SERVICE'
                 }]
             )
+            response_total = total_future.result()
+            response_by_service = by_service_future.result()
             
             # Create a mapping of date to service breakdown
-            service_breakdown_by_date = {}
-            
-            for result in response_by_service['ResultsByTime']:
-                date = result['TimePeriod']['Start']
-                if date not in service_breakdown_by_date:
-                    service_breakdown_by_date[date] = []
-                
-                # Get top services for this day
-                services = []
-                for group in result.get('Groups', []):
-                    service_name = group['Keys'][0]
-                    service_cost = float(group['Metrics']['BlendedCost']['Amount'])
-                    if service_cost > 0:  # Only include services with non-trivial costs
-                        services.append(f"{service_name} (${service_cost:.2f})")
-                
-                # Sort by cost (implicitly, since the API returns them sorted)
-                service_breakdown = ", ".join(services[:3])  # Top 3 services
-                if len(services) > 3:
-                    service_breakdown += f", +{len(services)-3} more"
-                
-                if not service_breakdown:
-                    service_breakdown = "No significant costs"
-                
-                service_breakdown_by_date[date] = service_breakdown
+            service_breakdown_by_date = self._get_daily_service_breakdown(
+                response_by_service['ResultsByTime']
+            )
             
             # Combine with total daily costs
             daily_costs = []
             for result in response_total['ResultsByTime']:
                 date = result['TimePeriod']['Start']
-                cost = float(result['Total']['BlendedCost']['Amount'])
+                cost = _blended_cost(result['Total'])
                 service_detail = service_breakdown_by_date.get(date, "AWS Services")
                 daily_costs.append((date, cost, service_detail))
             
             return daily_costs
             
-        except Exception as e:
-            print(f"Warning: Unable to access AWS Cost Explorer API: {str(e)}")
+        except CostExplorerError as e:
+            logger.error(f"Unable to access AWS Cost Explorer API: {str(e)}")
             # Return empty list instead of sample data
             return []
+        except Exception:
+            logger.exception("Unexpected error getting daily costs")
+            return []
+    
+    @staticmethod
+    def _format_service_breakdown(top_services: List[str], service_count: int) -> str:
+        """Join the top services of a day into a breakdown string"""
+        service_breakdown = ", ".join(top_services)
+        if service_count > len(top_services):
+            service_breakdown += f", +{service_count - len(top_services)} more"
+        return service_breakdown or "No significant costs"
+    
+    def _get_daily_service_breakdown(self, results_by_time: List[Dict[str, Any]], top_n: int = 3) -> Dict[str, str]:
+        """
+        Summarize the top services by cost for each day of a SERVICE-grouped response
+        
+        Args:
+            results_by_time: ResultsByTime of a DAILY get_cost_and_usage response
+            top_n: Number of services to name per day
+            
+        Returns:
+            Dictionary mapping each date to its service breakdown string
+        """
+        dates = [result['TimePeriod']['Start'] for result in results_by_time]
+        
+        if PANDAS_AVAILABLE:
+            df = pd.json_normalize(results_by_time, record_path='Groups', meta=[['TimePeriod', 'Start']])
+            if df.empty:
+                return {date: self._format_service_breakdown([], 0) for date in dates}
+            
+            df['cost'] = df['Metrics.BlendedCost.Amount'].astype(float)
+            # Only include services with non-trivial costs
+            df = df[df['cost'] > 0]
+            df = df.assign(date=df['TimePeriod.Start'], service=df['Keys'].str[0])
+            df = df.sort_values(['date', 'cost'], ascending=[True, False])
+            
+            by_date = df.groupby('date', sort=False)
+            service_counts = by_date.size()
+            top = by_date.head(top_n)
+            labels = top['service'] + ' ($' + top['cost'].map('{:.2f}'.format) + ')'
+            top_labels = labels.groupby(top['date'], sort=False).agg(list)
+            
+            return {
+                date: self._format_service_breakdown(top_labels.get(date, []), int(service_counts.get(date, 0)))
+                for date in dates
+            }
+        
+        service_breakdown_by_date = {}
+        for date, result in zip(dates, results_by_time):
+            services = []
+            for group in result.get('Groups', []):
+                service_cost = _blended_cost(group['Metrics'])
+                if service_cost > 0:  # Only include services with non-trivial costs
+                    services.append((service_cost, group['Keys'][0]))
+            
+            services.sort(key=itemgetter(0), reverse=True)
+            top_services = [f"{name} (${cost:.2f})" for cost, name in services[:top_n]]
+            service_breakdown_by_date[date] = self._format_service_breakdown(top_services, len(services))
+        
+        return service_breakdown_by_date
+    
+    @staticmethod
+    def _clean_service_name(service_name: str) -> str:
+        """Turn a Cost Explorer service name into its display name"""
+        if service_name.startswith("Amazon ") or service_name.startswith("AWS "):
+            # Already has a good name
+            return service_name
+        if "Skill Builder" in service_name:
+            return "AWS Skill Builder"
+        # Add AWS prefix if missing
+        return f"AWS {service_name}"
+    
+    def _build_service(self, service_name: str, cost: float, details: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Build the report entry for a service
+        
+        Args:
+            service_name: Name of the service as reported by Cost Explorer
+            cost: Cost of the service in USD
+            details: Details to show; derived from the service name if omitted
+            
+        Returns:
+            Service dictionary with name, cost, details, status, cancelled_on and console_url
+        """
+        # Process service name for better display
+        clean_service_name = self._clean_service_name(service_name)
+        
+        # Determine if service is cancellable (Tax, etc. cannot be cancelled)
+        status, cancelled_on = self._classify(service_name, clean_service_name)
+        
+        return {
+            "name": clean_service_name,
+            "cost": cost,
+            # Dynamically determine service details based on name
+            "details": details if details is not None else self._get_service_details(clean_service_name),
+            "status": status,
+            "cancelled_on": cancelled_on,
+            # Get console URL for verification
+            "console_url": self._get_console_url(clean_service_name)
+        }
+    
+    def _classify(self, service_name: str, display_name: Optional[str] = None) -> Tuple[str, Optional[str]]:
+        """
+        Determine the report status of a service
+        
+        Args:
+            service_name: Name of the service as reported by AWS
+            display_name: Cleaned-up display name, if different from service_name
+            
+        Returns:
+            Tuple of (status, cancelled_on)
+        """
+        # Force pay-as-you-go status for specific services regardless of other logic
+        if (display_name or service_name) in self._FORCED_PAY_AS_YOU_GO:
+            return "Pay-As-You-Go", None
+        
+        # Tax cannot be cancelled
+        if service_name in self._TAX_NAMES:
+            return "Required", None
+        
+        # Check if this is a known cancelled service
+        if service_name in self._CANCELLED_SERVICES or any(hint in service_name for hint in self._CANCELLED_HINTS):
+            return "Cancelled", self._CANCELLED_ON
+        
+        if service_name == "Amazon OpenSearch Service":
+            try:
+                domains = self.aws_resource_scanner.scan_for_opensearch_resources()
+            except Exception as e:
+                # Fallback: if resource scan fails, mark as Active and log warning
+                logger.warning(f"OpenSearch resource scan failed: {e}")
+                return "Active", None
+            return ("Active", None) if domains else ("Cancelled", self._CANCELLED_ON)
+        
+        # Dynamically classify the service
+        classification = self.service_classifier.get_service_classification(service_name)
+        return self._CLASSIFICATION_STATUS.get(classification, "Active"), None
     
     def get_service_costs(self, days_back: int = 30) -> List[Dict[str, Any]]:
         """
@@ -173,119 +653,42 @@ class AWSCostAdapter(CostDataPort):
         start_date, end_date = self.get_date_range(days_back)
         
         try:
-            # Initialize AWS Resource Scanner for getting console URLs
-            scanner = AWSResourceScanner()
-            
-            # First query: Get services grouped by SERVICE dimension
-            response_by_service = self.ce_client.get_cost_and_usage(
+            # Query services grouped by SERVICE and RECORD_TYPE in a single request;
+            # the record types catch internal services
+            response = self._get_cost_and_usage(
                 TimePeriod={
                     'Start': start_date,
                     'End': end_date
                 },
                 Granularity='MONTHLY',
-                Metrics=['BlendedCost'],
-                GroupBy=[{'Type': 'DIMENSION', 'Key': 'SERVICE'}]
+                Metrics=_COST_METRICS,
+                GroupBy=[
+                    {'Type': 'DIMENSION', 'Key': 'SERVICE'},
+                    {'Type': 'DIMENSION', 'Key': 'RECORD_TYPE'}
+                ]
             )
             
-            # Second query: Get services grouped by RECORD_TYPE to catch internal services
-            response_by_record = self.ce_client.get_cost_and_usage(
-                TimePeriod={
-                    'Start': start_date,
-                    'End': end_date
-                },
-                Granularity='MONTHLY',
-                Metrics=['BlendedCost'],
-                GroupBy=[{'Type': 'DIMENSION', 'Key': 'RECORD_TYPE'}]
-            )
+            # Aggregate the (service, record type) groups per service and per record type
+            cost_by_service = {}
+            cost_by_record = {}
+            for group in response['ResultsByTime'][0]['Groups']:
+                service_name, record_type = group['Keys']
+                cost = _blended_cost(group['Metrics'])
+                cost_by_service[service_name] = cost_by_service.get(service_name, 0.0) + cost
+                cost_by_record[record_type] = cost_by_record.get(record_type, 0.0) + cost
             
-            # Initialize services list
-            services = []
+            # Process service-grouped results, skipping very small costs
+            services = [
+                self._build_service(service_name, cost)
+                for service_name, cost in cost_by_service.items()
+                if cost > 0
+            ]
             
-            # Process service-grouped results
-            service_set = set()  # To track services we've already added
-            for group in response_by_service['ResultsByTime'][0]['Groups']:
-                service_name = group['Keys'][0]
-                cost = float(group['Metrics']['BlendedCost']['Amount'])
-                
-                # Skip very small costs
-                if cost <= 0:
-                    continue
-                
-                # Process service name for better display
-                clean_service_name = service_name
-                if service_name.startswith("Amazon ") or service_name.startswith("AWS "):
-                    # Already has a good name
-                    pass
-                elif "Skill Builder" in service_name:
-                    clean_service_name = "AWS Skill Builder"
-                else:
-                    # Add AWS prefix if missing
-                    clean_service_name = f"AWS {service_name}"
-                
-                # Add to service set to avoid duplicates
-                service_set.add(clean_service_name)
-                
-                # Dynamically determine service details based on name
-                details = self._get_service_details(clean_service_name)
-                
-                # Determine if service is cancellable (Tax, etc. cannot be cancelled)
-                status = "Active"
-                cancelled_on = None
-                
-                # Check if this is a known cancelled service (seen in screenshots)
-                if "Claude" in service_name or "Bedrock" in service_name or service_name == "Amazon Simple Storage Service":
-                    status = "Cancelled"
-                    cancelled_on = "2025-04-21"  # Use today's date
-                elif service_name == "Amazon OpenSearch Service":
-                    try:
-                        domains = self.aws_resource_scanner.scan_for_opensearch_resources()
-                        if not domains:
-                            status = "Cancelled"
-                            cancelled_on = "2025-04-21"  # Use today's date
-                        else:
-                            status = "Active"
-                            cancelled_on = None
-                    except Exception as e:
-                        # Fallback: if resource scan fails, mark as Active and log warning
-                        print(f"Warning: OpenSearch resource scan failed: {e}")
-                        status = "Active"
-                        cancelled_on = None
-                else:
-                    # Dynamically classify the service
-                    classification = self.service_classifier.get_service_classification(service_name)
-                    if classification == 'Pay-As-You-Go':
-                        status = "Pay-As-You-Go"
-                        cancelled_on = None
-                    elif classification == 'Required':
-                        status = "Required"
-                        cancelled_on = None
-                    else:
-                        status = "Active"
-                        cancelled_on = None
-                
-                # Force pay-as-you-go status for specific services regardless of other logic
-                if clean_service_name in ['Amazon Rekognition', 'Amazon Transcribe', 'Amazon Polly', 
-                                   'Amazon Textract', 'Amazon Comprehend', 'Amazon Translate']:
-                    status = 'Pay-As-You-Go'
-                    cancelled_on = None
-                
-                # Get console URL for verification
-                console_url = scanner.get_console_url(clean_service_name)
-                
-                services.append({
-                    "name": clean_service_name,
-                    "cost": cost,
-                    "details": details,
-                    "status": status,
-                    "cancelled_on": cancelled_on,
-                    "console_url": console_url
-                })
+            # To track services we've already added
+            service_set = {service["name"] for service in services}
             
             # Process record-type results to catch internal services (like Cost Explorer)
-            for group in response_by_record['ResultsByTime'][0]['Groups']:
-                record_type = group['Keys'][0]
-                cost = float(group['Metrics']['BlendedCost']['Amount'])
-                
+            for record_type, cost in cost_by_record.items():
                 # Skip very small costs
                 if cost <= 0:
                     continue
@@ -300,104 +703,150 @@ class AWSCostAdapter(CostDataPort):
                     
                     # Add to service set
                     service_set.add(service_name)
+                    services.append(self._build_service(service_name, cost, details="API requests and analysis"))
+            
+            # Billed services the grouped query missed, from the SERVICE dimension
+            try:
+                self._add_dimension_services(services, service_set, cost_by_service, start_date, end_date)
+            except CostExplorerError as e:
+                logger.warning(f"Could not fetch service dimension values: {str(e)}")
+            
+            # Services from the AWS Billing console are opt-in (NOVA_DEEP_SCAN=1): scraping
+            # the console is slow and Cost Explorer already covers most accounts
+            if self.include_billing_console:
+                self._add_billing_console_services(services)
+            
+            logger.info(f"Found {len(services)} services from Cost Explorer API")
+            # Debug output to see what data we have; skip the formatting when it won't be shown
+            if logger.isEnabledFor(logging.DEBUG):
+                for svc in services:
+                    logger.debug(f"Service: {svc['name']}, Cost: ${svc['cost']:.2f}, Status: {svc['status']}")
+            
+            # Enrich service data with Nova Act SDK URLs
+            self._enrich_service_data_with_nova_sdk(services)
+            
+            # Sort services by cost (descending)
+            services.sort(key=itemgetter("cost"), reverse=True)
+            
+            return services
+            
+        except CostExplorerError as e:
+            logger.error(f"Unable to access AWS Cost Explorer API: {str(e)}")
+            # Return empty list instead of sample data when API access fails
+            return []
+        except Exception:
+            logger.exception("Unexpected error getting service costs")
+            return []
+    
+    def _add_dimension_services(self, services: List[Dict[str, Any]], service_set: set,
+                                cost_by_service: Dict[str, float], start_date: str, end_date: str):
+        """
+        Add billed services that Cost Explorer lists for the period but the grouped query missed
+        
+        One GetDimensionValues request returns the canonical list of billed services,
+        replacing the Billing console scrape for the common case. Names without a
+        cost row are re-queried in a single filtered request, and only those with a
+        positive cost are added, so free-tier and credit-only services stay out.
+        
+        Args:
+            services: List of service dictionaries to extend in place
+            service_set: Display names already in services, updated in place
+            cost_by_service: Costs already found, keyed by Cost Explorer service name
+            start_date: Start of the period as an ISO date
+            end_date: End of the period as an ISO date
+        """
+        missing = []
+        for page in self._ce_paginate(
+            'get_dimension_values',
+            TimePeriod={'Start': start_date, 'End': end_date},
+            Dimension='SERVICE'
+        ):
+            for dimension_value in page.get('DimensionValues', []):
+                service_name = dimension_value['Value']
+                if service_name not in cost_by_service and self._clean_service_name(service_name) not in service_set:
+                    missing.append(service_name)
+        if not missing:
+            return
+        
+        response = self._get_cost_and_usage(
+            TimePeriod={'Start': start_date, 'End': end_date},
+            Granularity='MONTHLY',
+            Metrics=_COST_METRICS,
+            Filter={'Dimensions': {'Key': 'SERVICE', 'Values': missing}},
+            GroupBy=[{'Type': 'DIMENSION', 'Key': 'SERVICE'}]
+        )
+        missing_costs: Dict[str, float] = {}
+        for result in response['ResultsByTime']:
+            for group in result['Groups']:
+                service_name = group['Keys'][0]
+                missing_costs[service_name] = missing_costs.get(service_name, 0.0) + _blended_cost(group['Metrics'])
+        
+        for service_name, cost in missing_costs.items():
+            clean_service_name = self._clean_service_name(service_name)
+            if cost <= 0 or clean_service_name in service_set:
+                continue
+            service_set.add(clean_service_name)
+            services.append(self._build_service(service_name, cost))
+    
+    def _add_billing_console_services(self, services: List[Dict[str, Any]]):
+        """
+        Add services from the AWS Billing console that Cost Explorer did not report
+        
+        Uses the AWS Billing Detective, which fetches all services from the billing
+        console including Cost Explorer.
+        
+        Args:
+            services: List of service dictionaries to extend in place
+        """
+        try:
+            # Use the AWS Billing Detective to get all services from the billing console
+            logger.info("Fetching additional services from AWS Billing console...")
+            additional_services = self.aws_billing_detective.get_all_billing_services()
+            
+            # Track existing service names for deduplication
+            existing_service_names = {s['name'] for s in services}
+            
+            # Add any services found by the Billing Detective that aren't already in our list
+            for service_info in additional_services:
+                service_name = service_info.get('name')
+                if service_name and service_name not in existing_service_names:
+                    # Get cost from billing data
+                    cost = service_info.get('cost', 0.01)
                     
-                    # Get service details
-                    details = "API requests and analysis"
+                    # Get URL link from billing detective
+                    link = service_info.get('link', '')
                     
-                    # Determine if service is cancellable (Tax, etc. cannot be cancelled)
-                    status = "Active"
-                    cancelled_on = None
+                    # Get details using our existing method
+                    details = self._get_service_details(service_name)
                     
                     # Determine if service is cancellable (Tax, etc. cannot be cancelled)
-                    if clean_service_name in ["Tax", "AWS Tax", "Tax on AWS services"]:
-                        status = "Required"  # Mark tax as required/non-cancellable
+                    status, cancelled_on = self._classify(service_name)
                     
                     # Get console URL for verification
-                    console_url = scanner.get_console_url(service_name)
+                    console_url = self._get_console_url(service_name)
                     
-                    services.append({
+                    # Add to services list
+                    new_service = {
                         "name": service_name,
                         "cost": cost,
                         "details": details,
                         "status": status,
                         "cancelled_on": cancelled_on,
                         "console_url": console_url
-                    })
-            
-            # Get additional services from the AWS Billing Detective
-            # This will fetch all services from the billing console including Cost Explorer
-            try:
-                # Use the AWS Billing Detective to get all services from the billing console
-                print("Fetching additional services from AWS Billing console...")
-                additional_services = self.aws_billing_detective.get_all_billing_services()
-                
-                # Track existing service names for deduplication
-                existing_service_names = {s['name'] for s in services}
-                
-                # Add any services found by the Billing Detective that aren't already in our list
-                for service_info in additional_services:
-                    service_name = service_info.get('name')
-                    if service_name and service_name not in existing_service_names:
-                        # Get cost from billing data
-                        cost = service_info.get('cost', 0.01)
-                        
-                        # Get URL link from billing detective
-                        link = service_info.get('link', '')
-                        
-                        # Get details using our existing method
-                        details = self._get_service_details(service_name)
-                        
-                        # Determine if service is cancellable (Tax, etc. cannot be cancelled)
-                        status = "Active"
-                        cancelled_on = None
-                        
-                        # Determine if service is cancellable (Tax, etc. cannot be cancelled)
-                        if clean_service_name in ["Tax", "AWS Tax", "Tax on AWS services"]:
-                            status = "Required"  # Mark tax as required/non-cancellable
-                        
-                        # Get console URL for verification
-                        console_url = scanner.get_console_url(service_name)
-                        
-                        # Add to services list
-                        new_service = {
-                            "name": service_name,
-                            "cost": cost,
-                            "details": details,
-                            "status": status,
-                            "cancelled_on": cancelled_on,
-                            "console_url": console_url
-                        }
-                        
-                        # Add the service to our list
-                        services.append(new_service)
-                        print(f"Added missing service from Billing console: {service_name}, Cost: ${cost:.2f}")
-                        
-                        # Update the service paths dictionary if we have a link
-                        if link and service_name not in self._service_paths:
-                            self._service_paths[service_name] = link
-                
-                print(f"===== DEBUG: Added {len(additional_services)} additional services from billing console =====")
-            except Exception as e:
-                print(f"Warning: Could not fetch additional services: {str(e)}")
-            
-            # Debug output to see what data we have
-            print(f"===== DEBUG: Found {len(services)} services from Cost Explorer API =====")
-            for svc in services:
-                print(f"Service: {svc['name']}, Cost: ${svc['cost']:.2f}, Status: {svc['status']}")
-            print("=====================================")
-            
-            # Enrich service data with Nova Act SDK URLs
-            self._enrich_service_data_with_nova_sdk(services)
-            
-            # Sort services by cost (descending)
-            services.sort(key=lambda x: x["cost"], reverse=True)
-            
-            return services
+                    }
+                    
+                    # Add the service to our list
+                    services.append(new_service)
+                    existing_service_names.add(service_name)
+                    logger.debug(f"Added missing service from Billing console: {service_name}, Cost: ${cost:.2f}")
+                    
+                    # Update the service paths dictionary if we have a link
+                    if link and service_name not in self._service_paths:
+                        self._service_paths[service_name] = link
             
+            logger.debug(f"Checked {len(additional_services)} additional services from billing console")
         except Exception as e:
-            print(f"Warning: Unable to access AWS Cost Explorer API: {str(e)}")
-            # Return empty list instead of sample data when API access fails
-            return []
+            logger.warning(f"Could not fetch additional services: {str(e)}")
     
     def _enrich_service_data_with_nova_sdk(self, services: List[Dict[str, Any]]):
         """
@@ -432,12 +881,12 @@ class AWSCostAdapter(CostDataPort):
         """
         return self._service_paths
     
-    def get_service_relationships(self) -> Dict[str, str]:
+    def get_service_relationships(self) -> Mapping[str, str]:
         """
         Get service relationships for consolidation
         
         Returns:
-            Dictionary mapping services to their parent services
+            Read-only mapping of services to their parent services
         """
         return self._service_consolidation
     
@@ -448,36 +897,69 @@ class AWSCostAdapter(CostDataPort):
         Returns:
             Nested dictionary of service resources with dynamic discovery
         """
-        # Create a copy of the static service resources
-        dynamic_resources = {}
-        
         try:
-            # For OpenSearch, dynamically find actual resources
-            opensearch_actions = self.aws_resource_scanner.get_service_specific_cancellation_urls("Amazon OpenSearch Service")
-            if opensearch_actions:
-                dynamic_resources["Amazon OpenSearch Service"] = {
-                    "resources": opensearch_actions
-                }
-            
-            # For Bedrock, dynamically find actual resources
-            bedrock_actions = self.aws_resource_scanner.get_service_specific_cancellation_urls("Amazon Bedrock")
-            if bedrock_actions:
-                dynamic_resources["Amazon Bedrock"] = {
-                    "resources": bedrock_actions
-                }
-            
-            # Use AWS Billing Detective to solve the mystery of invisible resources
-            invisible_resources = self.aws_billing_detective.detect_invisible_resources()
-            if invisible_resources:
-                dynamic_resources["Invisible Resources"] = {
-                    "resources": invisible_resources
-                }
+            scanner = self.aws_resource_scanner
+            detective = self.aws_billing_detective
         except Exception as e:
-            print(f"Warning: Error scanning for resources: {str(e)}")
-            print("Falling back to static resource definitions")
+            logger.warning(f"Error scanning for resources: {str(e)}")
+            return {}
+        
+        # The scans are independent network calls, so run them concurrently:
+        # OpenSearch and Bedrock resources are found dynamically, and the AWS Billing
+        # Detective solves the mystery of invisible resources. They get their own pool
+        # so they never queue behind (or inside) the Cost Explorer query pool.
+        dynamic_resources = {}
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = {
+                "Amazon OpenSearch Service": executor.submit(
+                    scanner.get_service_specific_cancellation_urls, "Amazon OpenSearch Service"),
+                "Amazon Bedrock": executor.submit(
+                    scanner.get_service_specific_cancellation_urls, "Amazon Bedrock"),
+                "Invisible Resources": executor.submit(detective.detect_invisible_resources)
+            }
+            
+            for name, future in futures.items():
+                try:
+                    resources = future.result()
+                except Exception as e:
+                    logger.warning(f"Error scanning for {name} resources: {str(e)}")
+                    continue
+                if resources:
+                    dynamic_resources[name] = {"resources": resources}
         
         return dynamic_resources
     
+    def _get_monthly_costs(self, months_back: int = 6) -> List[Tuple[str, float]]:
+        """
+        Get total cost per calendar month, ending with the current month
+        
+        The current-month and historical figures share this single query, so
+        with the response cache a report costs one Cost Explorer request for both.
+        
+        Args:
+            months_back: Number of months to include, counting the current month
+            
+        Returns:
+            List of (month start date, cost) tuples in chronological order
+        """
+        today = datetime.date.today()
+        month_index = today.year * 12 + today.month - months_back
+        start_date = datetime.date(month_index // 12, month_index % 12 + 1, 1)
+        
+        response = self._get_cost_and_usage(
+            TimePeriod={
+                'Start': start_date.strftime('%Y-%m-%d'),
+                'End': today.strftime('%Y-%m-%d')
+            },
+            Granularity='MONTHLY',
+            Metrics=['BlendedCost']
+        )
+        
+        return [
+            (month_data['TimePeriod']['Start'], _blended_cost(month_data['Total']))
+            for month_data in response.get('ResultsByTime', [])
+        ]
+    
     def get_current_month_cost(self) -> float:
         """
         Get total cost for the current month
@@ -485,38 +967,23 @@ class AWSCostAdapter(CostDataPort):
         Returns:
             Total cost as float
         """
-        # Use actual cost data
-        ce = self.ce_client
-        
-        # Get date range for the current month
-        now = datetime.datetime.now()
-        start_date = now.replace(day=1).strftime('%Y-%m-%d')
-        end_date = now.strftime('%Y-%m-%d')
+        current_month = datetime.date.today().replace(day=1).strftime('%Y-%m-%d')
         
         try:
-            response = ce.get_cost_and_usage(
-                TimePeriod={
-                    'Start': start_date,
-                    'End': end_date
-                },
-                Granularity='MONTHLY',
-                Metrics=['BlendedCost']
-            )
+            monthly_costs = self._get_monthly_costs()
             
-            # Get total cost
-            total_cost = 0.0
-            
-            # Process results
-            for day_data in response.get('ResultsByTime', []):
-                amount = float(day_data['Total']['BlendedCost']['Amount'])
-                total_cost += amount
-            
-            return total_cost
+            # The last bucket is the current month unless the month has just begun
+            if monthly_costs and monthly_costs[-1][0] == current_month:
+                return monthly_costs[-1][1]
+            return 0.0
             
-        except Exception as e:
-            print(f"Error getting current month cost: {e}")
+        except CostExplorerError as e:
+            logger.error(f"Error getting current month cost: {e}")
             # Return 0 as fallback instead of fake data
             return 0.0
+        except Exception:
+            logger.exception("Unexpected error getting current month cost")
+            return 0.0
     
     def get_historical_costs(self) -> List[Tuple[str, float]]:
         """
@@ -525,45 +992,27 @@ class AWSCostAdapter(CostDataPort):
         Returns:
             List of (month, cost) tuples
         """
-        # Use actual cost data
-        ce = self.ce_client
-        
-        # Get date range for the past 6 months
-        now = datetime.datetime.now()
-        end_date = now.strftime('%Y-%m-%d')
-        
-        # Start date is 6 months ago
-        start_date = (now - datetime.timedelta(days=180)).strftime('%Y-%m-%d')
-        
         try:
-            response = ce.get_cost_and_usage(
-                TimePeriod={
-                    'Start': start_date,
-                    'End': end_date
-                },
-                Granularity='MONTHLY',
-                Metrics=['BlendedCost']
-            )
-            
             # Get historical costs
             historical_costs = []
             
             # Process results
-            for day_data in response.get('ResultsByTime', []):
-                month = day_data['TimePeriod']['Start']
+            for month, amount in self._get_monthly_costs(6):
                 # Convert YYYY-MM-DD to Month YYYY
-                month_date = datetime.datetime.strptime(month, '%Y-%m-%d')
-                month_label = month_date.strftime('%b %Y')
+                month_date = datetime.date.fromisoformat(month)
+                month_label = f"{_MONTHS[month_date.month - 1]} {month_date.year}"
                 
-                amount = float(day_data['Total']['BlendedCost']['Amount'])
                 historical_costs.append((month_label, amount))
             
             return historical_costs
             
-        except Exception as e:
-            print(f"Error getting historical costs: {e}")
+        except CostExplorerError as e:
+            logger.error(f"Error getting historical costs: {e}")
             # Return empty list instead of sample data
             return []
+        except Exception:
+            logger.exception("Unexpected error getting historical costs")
+            return []
     
     def get_report_data(self) -> Dict[str, Any]:
         """
@@ -573,11 +1022,18 @@ class AWSCostAdapter(CostDataPort):
             Dictionary with report data
         """
         start_date, end_date = self.get_date_range()
-        current_month_cost = self.get_current_month_cost()
-        service_costs = self.get_service_costs()
         
-        # Get the dynamically discovered service resources with direct links
-        dynamic_resources = self.get_service_resources()
+        # The three stages are independent network-bound fetches, so overlap them.
+        # A dedicated pool keeps them from waiting on the shared query pool they feed.
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            current_month_future = executor.submit(self.get_current_month_cost)
+            service_costs_future = executor.submit(self.get_service_costs)
+            # Get the dynamically discovered service resources with direct links
+            resources_future = executor.submit(self.get_service_resources)
+            
+            current_month_cost = current_month_future.result()
+            service_costs = service_costs_future.result()
+            dynamic_resources = resources_future.result()
         
         report_data = {
             'current_month_cost': current_month_cost,
@@ -600,67 +1056,37 @@ class AWSCostAdapter(CostDataPort):
             String with service details
         """
         # Extract information from service name to provide relevant details
-        if "OpenSearch" in service_name:
+        token = _DETAILS_MATCHER.first(service_name)
+        if token is None:
+            # Default for unknown services
+            return "Usage charges"
+        
+        if token == "OpenSearch":
             # Try to fetch actual domain details from AWS
             try:
-                domains = self.aws_resource_scanner.scan_for_resources('opensearch', 'domains')
+                domains = self._scan_for_resources('opensearch', 'domains')
                 if domains and len(domains) > 0:
                     domain_name = domains[0].get('DomainName', 'aws-logs-domain')
                     return f"Domain: {domain_name}"
             except:
                 pass
-            return "Domain storage and instance hours"
-        
-        elif "Skill Builder" in service_name:
-            return "Learning subscription"
-        
-        elif "Cost Explorer" in service_name:
-            return "Usage and API requests"
-        
-        elif "Bedrock" in service_name:
-            return "Model inference, tokens, API usage"
         
-        elif "Claude" in service_name:
-            return "Token usage and API calls"
-        
-        elif "Lambda" in service_name:
+        elif token == "Lambda":
             # Try to fetch actual function count
             try:
-                functions = self.aws_resource_scanner.scan_for_resources('lambda', 'functions')
+                functions = self._scan_for_resources('lambda', 'functions')
                 if functions:
                     return f"Functions: {len(functions)} active"
             except:
                 pass
-            return "Compute time and requests"
-        
-        elif "S3" in service_name:
-            return "Storage and requests"
-        
-        elif "EC2" in service_name:
-            return "Compute instances and related services"
         
-        elif "DynamoDB" in service_name:
-            return "NoSQL database usage"
-        
-        elif "CloudWatch" in service_name:
-            return "Monitoring and observability"
-            
-        elif "Tax" in service_name:
-            return "Applicable taxes on services"
-            
-        elif "Simple" in service_name:
+        elif token == "Simple":
             if "Storage" in service_name:
-                return "Storage usage" 
+                return "Storage usage"
             elif "Notification" in service_name:
                 return "Notification delivery"
-            else:
-                return "Service usage"
-                
-        elif "Data Transfer" in service_name:
-            return "Data transfer and bandwidth"
-            
-        # Default for unknown services    
-        return "Usage charges"
+        
+        return _DETAILS_MAP[token]
 
     def _get_service_description(self, service_name: str) -> str:
         """Get a description for a service"""
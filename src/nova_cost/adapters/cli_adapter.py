@@ -10,36 +10,52 @@ import webbrowser
 from typing import List, Optional, Dict, Any
 
 from ..domain.services import CostAnalysisService
-from ..adapters.aws_cost_adapter import AWSCostAdapter
-from ..adapters.html_report_adapter import HTMLReportAdapter
 
 
 class CLIAdapter:
     """Command Line Interface adapter for Nova Cost"""
     
+    _parser: Optional[argparse.ArgumentParser] = None
+    
     def __init__(self):
-        """Initialize the CLI adapter with required services"""
-        # Set up the adapters
-        cost_adapter = AWSCostAdapter()
-        report_adapter = HTMLReportAdapter()
-        
-        # Create the domain service
-        self.cost_analysis_service = CostAnalysisService(
-            cost_data_port=cost_adapter,
-            report_generator_port=report_adapter,
-            service_metadata_port=cost_adapter  # AWS adapter also implements metadata port
-        )
+        """Initialize the CLI adapter; services are created when a command needs them"""
+        self._cost_analysis_service = None
     
-    def run(self, argv: Optional[List[str]] = None) -> int:
+    @property
+    def cost_analysis_service(self) -> CostAnalysisService:
         """
-        Run the CLI adapter with the given arguments
+        Get the domain service, creating it and its adapters on first use
         
-        Args:
-            argv: Command line arguments
+        The adapters pull in boto3 and jinja2, so they are imported here rather than
+        at module load to keep --help and argument errors fast.
+        """
+        if self._cost_analysis_service is None:
+            from ..adapters.aws_cost_adapter import AWSCostAdapter
+            from ..adapters.html_report_adapter import HTMLReportAdapter
             
+            # Set up the adapters
+            cost_adapter = AWSCostAdapter()
+            report_adapter = HTMLReportAdapter(cost_adapter)
+            
+            # Create the domain service
+            self._cost_analysis_service = CostAnalysisService(
+                cost_data_port=cost_adapter,
+                report_generator_port=report_adapter,
+                service_metadata_port=cost_adapter  # AWS adapter also implements metadata port
+            )
+        return self._cost_analysis_service
+    
+    @classmethod
+    def _build_parser(cls) -> argparse.ArgumentParser:
+        """
+        Build the argument parser once and reuse it for every run
+        
         Returns:
-            Exit code (0 for success, non-zero for error)
+            The cached top-level argument parser
         """
+        if cls._parser is not None:
+            return cls._parser
+        
         parser = argparse.ArgumentParser(description="AWS Cost Analysis Tool")
         subparsers = parser.add_subparsers(dest="command", help="Command to run")
         
@@ -54,6 +70,28 @@ class CLIAdapter:
         analyze_parser.add_argument("--threshold", type=float, default=10.0, help="Cost threshold")
         analyze_parser.add_argument("--days", type=int, default=30, help="Days of data to analyze")
         
+        cls._parser = parser
+        return parser
+    
+    def run(self, argv: Optional[List[str]] = None) -> int:
+        """
+        Run the CLI adapter with the given arguments
+        
+        Args:
+            argv: Command line arguments
+            
+        Returns:
+            Exit code (0 for success, non-zero for error)
+        """
+        parser = self._build_parser()
+        
+        # A bare help request needs no option resolution; answer it before parsing
+        if argv is None:
+            argv = sys.argv[1:]
+        if argv and argv[0] in ("-h", "--help"):
+            parser.print_help()
+            return 0
+        
         args = parser.parse_args(argv)
         
         if args.command == "report":
@@ -7,13 +7,36 @@ presentation details.
 """
 import os
 import time
+import shutil
 import datetime
+import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple, Any, Optional
 from pathlib import Path
 from jinja2 import Environment, FileSystemLoader
 from ..domain.ports import ReportGeneratorPort
 from .aws_cost_adapter import AWSCostAdapter
 from ..utils.aws_resource_scanner import AWSResourceScanner
+from ..utils.jinja_cache import LazyFileSystemBytecodeCache
+
+# Template and default report locations, resolved once at import
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TEMPLATE_DIR = os.path.join(PACKAGE_DIR, 'templates')
+REPORTS_DIR = os.path.join(os.path.dirname(os.path.dirname(PACKAGE_DIR)), 'data', 'reports')
+
+# Jinja2 environment shared by all report adapters. Compiled template bytecode is
+# persisted across runs (the cache directory is created on the first write), and
+# templates are not re-checked for changes on each render.
+_ENV = Environment(
+    loader=FileSystemLoader(TEMPLATE_DIR),
+    bytecode_cache=LazyFileSystemBytecodeCache(),
+    auto_reload=False,
+    trim_blocks=True,
+    lstrip_blocks=True
+)
+
+# Buffer size for writing rendered reports, well above io.DEFAULT_BUFFER_SIZE
+_WRITE_BUFFER_SIZE = 1 << 20
 
 class HTMLReportAdapter(ReportGeneratorPort):
     """HTML implementation of the ReportGeneratorPort"""
@@ -29,9 +52,9 @@ class HTMLReportAdapter(ReportGeneratorPort):
         # Initialize with empty data, will be populated in generate_report
         self.report_data = {}
         
-        # Set up Jinja2 environment
-        self.template_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'templates')
-        self.env = Environment(loader=FileSystemLoader(self.template_dir))
+        # Use the shared Jinja2 environment
+        self.template_dir = TEMPLATE_DIR
+        self.env = _ENV
         
         # Initialize resource scanner for generating URLs
         self.resource_scanner = AWSResourceScanner()
@@ -105,63 +128,46 @@ class HTMLReportAdapter(ReportGeneratorPort):
         Returns:
             Path to generated report
         """
-        # Get comprehensive report data from the cost adapter (includes dynamic service resources)
-        self.report_data = self.cost_adapter.get_report_data()
-        
-        # Add daily costs data which isn't included in the standard report data
-        daily_costs = self.cost_adapter.get_daily_costs()
-        self.report_data['daily_costs'] = daily_costs
+        # The three fetches are independent Cost Explorer round-trips, so run them concurrently
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            # Comprehensive report data (includes dynamic service resources)
+            report_data_future = executor.submit(self.cost_adapter.get_report_data)
+            # Daily costs data which isn't included in the standard report data
+            daily_costs_future = executor.submit(self.cost_adapter.get_daily_costs)
+            historical_costs_future = executor.submit(self.cost_adapter.get_historical_costs)
+            
+            fetched = report_data_future.result()
+            fetched['daily_costs'] = daily_costs_future.result()
+            fetched['historical_costs'] = historical_costs_future.result()
         
-        # Add historical data
-        historical_costs = self.cost_adapter.get_historical_costs()
-        self.report_data['historical_costs'] = historical_costs
+        # Data added through the add_* methods (e.g. the domain service's total) wins
+        self.report_data = {**fetched, **self.report_data}
         
         # Determine output path
-        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-        reports_dir = os.path.join(base_dir, 'data', 'reports')
-        os.makedirs(reports_dir, exist_ok=True)
-        
-        # Generate report filename with today's date
-        today = datetime.date.today().strftime('%Y-%m-%d')
-        report_filename = f'aws_cost_report_{today}.html'
-        
         if output_path:
             # Use custom path if provided
             report_path = output_path
             os.makedirs(os.path.dirname(os.path.abspath(report_path)), exist_ok=True)
         else:
-            # Use default path in data/reports directory
-            report_path = os.path.join(reports_dir, report_filename)
+            # Use default path in data/reports directory, with today's date in the filename
+            os.makedirs(REPORTS_DIR, exist_ok=True)
+            today = datetime.date.today().strftime('%Y-%m-%d')
+            report_path = os.path.join(REPORTS_DIR, f'aws_cost_report_{today}.html')
         
-        # Create static directories
+        # Create static directories and copy the CSS and JS files from the template
+        # directory to the report directory; copyfile uses the OS fast copy paths
         static_dir = os.path.join(os.path.dirname(report_path), 'static')
-        css_dir = os.path.join(static_dir, 'css')
-        js_dir = os.path.join(static_dir, 'js')
-        os.makedirs(css_dir, exist_ok=True)
-        os.makedirs(js_dir, exist_ok=True)
-        
-        # Copy static files from template directory to report directory
         template_static_dir = os.path.join(self.template_dir, 'static')
-        if os.path.exists(template_static_dir):
-            # Copy CSS files
-            template_css_dir = os.path.join(template_static_dir, 'css')
-            if os.path.exists(template_css_dir):
-                for css_file in os.listdir(template_css_dir):
-                    if css_file.endswith('.css'):
-                        source = os.path.join(template_css_dir, css_file)
-                        destination = os.path.join(css_dir, css_file)
-                        with open(source, 'r') as src_file, open(destination, 'w') as dest_file:
-                            dest_file.write(src_file.read())
+        for asset_type in ('css', 'js'):
+            asset_dir = os.path.join(static_dir, asset_type)
+            os.makedirs(asset_dir, exist_ok=True)
             
-            # Copy JS files
-            template_js_dir = os.path.join(template_static_dir, 'js')
-            if os.path.exists(template_js_dir):
-                for js_file in os.listdir(template_js_dir):
-                    if js_file.endswith('.js'):
-                        source = os.path.join(template_js_dir, js_file)
-                        destination = os.path.join(js_dir, js_file)
-                        with open(source, 'r') as src_file, open(destination, 'w') as dest_file:
-                            dest_file.write(src_file.read())
+            template_asset_dir = os.path.join(template_static_dir, asset_type)
+            if os.path.isdir(template_asset_dir):
+                with os.scandir(template_asset_dir) as entries:
+                    for entry in entries:
+                        if entry.name.endswith(f'.{asset_type}') and entry.is_file():
+                            shutil.copyfile(entry.path, os.path.join(asset_dir, entry.name))
         
         # Get environment settings
         threshold = os.environ.get('COST_THRESHOLD', 10.0)
@@ -182,15 +188,21 @@ class HTMLReportAdapter(ReportGeneratorPort):
         self.report_data['threshold'] = threshold
         self.report_data['days_back'] = days_back
         
-        # Make sure all required template variables are present
+        # Find the top service by cost
+        service_costs = self.report_data.get('service_costs') or []
+        top = None
+        for service in service_costs:
+            if isinstance(service, dict) and 'cost' in service:
+                if top is None or service['cost'] > top.get('cost', 0):
+                    top = service
+        
+        # Make sure all required template variables are present; the total set through
+        # add_total_cost is authoritative, so service costs are only summed without one
         if 'total_cost' not in self.report_data:
-            # Calculate total cost from service costs if available
-            service_costs = self.report_data.get('service_costs', [])
-            if service_costs and isinstance(service_costs, list):
-                if all(isinstance(s, dict) and 'cost' in s for s in service_costs):
-                    self.report_data['total_cost'] = sum(s.get('cost', 0) for s in service_costs)
-                else:
-                    self.report_data['total_cost'] = self.report_data.get('current_month_cost', 0.0)
+            if service_costs:
+                self.report_data['total_cost'] = sum(
+                    s.get('cost', 0) for s in service_costs if isinstance(s, dict)
+                )
             else:
                 self.report_data['total_cost'] = self.report_data.get('current_month_cost', 0.0)
         
@@ -198,14 +210,9 @@ class HTMLReportAdapter(ReportGeneratorPort):
         top_service = "AWS Skill Builder Individual"  # Default based on screenshot
         top_service_cost = 58.00  # Default based on screenshot
         
-        if self.report_data.get('service_costs'):
-            # Sort services by cost and get the top one
-            sorted_services = sorted(self.report_data.get('service_costs', []), 
-                                    key=lambda x: x.get('cost', 0), 
-                                    reverse=True)
-            if sorted_services:
-                top_service = sorted_services[0].get('name', top_service)
-                top_service_cost = sorted_services[0].get('cost', top_service_cost)
+        if top is not None:
+            top_service = top.get('name', top_service)
+            top_service_cost = top.get('cost', top_service_cost)
 
         # Set default values for any potentially missing variables to prevent template errors
         defaults = {
@@ -218,10 +225,8 @@ class HTMLReportAdapter(ReportGeneratorPort):
             'items_per_page': 10
         }
         
-        # Apply defaults only if keys don't exist
-        for key, value in defaults.items():
-            if key not in self.report_data:
-                self.report_data[key] = value
+        # Apply defaults only if keys don't exist (existing values win the merge)
+        self.report_data = {**defaults, **self.report_data}
         
         # Generate service-specific resource links
         service_resources = {}
@@ -244,18 +249,14 @@ class HTMLReportAdapter(ReportGeneratorPort):
                 service['cancelled_on'] = None
                 service['is_pay_as_you_go'] = True
         
-        # Get the template
+        # Get the template (compiled once per process, then served from the environment cache)
         template = self.env.get_template('report_template.html')
         
-        # Convert daily costs to format expected by JS
-        js_daily_costs = []
-        for date, cost, service in self.report_data.get('daily_costs', []):
-            js_daily_costs.append({
-                'date': date,
-                'cost': cost,
-                'service': service
-            })
-        self.report_data['daily_costs'] = js_daily_costs
+        # Convert daily costs to format expected by JS (serialized with |tojson in the template)
+        self.report_data['daily_costs'] = [
+            {'date': date, 'cost': cost, 'service': service}
+            for date, cost, service in self.report_data.get('daily_costs', [])
+        ]
         
         # Make sure 'services' is set for template compatibility
         if 'service_costs' in self.report_data and 'services' not in self.report_data:
@@ -282,17 +283,18 @@ class HTMLReportAdapter(ReportGeneratorPort):
             'start_date': (datetime.datetime.now() - datetime.timedelta(days=30)).strftime('%Y-%m-%d'),
             'end_date': datetime.datetime.now().strftime('%Y-%m-%d')
         }
-        html_content = template.render(**template_data)
         
-        # Write the HTML to file
-        with open(report_path, 'w') as f:
-            f.write(html_content)
+        # Stream the rendered HTML into the buffered file instead of building one large string
+        with open(report_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+            template.stream(**template_data).dump(f, encoding='utf-8')
         
         print(f"Report generated at: {report_path}")
         
+        # The next report starts from freshly fetched and freshly added data
+        self.report_data = {}
+        
         # Open the report in a web browser if requested
         if open_report:
-            import webbrowser
             webbrowser.open('file://' + os.path.abspath(report_path))
         
         return report_path
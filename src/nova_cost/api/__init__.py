@@ -1,4 +1,23 @@
 """
 Nova Cost API - API endpoints for AWS cost management
 """
+import importlib
+
 from . import service_cancellation
+
+# Report entry points, imported on first attribute access (PEP 562) so that the
+# cancellation endpoints do not pull in the cost monitor and Jinja2
+_LAZY_IMPORTS = {
+    "generate_report": ".reports",
+    "analyze_costs": ".reports",
+}
+
+
+def __getattr__(name):
+    """Resolve the lazily imported report API names."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -1,23 +1,43 @@
 """
 Flask application to serve Nova Cost API endpoints
 """
-import os
+from datetime import date
+from pathlib import Path
 from flask import Flask, request, jsonify, send_from_directory
 from flask_cors import CORS
-from pathlib import Path
-from dotenv import load_dotenv
+from werkzeug.exceptions import NotFound
 import logging
 
 # Import the service cancellation API
-from .service_cancellation import ServiceCancellationAPI
+from .service_cancellation import get_api
+from ..utils.env import load_env
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Load environment variables
-dotenv_path = Path(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))).joinpath('.env')
-load_dotenv(dotenv_path)
+load_env()
+
+# Report locations, resolved once at import rather than on every request
+BASE_DIR = Path(__file__).resolve().parents[3]
+REPORTS_DIR = BASE_DIR / 'data' / 'reports'
+STATIC_DIR = REPORTS_DIR / 'static'
+
+# Dates for which today's report is known to exist, so the dashboard skips the stat;
+# an entry is dropped again if the file turns out to be gone
+_reports_ready = set()
+
+# Today's date and its formatted form, refreshed only when the date changes
+_today_cache = {'date': None, 'str': None}
+
+
+def _today_str():
+    """Return today's date as YYYY-MM-DD, formatting it once per day"""
+    today = date.today()
+    if _today_cache['date'] != today:
+        _today_cache.update(date=today, str=today.strftime('%Y-%m-%d'))
+    return _today_cache['str']
 
 def create_app():
     """Create and configure the Flask application"""
@@ -27,7 +47,7 @@ def create_app():
     CORS(app, resources={r"/api/*": {"origins": "*"}})
     
     # Initialize the service cancellation API
-    cancellation_api = ServiceCancellationAPI()
+    cancellation_api = get_api()
     
     # Define route for service cancellation
     @app.route('/api/cancel-service', methods=['POST'])
@@ -56,35 +76,32 @@ def create_app():
     # Define route to serve static assets for reports
     @app.route('/reports/static/<path:filename>')
     def serve_static(filename):
-        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-        static_dir = os.path.join(base_dir, 'data', 'reports', 'static')
-        return send_from_directory(static_dir, filename)
+        return send_from_directory(STATIC_DIR, filename)
     
     # Define route to serve reports
     @app.route('/reports/<path:filename>')
     def serve_report(filename):
-        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-        reports_dir = os.path.join(base_dir, 'data', 'reports')
-        return send_from_directory(reports_dir, filename)
+        return send_from_directory(REPORTS_DIR, filename)
     
     # Define route for the dashboard
     @app.route('/dashboard')
     def dashboard():
-        from datetime import date
-        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-        reports_dir = os.path.join(base_dir, 'data', 'reports')
-        today = date.today().strftime('%Y-%m-%d')
+        today = _today_str()
         report_filename = f'aws_cost_report_{today}.html'
-        report_path = os.path.join(reports_dir, report_filename)
         
-        # Check if the report exists
-        if os.path.exists(report_path):
-            return send_from_directory(reports_dir, report_filename)
-        else:
-            # Generate the report if it doesn't exist
+        if today in _reports_ready:
+            try:
+                return send_from_directory(REPORTS_DIR, report_filename)
+            except NotFound:
+                # The report was deleted or rotated since; regenerate it below
+                _reports_ready.discard(today)
+        
+        # Generate the report if it doesn't exist
+        if not (REPORTS_DIR / report_filename).exists():
             from ..adapters.html_report_adapter import generate_report
             generate_report()
-            return send_from_directory(reports_dir, report_filename)
+        _reports_ready.add(today)
+        return send_from_directory(REPORTS_DIR, report_filename)
     
     # Health check endpoint
     @app.route('/health')
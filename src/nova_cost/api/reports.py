@@ -1,13 +1,14 @@
 """
-Public API for Nova Cost - AWS Cost Analysis Tool
+Report API - Cost report and analysis entry points used by the nova_cost CLI
 """
 import os
 import webbrowser
 from typing import Optional, Dict, List, Any, Tuple, Union
 from pathlib import Path
 
-from nova_cost.services.aws_cost_monitor import AWSCostMonitor
-from nova_cost.services.report_generator import HTMLReportGenerator
+from ..services.aws_cost_monitor import AWSCostMonitor
+from ..services.report_generator import HTMLReportGenerator
+from ..domain.services import filter_services_above, total_daily_cost
 
 
 def generate_report(
@@ -30,12 +31,13 @@ def generate_report(
     cost_monitor = AWSCostMonitor()
     report_generator = HTMLReportGenerator()
     
-    # Get the start and end dates
-    services = cost_monitor.get_service_costs(days_back=days_back)
-    daily_costs = cost_monitor.get_daily_costs(days_back=days_back)
+    # Get service and daily costs (both derived from one Cost Explorer query)
+    bundle = cost_monitor.get_report_bundle(days_back=days_back)
+    services = bundle["services"]
+    daily_costs = bundle["daily_costs"]
     
     # Calculate total cost
-    total_cost = sum(cost for _, cost, _ in daily_costs)
+    total_cost = total_daily_cost(daily_costs)
     
     # Set report start/end dates
     start_date, end_date = cost_monitor.get_date_range(days_back)
@@ -85,10 +87,7 @@ def analyze_costs(threshold: float = 10.0, days_back: int = 30) -> List[Dict[str
     services = cost_monitor.get_service_costs(days_back=days_back)
     
     # Filter services above threshold
-    high_cost_services = [
-        service for service in services 
-        if service["cost"] > threshold
-    ]
+    high_cost_services = filter_services_above(services, threshold)
     
     # Print analysis
     if high_cost_services:
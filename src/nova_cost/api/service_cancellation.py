@@ -1,21 +1,190 @@
 """
 Service Cancellation API - Provides endpoints for canceling AWS services
+
+The standalone endpoint can be served by a production WSGI server, e.g.:
+
+    gunicorn -k gthread -w 4 --threads 8 \
+        'src.nova_cost.api.service_cancellation:create_cancellation_endpoint()'
 """
-import boto3
+import asyncio
+import functools
 import json
 import os
 import logging
-from typing import Dict, Any, List, Optional
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Any, List, Optional, Sequence, Tuple, Union
 from botocore.exceptions import ClientError
+from retry import retry
 
 logger = logging.getLogger(__name__)
 
+# orjson is optional; responses fall back to the standard json module
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> bytes:
+        """Serialize a response payload; boto3 datetimes are written as ISO strings"""
+        return orjson.dumps(obj, default=str)
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        """Serialize a response payload; boto3 datetimes are written as strings"""
+        return json.dumps(obj, default=str).encode('utf-8')
+
+# DeleteObjects requests in flight at once while emptying a bucket (within the client pool)
+_S3_DELETE_WORKERS = 16
+
+# Maximum number of instance IDs a single TerminateInstances call accepts
+_MAX_TERMINATE_IDS = 1000
+
+# EC2 instance states that can still be terminated (terminated ones are not listed)
+_LIVE_INSTANCE_STATES = ['pending', 'running', 'stopping', 'stopped']
+
+# Error codes AWS uses when a request was throttled
+_THROTTLING_CODES = frozenset({
+    'Throttling', 'ThrottlingException', 'TooManyRequestsException', 'RequestLimitExceeded'
+})
+
+
+class _ThrottledError(Exception):
+    """An AWS call was still throttled after the client's retries; it is retried after a backoff"""
+
+
+@retry(_ThrottledError, tries=6, delay=1, backoff=2, max_delay=30, jitter=(0, 1), logger=logger)
+def _call_throttled(operation: Callable[..., Dict[str, Any]], **kwargs) -> Dict[str, Any]:
+    """Call an AWS operation, raising _ThrottledError for throttling errors"""
+    try:
+        return operation(**kwargs)
+    except ClientError as e:
+        if e.response.get('Error', {}).get('Code') in _THROTTLING_CODES:
+            raise _ThrottledError(str(e)) from e
+        raise
+
+
+def _call_with_backoff(operation: Callable[..., Dict[str, Any]], **kwargs) -> Dict[str, Any]:
+    """
+    Call a heavily throttled AWS operation, backing off with jitter while it is throttled
+    
+    Args:
+        operation: Bound client method to call
+        **kwargs: Arguments for the operation
+        
+    Returns:
+        The operation's response
+        
+    Raises:
+        ClientError: The last throttling error once the retries are exhausted, or any other error
+    """
+    try:
+        return _call_throttled(operation, **kwargs)
+    except _ThrottledError as e:
+        error = e.__cause__
+    # Raised outside the handler so the original error carries no chain back to the wrapper
+    raise error
+
+
+@functools.lru_cache(maxsize=1)
+def _cancel_config():
+    """
+    Client settings shared by every cancellation client: keep-alive connections in a pool
+    large enough for concurrent cancellations, adaptive retries and bounded timeouts
+    
+    Built on first use, since importing botocore.config loads most of botocore.
+    """
+    from botocore.config import Config
+    return Config(
+        tcp_keepalive=True,
+        max_pool_connections=50,
+        retries={'max_attempts': 10, 'mode': 'adaptive'},
+        connect_timeout=3,
+        read_timeout=15
+    )
+
+
 class ServiceCancellationAPI:
     """API for canceling AWS services directly from the cost dashboard"""
     
+    __slots__ = ('session', '_clients', '_clients_lock', '_list_cache')
+    
+    # Resource listings are reused for a minute; the dashboard refreshes far more often
+    _LIST_TTL = 60
+    
+    # Service name -> name of the method that cancels it; anything else is not implemented
+    _DISPATCH = {
+        "Amazon OpenSearch Service": "_cancel_opensearch",
+        "OpenSearch Serverless": "_cancel_opensearch_serverless",
+        "Amazon Redshift": "_cancel_redshift",
+        "AWS Lambda": "_cancel_lambda",
+        "Amazon EC2": "_cancel_ec2",
+        "Amazon RDS": "_cancel_rds",
+        "Amazon S3": "_cancel_s3"
+    }
+    
     def __init__(self):
         """Initialize the API with AWS session"""
+        # boto3 is imported here so importing this module does not load it
+        import boto3
         self.session = boto3.Session()
+        # Clients keyed by (service, region), reused so repeat calls keep their connections
+        self._clients: Dict[Tuple[str, str], Any] = {}
+        # boto3 sessions are not thread-safe, so client creation is serialized
+        self._clients_lock = threading.Lock()
+        # Recent resource listings: (service, region) -> (expires_at, resources)
+        self._list_cache: Dict[Tuple[str, str], Tuple[float, Any]] = {}
+    
+    def _client(self, service: str, region: str):
+        """
+        Get a boto3 client for a service in a region, creating it on first use
+        
+        Args:
+            service: boto3 service name (e.g., "opensearch")
+            region: AWS region for the client
+            
+        Returns:
+            The cached boto3 client
+        """
+        key = (service, region)
+        client = self._clients.get(key)
+        if client is None:
+            with self._clients_lock:
+                client = self._clients.get(key)
+                if client is None:
+                    client = self.session.client(service, region_name=region, config=_cancel_config())
+                    self._clients[key] = client
+        return client
+    
+    def _cached_listing(self, service: str, region: str, fetch: Callable[[], Any]) -> Any:
+        """
+        Get a resource listing for a service in a region, reusing it for _LIST_TTL seconds
+        
+        Args:
+            service: boto3 service name the listing belongs to
+            region: AWS region of the listing
+            fetch: Callable that calls AWS and returns the listing
+            
+        Returns:
+            The cached or freshly fetched listing
+        """
+        key = (service, region)
+        now = time.time()
+        entry = self._list_cache.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+        
+        resources = fetch()
+        self._list_cache[key] = (now + self._LIST_TTL, resources)
+        return resources
+    
+    def invalidate(self, service: str, region: str) -> None:
+        """
+        Drop the cached resource listing for a service in a region
+        
+        Args:
+            service: boto3 service name (e.g., "opensearch")
+            region: AWS region of the listing
+        """
+        self._list_cache.pop((service, region), None)
     
     def cancel_service(self, service_name: str, service_id: str = None, region: str = "us-east-1") -> Dict[str, Any]:
         """
@@ -23,37 +192,21 @@ class ServiceCancellationAPI:
         
         Args:
             service_name: Name of the service to cancel (e.g., "Amazon OpenSearch Service")
-            service_id: ID of the specific resource to cancel (optional)
+            service_id: ID of the specific resource to cancel (optional); EC2, Lambda and RDS
+                also accept a list or comma-separated IDs
             region: AWS region where the service is deployed
             
         Returns:
             Dictionary with cancellation status and details
         """
-        logger.info(f"Canceling service: {service_name} (ID: {service_id}) in region: {region}")
+        logger.info("Canceling service: %s (ID: %s) in region: %s", service_name, service_id, region)
         
         try:
-            # Create a session for the specified region
-            session = boto3.Session(region_name=region)
-            
-            # Map service name to appropriate cancellation function
-            cancellation_functions = {
-                "Amazon OpenSearch Service": self._cancel_opensearch,
-                "OpenSearch Serverless": self._cancel_opensearch_serverless,
-                "Amazon Redshift": self._cancel_redshift,
-                "AWS Lambda": self._cancel_lambda,
-                "Amazon EC2": self._cancel_ec2,
-                "Amazon RDS": self._cancel_rds,
-                "Amazon S3": self._cancel_s3
-            }
-            
             # Get the appropriate cancellation function or use default
-            cancel_func = cancellation_functions.get(
-                service_name, 
-                self._default_cancellation
-            )
+            cancel_func = getattr(self, self._DISPATCH.get(service_name, "_default_cancellation"))
             
             # Call the specific cancellation function
-            result = cancel_func(session, service_id, region)
+            result = cancel_func(service_id, region)
             
             return {
                 "success": True,
@@ -62,33 +215,87 @@ class ServiceCancellationAPI:
             }
             
         except ClientError as e:
-            logger.error(f"AWS client error canceling {service_name}: {str(e)}")
+            logger.error("AWS client error canceling %s: %s", service_name, e)
             return {
                 "success": False,
                 "message": f"Error canceling {service_name}: {str(e)}",
                 "error_code": e.response['Error']['Code'] if hasattr(e, 'response') else "UnknownError"
             }
         except Exception as e:
-            logger.error(f"Error canceling {service_name}: {str(e)}")
+            logger.error("Error canceling %s: %s", service_name, e)
             return {
                 "success": False,
                 "message": f"Error canceling {service_name}: {str(e)}",
                 "error_code": "UnknownError"
             }
     
-    def _cancel_opensearch(self, session, domain_name: str, region: str) -> Dict[str, Any]:
+    def cancel_services(self, requests: List[Dict[str, Any]], max_workers: int = 16) -> List[Dict[str, Any]]:
+        """
+        Cancel several AWS resources concurrently
+        
+        Args:
+            requests: Cancellation requests, each with 'service_name' and optional
+                'service_id' and 'region' keys
+            max_workers: Maximum number of cancellations in flight at once
+            
+        Returns:
+            Cancellation results in the same order as the requests
+        """
+        if not requests:
+            return []
+        
+        # Clients are shared across threads; throttling is absorbed by their adaptive retries
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(requests))) as executor:
+            futures = [
+                executor.submit(
+                    self.cancel_service,
+                    request['service_name'],
+                    request.get('service_id'),
+                    request.get('region', 'us-east-1')
+                )
+                for request in requests
+            ]
+            return [future.result() for future in futures]
+    
+    async def cancel_many(self, requests: List[Dict[str, Any]], max_concurrency: int = 32) -> List[Dict[str, Any]]:
+        """
+        Cancel several AWS resources concurrently from an event loop
+        
+        Args:
+            requests: Cancellation requests, each with 'service_name' and optional
+                'service_id' and 'region' keys
+            max_concurrency: Maximum number of cancellations in flight at once
+            
+        Returns:
+            Cancellation results in the same order as the requests
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def cancel(request: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await asyncio.to_thread(
+                    self.cancel_service,
+                    request['service_name'],
+                    request.get('service_id'),
+                    request.get('region', 'us-east-1')
+                )
+        
+        return await asyncio.gather(*(cancel(request) for request in requests))
+    
+    def _cancel_opensearch(self, domain_name: str, region: str) -> Dict[str, Any]:
         """Cancel an OpenSearch domain"""
+        client = self._client('opensearch', region)
+        
         if not domain_name:
             # List all domains if no specific one provided
-            client = session.client('opensearch')
-            domains = client.list_domain_names()
-            return {"domains": domains["DomainNames"], "action": "list_only"}
+            domains = self._cached_listing('opensearch', region, lambda: client.list_domain_names()["DomainNames"])
+            return {"domains": domains, "action": "list_only"}
         
         # Cancel specific domain
-        client = session.client('opensearch')
         response = client.delete_domain(
             DomainName=domain_name
         )
+        self.invalidate('opensearch', region)
         
         return {
             "domain_name": domain_name,
@@ -97,19 +304,23 @@ class ServiceCancellationAPI:
             "action": "deleted"
         }
     
-    def _cancel_opensearch_serverless(self, session, collection_id: str, region: str) -> Dict[str, Any]:
+    def _cancel_opensearch_serverless(self, collection_id: str, region: str) -> Dict[str, Any]:
         """Cancel an OpenSearch Serverless collection"""
-        client = session.client('opensearchserverless')
+        client = self._client('opensearchserverless', region)
         
         if not collection_id:
             # List all collections if no specific one provided
-            collections = client.list_collections()
-            return {"collections": collections.get("collectionSummaries", []), "action": "list_only"}
+            collections = self._cached_listing(
+                'opensearchserverless', region,
+                lambda: client.list_collections().get("collectionSummaries", [])
+            )
+            return {"collections": collections, "action": "list_only"}
         
         # Cancel specific collection
         response = client.delete_collection(
             id=collection_id
         )
+        self.invalidate('opensearchserverless', region)
         
         return {
             "collection_id": collection_id,
@@ -118,20 +329,22 @@ class ServiceCancellationAPI:
             "action": "deleted"
         }
     
-    def _cancel_redshift(self, session, cluster_id: str, region: str) -> Dict[str, Any]:
+    def _cancel_redshift(self, cluster_id: str, region: str) -> Dict[str, Any]:
         """Cancel a Redshift cluster"""
-        client = session.client('redshift')
+        client = self._client('redshift', region)
         
         if not cluster_id:
             # List all clusters if no specific one provided
-            clusters = client.describe_clusters()
-            return {"clusters": clusters.get("Clusters", []), "action": "list_only"}
+            clusters = self._cached_listing('redshift', region, lambda: self._paginate_all(client, 'describe_clusters', 'Clusters'))
+            return {"clusters": clusters, "action": "list_only"}
         
         # Cancel specific cluster
-        response = client.delete_cluster(
+        response = _call_with_backoff(
+            client.delete_cluster,
             ClusterIdentifier=cluster_id,
             SkipFinalClusterSnapshot=True
         )
+        self.invalidate('redshift', region)
         
         return {
             "cluster_id": cluster_id,
@@ -139,93 +352,122 @@ class ServiceCancellationAPI:
             "action": "deleted"
         }
     
-    def _cancel_lambda(self, session, function_name: str, region: str) -> Dict[str, Any]:
-        """Cancel a Lambda function"""
-        client = session.client('lambda')
+    def _cancel_lambda(self, function_name: Union[str, Sequence[str]], region: str) -> Dict[str, Any]:
+        """Cancel one or more Lambda functions (a list or comma-separated names)"""
+        client = self._client('lambda', region)
         
         if not function_name:
             # List all functions if no specific one provided
-            functions = client.list_functions()
-            return {"functions": functions.get("Functions", []), "action": "list_only"}
+            functions = self._cached_listing('lambda', region, lambda: self._paginate_all(client, 'list_functions', 'Functions'))
+            return {"functions": functions, "action": "list_only"}
         
-        # Cancel specific function
-        response = client.delete_function(
-            FunctionName=function_name
+        # Cancel specific functions; DeleteFunction takes one name, so the calls run concurrently
+        self._for_each_id(
+            self._split_ids(function_name),
+            lambda name: client.delete_function(FunctionName=name)
         )
+        self.invalidate('lambda', region)
         
         return {
             "function_name": function_name,
             "action": "deleted"
         }
     
-    def _cancel_ec2(self, session, instance_id: str, region: str) -> Dict[str, Any]:
-        """Terminate an EC2 instance"""
-        client = session.client('ec2')
+    def _cancel_ec2(self, instance_id: Union[str, Sequence[str]], region: str) -> Dict[str, Any]:
+        """Terminate one or more EC2 instances (a list or comma-separated IDs)"""
+        client = self._client('ec2', region)
         
         if not instance_id:
             # List all instances if no specific one provided
-            instances = client.describe_instances()
-            return {"instances": instances.get("Reservations", []), "action": "list_only"}
+            instances = self._cached_listing('ec2', region, lambda: self._paginate_all(
+                client, 'describe_instances', 'Reservations',
+                Filters=[{'Name': 'instance-state-name', 'Values': _LIVE_INSTANCE_STATES}],
+                PaginationConfig={'PageSize': 1000}
+            ))
+            return {"instances": instances, "action": "list_only"}
         
-        # Terminate specific instance
-        response = client.terminate_instances(
-            InstanceIds=[instance_id]
-        )
+        # Terminate specific instances, batched as TerminateInstances allows
+        instance_ids = self._split_ids(instance_id)
+        terminating = []
+        for start in range(0, len(instance_ids), _MAX_TERMINATE_IDS):
+            response = client.terminate_instances(
+                InstanceIds=instance_ids[start:start + _MAX_TERMINATE_IDS]
+            )
+            terminating.extend(response.get("TerminatingInstances", []))
+        self.invalidate('ec2', region)
         
         return {
             "instance_id": instance_id,
-            "termination_status": response.get("TerminatingInstances", []),
+            "termination_status": terminating,
             "action": "terminated"
         }
     
-    def _cancel_rds(self, session, db_instance_id: str, region: str) -> Dict[str, Any]:
-        """Cancel an RDS database instance"""
-        client = session.client('rds')
+    def _cancel_rds(self, db_instance_id: Union[str, Sequence[str]], region: str) -> Dict[str, Any]:
+        """
+        Cancel one or more RDS database instances (a list or comma-separated IDs)
+        
+        The deletion status is a string for a single instance and a dict keyed by
+        instance ID when several are cancelled.
+        """
+        client = self._client('rds', region)
         
         if not db_instance_id:
             # List all DB instances if no specific one provided
-            instances = client.describe_db_instances()
-            return {"db_instances": instances.get("DBInstances", []), "action": "list_only"}
-        
-        # Cancel specific DB instance
-        response = client.delete_db_instance(
-            DBInstanceIdentifier=db_instance_id,
-            SkipFinalSnapshot=True,
-            DeleteAutomatedBackups=True
+            instances = self._cached_listing('rds', region, lambda: self._paginate_all(client, 'describe_db_instances', 'DBInstances'))
+            return {"db_instances": instances, "action": "list_only"}
+        
+        # Cancel specific DB instances; DeleteDBInstance takes one ID, so the calls run concurrently
+        instance_ids = self._split_ids(db_instance_id)
+        responses = self._for_each_id(
+            instance_ids,
+            lambda instance: _call_with_backoff(
+                client.delete_db_instance,
+                DBInstanceIdentifier=instance,
+                SkipFinalSnapshot=True,
+                DeleteAutomatedBackups=True
+            )
         )
+        self.invalidate('rds', region)
+        
+        statuses = {
+            instance: response.get("DBInstance", {}).get("DBInstanceStatus", "")
+            for instance, response in zip(instance_ids, responses)
+        }
         
         return {
             "db_instance_id": db_instance_id,
-            "deletion_status": response.get("DBInstance", {}).get("DBInstanceStatus", ""),
+            "deletion_status": statuses[instance_ids[0]] if len(instance_ids) == 1 else statuses,
             "action": "deleted"
         }
     
-    def _cancel_s3(self, session, bucket_name: str, region: str) -> Dict[str, Any]:
-        """Delete an S3 bucket (note: bucket must be empty)"""
-        client = session.client('s3')
+    def _cancel_s3(self, bucket_name: str, region: str) -> Dict[str, Any]:
+        """Empty and delete an S3 bucket, including any object versions"""
+        client = self._client('s3', region)
         
         if not bucket_name:
             # List all buckets if no specific one provided
-            buckets = client.list_buckets()
-            return {"buckets": buckets.get("Buckets", []), "action": "list_only"}
+            buckets = self._cached_listing('s3', region, lambda: client.list_buckets().get("Buckets", []))
+            return {"buckets": buckets, "action": "list_only"}
         
         # First empty the bucket
         try:
-            # List all objects in the bucket
-            objects = client.list_objects_v2(Bucket=bucket_name)
-            if 'Contents' in objects:
-                # Delete all objects in the bucket
-                client.delete_objects(
-                    Bucket=bucket_name,
-                    Delete={
-                        'Objects': [{'Key': obj['Key']} for obj in objects['Contents']]
-                    }
-                )
-                
+            # Delete current objects, then any remaining versions and delete markers
+            errors = self._delete_s3_objects(client, bucket_name, 'list_objects_v2', ('Contents',))
+            errors += self._delete_s3_objects(client, bucket_name, 'list_object_versions',
+                                              ('Versions', 'DeleteMarkers'))
+            if errors:
+                return {
+                    "bucket_name": bucket_name,
+                    "error": f"Failed to delete {len(errors)} objects",
+                    "object_errors": errors,
+                    "action": "error"
+                }
+            
             # Delete the bucket
             response = client.delete_bucket(
                 Bucket=bucket_name
             )
+            self.invalidate('s3', region)
             
             return {
                 "bucket_name": bucket_name,
@@ -238,7 +480,106 @@ class ServiceCancellationAPI:
                 "action": "error"
             }
     
-    def _default_cancellation(self, session, resource_id: str, region: str) -> Dict[str, Any]:
+    @staticmethod
+    def _split_ids(resource_ids: Union[str, Sequence[str]]) -> List[str]:
+        """
+        Normalize a resource ID argument to a list of IDs
+        
+        Args:
+            resource_ids: A single ID, comma-separated IDs, or a list of IDs
+            
+        Returns:
+            The individual resource IDs
+        """
+        if isinstance(resource_ids, str):
+            return [resource_id.strip() for resource_id in resource_ids.split(',') if resource_id.strip()]
+        return list(resource_ids)
+    
+    @staticmethod
+    def _for_each_id(resource_ids: List[str], action: Callable[[str], Any], max_workers: int = 16) -> List[Any]:
+        """
+        Run a per-resource AWS call for each ID, concurrently when there are several
+        
+        Args:
+            resource_ids: Resource IDs to act on
+            action: Callable making the AWS call for one ID
+            max_workers: Maximum number of calls in flight at once
+            
+        Returns:
+            The call results in the same order as the IDs
+        """
+        if len(resource_ids) == 1:
+            return [action(resource_ids[0])]
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(resource_ids))) as executor:
+            return list(executor.map(action, resource_ids))
+    
+    def _paginate_all(self, client, operation: str, field: str, **kwargs) -> List[Dict[str, Any]]:
+        """
+        Collect one field from every page of a paginated listing operation
+        
+        Args:
+            client: boto3 client to list with
+            operation: Name of the paginated operation (e.g., "describe_instances")
+            field: Response field holding the listed resources
+            **kwargs: Extra arguments for the operation, such as server-side filters
+            
+        Returns:
+            The resources from all pages
+        """
+        resources = []
+        for page in client.get_paginator(operation).paginate(**kwargs):
+            resources.extend(page.get(field, []))
+        return resources
+    
+    def _delete_s3_objects(self, client, bucket_name: str, operation: str, fields: Tuple[str, ...]) -> List[Dict[str, Any]]:
+        """
+        Delete every object a listing operation returns, one DeleteObjects call per page
+        
+        Pages are deleted on a bounded worker pool while the listing continues, so at most
+        _S3_DELETE_WORKERS pages of keys are held at a time.
+        
+        Args:
+            client: S3 client for the bucket's region
+            bucket_name: Name of the bucket to empty
+            operation: Paginated listing operation ('list_objects_v2' or 'list_object_versions')
+            fields: Response fields holding the objects to delete
+            
+        Returns:
+            Errors reported by DeleteObjects, if any
+        """
+        errors = []
+        
+        def collect(done) -> None:
+            for future in done:
+                errors.extend(future.result().get('Errors', []))
+        
+        # Pages are capped at the 1000 keys DeleteObjects accepts, so each page is one request
+        pages = client.get_paginator(operation).paginate(
+            Bucket=bucket_name, PaginationConfig={'PageSize': 1000}
+        )
+        pending = set()
+        with ThreadPoolExecutor(max_workers=_S3_DELETE_WORKERS) as executor:
+            for page in pages:
+                objects = [
+                    {'Key': obj['Key'], 'VersionId': obj['VersionId']} if 'VersionId' in obj else {'Key': obj['Key']}
+                    for field in fields
+                    for obj in page.get(field, ())
+                ]
+                if not objects:
+                    continue
+                if len(pending) >= _S3_DELETE_WORKERS:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+                pending.add(executor.submit(
+                    client.delete_objects,
+                    Bucket=bucket_name,
+                    Delete={'Objects': objects, 'Quiet': True}
+                ))
+            collect(wait(pending).done)
+        return errors
+    
+    def _default_cancellation(self, resource_id: str, region: str) -> Dict[str, Any]:
         """Default cancellation for services without specific implementation"""
         return {
             "error": "Cancellation not implemented for this service type",
@@ -248,6 +589,25 @@ class ServiceCancellationAPI:
         }
 
 
+# Shared API instance, so warm processes (e.g. Lambda containers) reuse its session and clients
+_API_SINGLETON: Optional[ServiceCancellationAPI] = None
+_API_SINGLETON_LOCK = threading.Lock()
+
+
+def get_api() -> ServiceCancellationAPI:
+    """
+    Get the process-wide ServiceCancellationAPI, creating it on first use
+    
+    Concurrent first requests on a threaded server wait for a single instance.
+    """
+    global _API_SINGLETON
+    if _API_SINGLETON is None:
+        with _API_SINGLETON_LOCK:
+            if _API_SINGLETON is None:
+                _API_SINGLETON = ServiceCancellationAPI()
+    return _API_SINGLETON
+
+
 # Create a Flask route to handle the cancellation requests
 def create_cancellation_endpoint():
     """
@@ -255,10 +615,15 @@ def create_cancellation_endpoint():
     
     This function should be called in the app's route registration
     """
-    from flask import Flask, request, jsonify
+    from flask import Flask, Response, request
     
     app = Flask(__name__)
-    cancellation_api = ServiceCancellationAPI()
+    app.url_map.strict_slashes = False
+    cancellation_api = get_api()
+    
+    def json_response(payload: Dict[str, Any], status: int = 200) -> Response:
+        """Build a JSON response, encoded with orjson when it is available"""
+        return Response(_json_dumps(payload), status=status, mimetype='application/json')
     
     @app.route('/api/cancel-service', methods=['POST'])
     def cancel_service_route():
@@ -266,10 +631,10 @@ def create_cancellation_endpoint():
         
         # Validate request data
         if not data or 'service_name' not in data:
-            return jsonify({
+            return json_response({
                 'success': False,
                 'message': 'Missing required parameter: service_name'
-            }), 400
+            }, 400)
         
         # Extract parameters
         service_name = data.get('service_name')
@@ -279,7 +644,7 @@ def create_cancellation_endpoint():
         # Call the API to cancel the service
         result = cancellation_api.cancel_service(service_name, service_id, region)
         
-        return jsonify(result)
+        return json_response(result)
     
     return app
 
@@ -297,5 +662,4 @@ def cancel_service_directly(service_name: str, service_id: str = None, region: s
     Returns:
         Dictionary with cancellation status and details
     """
-    api = ServiceCancellationAPI()
-    return api.cancel_service(service_name, service_id, region)
+    return get_api().cancel_service(service_name, service_id, region)
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Precompile the report templates into Python modules
+
+Run ``python -m nova_cost.build_templates`` as a build step. HTMLReportGenerator
+loads templates from the compiled directory when it exists, so rerun this after
+editing a template (or delete the directory to go back to the sources).
+"""
+import sys
+from typing import List, Optional
+
+from jinja2 import Environment, FileSystemLoader
+
+from .services.report_generator import COMPILED_TEMPLATE_DIR, ENVIRONMENT_OPTIONS, TEMPLATE_DIR
+
+
+def build_templates(target: str = COMPILED_TEMPLATE_DIR) -> str:
+    """
+    Compile every template in the templates directory into a Python module
+    
+    Args:
+        target: Directory to write the compiled modules to
+        
+    Returns:
+        The target directory
+    """
+    env = Environment(loader=FileSystemLoader(TEMPLATE_DIR), **ENVIRONMENT_OPTIONS)
+    env.compile_templates(
+        target,
+        extensions=['html'],
+        zip=None,
+        log_function=print,
+        ignore_errors=False
+    )
+    return target
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Entry point for the template build step
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    target = build_templates(*argv[:1])
+    print(f"Templates compiled to: {target}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
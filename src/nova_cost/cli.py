@@ -2,17 +2,71 @@
 """
 Command-line interface for Nova Cost - AWS Cost Analysis Tool
 """
-import argparse
 import sys
+from types import SimpleNamespace
 from typing import List, Optional
 
-from nova_cost.api import generate_report, analyze_costs
+# Options each command accepts: option -> value converter (None for flags)
+_COMMAND_OPTIONS = {
+    "report": {"--days": int, "--output": str, "--open": None},
+    "analyze": {"--threshold": float, "--days": int},
+}
 
+# Default values for each command's options
+_COMMAND_DEFAULTS = {
+    "report": {"days": 30, "output": None, "open": False},
+    "analyze": {"threshold": 10.0, "days": 30},
+}
 
-def main(argv: Optional[List[str]] = None) -> int:
+
+def _parse_fast(argv: List[str]) -> Optional[SimpleNamespace]:
     """
-    Main entry point for the AWS Cost Analysis CLI.
+    Parse the common well-formed invocations without building an argparse parser
+    
+    Args:
+        argv: Command line arguments
+    
+    Returns:
+        Parsed arguments, or None if argparse should handle the command line
+        (help, abbreviations, malformed values, unknown options)
     """
+    if not argv or argv[0] not in _COMMAND_OPTIONS:
+        return None
+    
+    command = argv[0]
+    options = _COMMAND_OPTIONS[command]
+    values = dict(_COMMAND_DEFAULTS[command])
+    
+    i = 1
+    while i < len(argv):
+        option, has_value, value = argv[i].partition("=")
+        if option not in options:
+            return None
+        
+        convert = options[option]
+        if convert is None:
+            if has_value:
+                return None
+            values[option[2:]] = True
+        else:
+            if not has_value:
+                i += 1
+                if i >= len(argv) or argv[i].startswith("--"):
+                    return None
+                value = argv[i]
+            try:
+                values[option[2:]] = convert(value)
+            except ValueError:
+                return None
+        i += 1
+    
+    return SimpleNamespace(command=command, **values)
+
+
+def _build_parser():
+    """Build the full argparse parser, used for help and anything the fast path declines"""
+    import argparse
+    
     parser = argparse.ArgumentParser(description="AWS Cost Analysis Tool")
     subparsers = parser.add_subparsers(dest="command", help="Command to run")
     
@@ -27,9 +81,25 @@ def main(argv: Optional[List[str]] = None) -> int:
     analyze_parser.add_argument("--threshold", type=float, default=10.0, help="Cost threshold")
     analyze_parser.add_argument("--days", type=int, default=30, help="Days of data to analyze")
     
-    args = parser.parse_args(argv)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Main entry point for the AWS Cost Analysis CLI.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    parser = None
+    args = _parse_fast(argv)
+    if args is None:
+        parser = _build_parser()
+        args = parser.parse_args(argv)
     
+    # The API (and boto3 behind it) is only imported once a command is going to run
     if args.command == "report":
+        from .api import generate_report
         report_path = generate_report(
             days_back=args.days,
             output_path=args.output,
@@ -38,10 +108,11 @@ def main(argv: Optional[List[str]] = None) -> int:
         print(f"Report generated: {report_path}")
         return 0
     elif args.command == "analyze":
+        from .api import analyze_costs
         result = analyze_costs(threshold=args.threshold, days_back=args.days)
         return 0 if result else 1
     else:
-        parser.print_help()
+        (parser or _build_parser()).print_help()
         return 1
 
 
@@ -4,13 +4,17 @@ Domain Ports - Interfaces for the Nova Cost application
 This module defines the abstract interfaces (ports) that connect the domain
 to external systems and UI components. Following Hexagonal Architecture principles,
 these interfaces ensure the domain logic remains isolated from implementation details.
+
+Ports are Protocols, so any object with matching methods satisfies them (the AWS
+adapter serves as both cost data and service metadata port). Adapters that subclass
+a port still have missing methods reported when they are instantiated.
 """
-from abc import ABC, abstractmethod
+from abc import abstractmethod
 from datetime import date
-from typing import Dict, List, Tuple, Any, Optional
+from typing import Dict, List, Tuple, Any, Optional, Protocol
 
 
-class CostDataPort(ABC):
+class CostDataPort(Protocol):
     """Port for retrieving cost data from a cost tracking system"""
     
     @abstractmethod
@@ -24,7 +28,7 @@ class CostDataPort(ABC):
         Returns:
             List of (date, cost, service_name) tuples
         """
-        pass
+        ...
     
     @abstractmethod
     def get_service_costs(self, days_back: int = 30) -> List[Dict[str, Any]]:
@@ -37,7 +41,7 @@ class CostDataPort(ABC):
         Returns:
             List of dictionaries with service cost details
         """
-        pass
+        ...
     
     @abstractmethod
     def get_date_range(self, days_back: int = 30) -> Tuple[str, str]:
@@ -50,10 +54,10 @@ class CostDataPort(ABC):
         Returns:
             Tuple of (start_date, end_date) as ISO format strings
         """
-        pass
+        ...
 
 
-class ReportGeneratorPort(ABC):
+class ReportGeneratorPort(Protocol):
     """Port for generating reports from cost data"""
     
     @abstractmethod
@@ -66,7 +70,7 @@ class ReportGeneratorPort(ABC):
             start_date: Start date in YYYY-MM-DD format
             end_date: End date in YYYY-MM-DD format
         """
-        pass
+        ...
     
     @abstractmethod
     def add_daily_costs(self, daily_costs: List[Tuple[str, float, str]]) -> None:
@@ -76,7 +80,7 @@ class ReportGeneratorPort(ABC):
         Args:
             daily_costs: List of (date, cost, service) tuples
         """
-        pass
+        ...
     
     @abstractmethod
     def add_total_cost(self, total_cost: float) -> None:
@@ -86,7 +90,7 @@ class ReportGeneratorPort(ABC):
         Args:
             total_cost: Total cost amount
         """
-        pass
+        ...
     
     @abstractmethod
     def generate_report(self, output_path: Optional[str] = None) -> str:
@@ -99,10 +103,10 @@ class ReportGeneratorPort(ABC):
         Returns:
             Path to the generated report
         """
-        pass
+        ...
 
 
-class ServiceMetadataPort(ABC):
+class ServiceMetadataPort(Protocol):
     """Port for retrieving service metadata"""
     
     @abstractmethod
@@ -113,7 +117,7 @@ class ServiceMetadataPort(ABC):
         Returns:
             Dictionary mapping service names to console URLs
         """
-        pass
+        ...
     
     @abstractmethod
     def get_service_relationships(self) -> Dict[str, str]:
@@ -123,7 +127,7 @@ class ServiceMetadataPort(ABC):
         Returns:
             Dictionary mapping services to their parent services
         """
-        pass
+        ...
     
     @abstractmethod
     def get_service_resources(self) -> Dict[str, Dict]:
@@ -133,4 +137,4 @@ class ServiceMetadataPort(ABC):
         Returns:
             Nested dictionary of service resources
         """
-        pass
+        ...
@@ -4,44 +4,130 @@ Handles interactions with AWS Cost Explorer API
 """
 import boto3
 import datetime
-from typing import Dict, List, Tuple, Any, Optional
+import functools
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from operator import itemgetter
+from types import MappingProxyType
+from botocore.config import Config
+from pathlib import Path
+from typing import Dict, List, Mapping, Tuple, Any, Optional
+
+from ..utils.aws_identity import credential_scope
+from ..utils.botocore_json import use_fast_json_parser
+from ..utils.text_match import KeywordMatcher
+
+logger = logging.getLogger(__name__)
+
+# Service name fragments in priority order, with the details shown for each;
+# the first fragment in this order that occurs anywhere in the name wins
+_DETAILS_MAP = {
+    "OpenSearch": "Search/OUs, Indexing/DUs, Storage",
+    "Skill Builder": "Subscription",
+    "Cost Explorer": "API usage charges",
+    "Bedrock": "Model inference, tokens, API usage",
+    "Claude": "Usage charges",
+}
+_DETAILS_MATCHER = KeywordMatcher(_DETAILS_MAP)
+
+# Default service consolidation map (service -> parent service)
+_SERVICE_CONSOLIDATION = MappingProxyType({
+    "Claude 3.7 Sonnet": "Amazon Bedrock",
+    "Claude 3.5 Sonnet": "Amazon Bedrock",
+    "Claude 3 Haiku": "Amazon Bedrock", 
+    "Claude 3 Opus": "Amazon Bedrock"
+})
+
+# Service paths with 2025 AWS Console URLs
+_SERVICE_PATHS = MappingProxyType({
+    # AWS Billing & Cost Management
+    "AWS Cost Explorer": "https://us-east-1.console.aws.amazon.com/cost-management/home#/cost-explorer",
+    "Cost Explorer": "https://us-east-1.console.aws.amazon.com/cost-management/home#/cost-explorer",
+    "AWS Budgets": "https://us-east-1.console.aws.amazon.com/billing/home#/budgets",
+    "Tax": "https://us-east-1.console.aws.amazon.com/billing/home#/bills",
+
+    # AWS Services
+    "OpenSearch": "https://us-east-1.console.aws.amazon.com/aos/home#/opensearch/domains",
+    "Bedrock": "https://us-east-1.console.aws.amazon.com/bedrock/home#/foundation-models",
+    "Claude": "https://us-east-1.console.aws.amazon.com/bedrock/home#/foundation-models",
+    "DynamoDB": "https://us-east-1.console.aws.amazon.com/dynamodbv2/home#tables",
+    "Lambda": "https://us-east-1.console.aws.amazon.com/lambda/home#/functions",
+    "EC2": "https://us-east-1.console.aws.amazon.com/ec2/home#Instances",
+    "S3": "https://s3.console.aws.amazon.com/s3/buckets",
+    "CloudWatch": "https://us-east-1.console.aws.amazon.com/cloudwatch/home#home:",
+    "Skill Builder": "https://us-east-1.console.aws.amazon.com/skillbuilder/home#/subscriptions",
+    "Marketplace": "https://aws.amazon.com/marketplace/management/subscriptions/metrics"
+})
+
+# Sample service resources for cancellation
+_SERVICE_RESOURCES = MappingProxyType({
+    "Amazon OpenSearch Service": {
+        "resources": [
+            {
+                "name": "production-search",
+                "url": "https://us-east-1.console.aws.amazon.com/aos/home#/opensearch/domains",
+                "instructions": "Find \"production-search\" in the list, click \"Delete\" and confirm deletion"
+            },
+            {
+                "name": "development-search",
+                "url": "https://us-east-1.console.aws.amazon.com/aos/home#/opensearch/domains",
+                "instructions": "Find \"development-search\" in the list, click \"Delete\" and confirm deletion"
+            }
+        ]
+    },
+    "Amazon Bedrock": {
+        "resources": [
+            {
+                "name": "Claude 3.5 Sonnet",
+                "url": "https://us-east-1.console.aws.amazon.com/bedrock/home#/foundation-models",
+                "instructions": "Click \"Model access\" tab, find \"Claude 3.5 Sonnet\", click \"Edit access\" and disable the model"
+            }
+        ]
+    }
+})
+
+
+@functools.lru_cache(maxsize=32)
+def _date_range(days_back: int, today_ordinal: int) -> Tuple[str, str]:
+    """Format the (start, end) dates of a window ending on the given day, once per day"""
+    end_date = datetime.date.fromordinal(today_ordinal)
+    start_date = end_date - datetime.timedelta(days=days_back)
+    return start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d')
 
 
 class AWSCostMonitor:
     """Monitor AWS costs using the Cost Explorer API"""
     
+    # On-disk cache for Cost Explorer responses (every CE request is billed),
+    # with one subdirectory per profile, region and set of credentials
+    _CE_CACHE_DIR = Path.home() / '.cache' / 'nova_cost' / 'monitor'
+    
+    # Cached responses are reused for six hours, judged by the file's mtime
+    _CE_CACHE_TTL = 6 * 3600
+    
     def __init__(self):
         """Initialize the AWS Cost Monitor"""
-        self.ce_client = boto3.client('ce')
-        
-        # Default service consolidation map
-        self._service_consolidation = {
-            "Claude 3.7 Sonnet": "Amazon Bedrock",
-            "Claude 3.5 Sonnet": "Amazon Bedrock",
-            "Claude 3 Haiku": "Amazon Bedrock", 
-            "Claude 3 Opus": "Amazon Bedrock"
-        }
+        # Keep-alive connections, a pool wide enough for concurrent queries, and adaptive
+        # retries so throttled Cost Explorer calls back off instead of failing.
+        # Responses are decoded with orjson when it is installed.
+        self.session = boto3.Session()
+        self.ce_client = use_fast_json_parser(self.session.client('ce', config=Config(
+            tcp_keepalive=True,
+            max_pool_connections=50,
+            retries={'max_attempts': 5, 'mode': 'adaptive'},
+            connect_timeout=5,
+            read_timeout=30
+        )))
         
-        # Service paths with 2025 AWS Console URLs
-        self._service_paths = {
-            # AWS Billing & Cost Management
-            "AWS Cost Explorer": "https://us-east-1.console.aws.amazon.com/cost-management/home#/cost-explorer",
-            "Cost Explorer": "https://us-east-1.console.aws.amazon.com/cost-management/home#/cost-explorer",
-            "AWS Budgets": "https://us-east-1.console.aws.amazon.com/billing/home#/budgets",
-            "Tax": "https://us-east-1.console.aws.amazon.com/billing/home#/bills",
-            
-            # AWS Services
-            "OpenSearch": "https://us-east-1.console.aws.amazon.com/aos/home#/opensearch/domains",
-            "Bedrock": "https://us-east-1.console.aws.amazon.com/bedrock/home#/foundation-models",
-            "Claude": "https://us-east-1.console.aws.amazon.com/bedrock/home#/foundation-models",
-            "DynamoDB": "https://us-east-1.console.aws.amazon.com/dynamodbv2/home#tables",
-            "Lambda": "https://us-east-1.console.aws.amazon.com/lambda/home#/functions",
-            "EC2": "https://us-east-1.console.aws.amazon.com/ec2/home#Instances",
-            "S3": "https://s3.console.aws.amazon.com/s3/buckets",
-            "CloudWatch": "https://us-east-1.console.aws.amazon.com/cloudwatch/home#home:",
-            "Skill Builder": "https://us-east-1.console.aws.amazon.com/skillbuilder/home#/subscriptions",
-            "Marketplace": "https://aws.amazon.com/marketplace/management/subscriptions/metrics"
-        }
+        # (expiry time, (daily, service) totals) per date range, shared by the daily and
+        # service views and kept no longer than the disk cache's _CE_CACHE_TTL
+        self._raw_totals: Dict[Tuple[str, str], Tuple[float, Tuple[Dict[str, float], Dict[str, float]]]] = {}
+        self._raw_totals_lock = threading.Lock()
+        self._raw_range_locks: Dict[Tuple[str, str], threading.Lock] = {}
     
     def get_date_range(self, days_back: int = 30) -> Tuple[str, str]:
         """
@@ -53,43 +139,135 @@ class AWSCostMonitor:
         Returns:
             Tuple of (start_date, end_date) as ISO format strings
         """
-        end_date = datetime.date.today()
-        start_date = end_date - datetime.timedelta(days=days_back)
-        return start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d')
+        return _date_range(days_back, datetime.date.today().toordinal())
     
-    def get_daily_costs(self, days_back: int = 30) -> List[Tuple[str, float, str]]:
+    @functools.cached_property
+    def _ce_cache_dir(self) -> Path:
+        """Disk cache directory for this monitor's profile, region and credentials"""
+        return self._CE_CACHE_DIR / credential_scope(self.session)
+    
+    def _cached_ce(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
-        Get daily costs for the specified number of days
+        Call get_cost_and_usage for every page through the on-disk response cache
+        
+        All pages are cached together under the key of the first request, so a
+        NextPageToken from an earlier session is never replayed.
         
         Args:
-            days_back: Number of days to look back
+            params: Keyword arguments for get_cost_and_usage, without NextPageToken
             
         Returns:
-            List of (date, cost, service_name) tuples
+            The response pages, served from the cache when younger than _CE_CACHE_TTL
         """
-        start_date, end_date = self.get_date_range(days_back)
+        key = hashlib.blake2b(json.dumps(params, sort_keys=True).encode()).hexdigest()
+        cache_dir = self._ce_cache_dir
+        cache_file = cache_dir / f"{key}.json"
+        try:
+            if time.time() - cache_file.stat().st_mtime < self._CE_CACHE_TTL:
+                with open(cache_file, 'r', encoding='utf-8') as f:
+                    pages = json.load(f)
+                if isinstance(pages, list):
+                    return pages
+        except (OSError, ValueError):
+            pass
+        
+        pages = []
+        request = dict(params)
+        while True:
+            response = self.ce_client.get_cost_and_usage(**request)
+            pages.append({k: v for k, v in response.items() if k != 'ResponseMetadata'})
+            next_token = response.get('NextPageToken')
+            if not next_token:
+                break
+            request['NextPageToken'] = next_token
         
         try:
-            response = self.ce_client.get_cost_and_usage(
-                TimePeriod={
-                    'Start': start_date,
-                    'End': end_date
-                },
-                Granularity='DAILY',
-                Metrics=['BlendedCost']
-            )
-            
-            daily_costs = []
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(pages, f)
+            os.replace(tmp_file, cache_file)
+        except (OSError, TypeError, ValueError):
+            pass
+        
+        return pages
+    
+    def _fetch_raw(self, days_back: int = 30) -> Tuple[Dict[str, float], Dict[str, float]]:
+        """
+        Fetch daily and per-service totals with a single daily, service-grouped query
+        
+        Both rollups are built in one pass over the response pages, following
+        NextPageToken, and kept for the instance for up to _CE_CACHE_TTL seconds
+        so the daily and service views share one Cost Explorer request.
+        Concurrent callers asking for the same date range wait for a single fetch.
+        
+        Args:
+            days_back: Number of days to look back
+            
+        Returns:
+            Tuple of (cost per date, cost per service name)
+        """
+        date_range = self.get_date_range(days_back)
+        with self._raw_totals_lock:
+            cached = self._raw_totals.get(date_range)
+            range_lock = self._raw_range_locks.setdefault(date_range, threading.Lock())
+        if cached is not None and cached[0] > time.time():
+            return cached[1]
+        
+        with range_lock:
+            with self._raw_totals_lock:
+                cached = self._raw_totals.get(date_range)
+            if cached is not None and cached[0] > time.time():
+                return cached[1]
+            
+            totals = self._query_totals(*date_range)
+            with self._raw_totals_lock:
+                self._raw_totals[date_range] = (time.time() + self._CE_CACHE_TTL, totals)
+            return totals
+    
+    def _query_totals(self, start_date: str, end_date: str) -> Tuple[Dict[str, float], Dict[str, float]]:
+        """Run the service-grouped daily query for a date range and roll it up (see _fetch_raw)"""
+        params = {
+            'TimePeriod': {
+                'Start': start_date,
+                'End': end_date
+            },
+            'Granularity': 'DAILY',
+            'Metrics': ['BlendedCost'],
+            'GroupBy': [{'Type': 'DIMENSION', 'Key': 'SERVICE'}]
+        }
+        
+        daily_totals: Dict[str, float] = {}
+        service_totals: Dict[str, float] = {}
+        for response in self._cached_ce(params):
             for result in response['ResultsByTime']:
+                day_total = 0.0
+                for group in result['Groups']:
+                    cost = float(group['Metrics']['BlendedCost']['Amount'])
+                    service_name = group['Keys'][0]
+                    service_totals[service_name] = service_totals.get(service_name, 0.0) + cost
+                    day_total += cost
                 date = result['TimePeriod']['Start']
-                cost = float(result['Total']['BlendedCost']['Amount'])
-                daily_costs.append((date, cost, "AWS Services"))
+                daily_totals[date] = daily_totals.get(date, 0.0) + day_total
+        
+        return daily_totals, service_totals
+    
+    def get_daily_costs(self, days_back: int = 30) -> List[Tuple[str, float, str]]:
+        """
+        Get daily costs for the specified number of days
+        
+        Args:
+            days_back: Number of days to look back
             
-            return daily_costs
+        Returns:
+            List of (date, cost, service_name) tuples
+        """
+        try:
+            daily_totals = self._fetch_raw(days_back)[0]
+            return [(date, cost, "AWS Services") for date, cost in daily_totals.items()]
             
         except Exception as e:
-            print(f"Warning: Unable to access AWS Cost Explorer API: {str(e)}")
-            print("Using sample daily cost data instead.")
+            logger.warning("Unable to access AWS Cost Explorer API: %s. Using sample daily cost data instead.", e)
             
             # Return sample data when API access fails
             today = datetime.date.today()
@@ -120,40 +298,18 @@ class AWSCostMonitor:
         Returns:
             List of dictionaries with service cost details
         """
-        start_date, end_date = self.get_date_range(days_back)
-        
         try:
-            response = self.ce_client.get_cost_and_usage(
-                TimePeriod={
-                    'Start': start_date,
-                    'End': end_date
-                },
-                Granularity='MONTHLY',
-                Metrics=['BlendedCost'],
-                GroupBy=[{'Type': 'DIMENSION', 'Key': 'SERVICE'}]
-            )
+            service_totals = self._fetch_raw(days_back)[1]
             
             services = []
-            for group in response['ResultsByTime'][0]['Groups']:
-                service_name = group['Keys'][0]
-                cost = float(group['Metrics']['BlendedCost']['Amount'])
-                
+            for service_name, cost in service_totals.items():
                 # Skip very small costs
                 if cost < 0.01:
                     continue
                 
                 # Determine service details based on service name
-                details = "Usage charges"
-                if "OpenSearch" in service_name:
-                    details = "Search/OUs, Indexing/DUs, Storage"
-                elif "Skill Builder" in service_name:
-                    details = "Subscription"
-                elif "Cost Explorer" in service_name:
-                    details = "API usage charges"
-                elif "Bedrock" in service_name:
-                    details = "Model inference, tokens, API usage"
-                elif "Claude" in service_name:
-                    details = "Usage charges"
+                token = _DETAILS_MATCHER.first(service_name)
+                details = _DETAILS_MAP[token] if token else "Usage charges"
                 
                 services.append({
                     "service": service_name,
@@ -163,13 +319,12 @@ class AWSCostMonitor:
                 })
             
             # Sort services by cost (descending)
-            services.sort(key=lambda x: x["cost"], reverse=True)
+            services.sort(key=itemgetter("cost"), reverse=True)
             
             return services
             
         except Exception as e:
-            print(f"Warning: Unable to access AWS Cost Explorer API: {str(e)}")
-            print("Using sample cost data instead.")
+            logger.warning("Unable to access AWS Cost Explorer API: %s. Using sample cost data instead.", e)
             
             # Return sample data when API access fails
             return [
@@ -182,54 +337,45 @@ class AWSCostMonitor:
                 {"service": "Amazon S3", "cost": 0.01, "details": "Storage, requests", "status": "Active"}
             ]
     
-    def get_service_paths(self) -> Dict[str, str]:
+    def get_report_bundle(self, days_back: int = 30) -> Dict[str, Any]:
+        """
+        Get the cost data a report needs from a single Cost Explorer query
+        
+        Args:
+            days_back: Number of days to look back
+            
+        Returns:
+            Dictionary with 'services' (as from get_service_costs) and
+            'daily_costs' (as from get_daily_costs)
+        """
+        return {
+            "services": self.get_service_costs(days_back),
+            "daily_costs": self.get_daily_costs(days_back)
+        }
+    
+    def get_service_paths(self) -> Mapping[str, str]:
         """
         Get AWS Console paths for services
         
         Returns:
-            Dictionary mapping service names to AWS console URLs
+            Read-only mapping of service names to AWS console URLs
         """
-        return self._service_paths
+        return _SERVICE_PATHS
     
-    def get_service_relationships(self) -> Dict[str, str]:
+    def get_service_relationships(self) -> Mapping[str, str]:
         """
         Get service relationships for consolidation
         
         Returns:
-            Dictionary mapping services to their parent services
+            Read-only mapping of services to their parent services
         """
-        return self._service_consolidation
+        return _SERVICE_CONSOLIDATION
     
-    def get_service_resources(self) -> Dict[str, Dict]:
+    def get_service_resources(self) -> Mapping[str, Mapping[str, Any]]:
         """
         Get detailed resources for each service
         
         Returns:
-            Nested dictionary of service resources
+            Read-only nested mapping of service resources (shared; do not modify)
         """
-        # Sample service resources for cancellation
-        return {
-            "Amazon OpenSearch Service": {
-                "resources": [
-                    {
-                        "name": "production-search",
-                        "url": "https://us-east-1.console.aws.amazon.com/aos/home#/opensearch/domains",
-                        "instructions": "Find \"production-search\" in the list, click \"Delete\" and confirm deletion"
-                    },
-                    {
-                        "name": "development-search",
-                        "url": "https://us-east-1.console.aws.amazon.com/aos/home#/opensearch/domains",
-                        "instructions": "Find \"development-search\" in the list, click \"Delete\" and confirm deletion"
-                    }
-                ]
-            },
-            "Amazon Bedrock": {
-                "resources": [
-                    {
-                        "name": "Claude 3.5 Sonnet",
-                        "url": "https://us-east-1.console.aws.amazon.com/bedrock/home#/foundation-models",
-                        "instructions": "Click \"Model access\" tab, find \"Claude 3.5 Sonnet\", click \"Edit access\" and disable the model"
-                    }
-                ]
-            }
-        }
+        return _SERVICE_RESOURCES
@@ -4,9 +4,62 @@ Generates interactive HTML reports for AWS cost data
 """
 import os
 import datetime
-from typing import Dict, List, Any, Tuple, Optional
+import gzip
+import hashlib
+from dataclasses import dataclass, field, fields
+from typing import Dict, List, Mapping, Any, Tuple, Optional
 from pathlib import Path
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import ChoiceLoader, Environment, FileSystemLoader, ModuleLoader
+
+from ..utils.jinja_cache import LazyFileSystemBytecodeCache
+
+# Template and default report locations, resolved once at import
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TEMPLATE_DIR = os.path.join(PACKAGE_DIR, 'templates')
+REPORTS_DIR = os.path.join(os.path.dirname(os.path.dirname(PACKAGE_DIR)), 'data', 'reports')
+
+# Templates precompiled by `python -m nova_cost.build_templates` skip lexing and parsing
+COMPILED_TEMPLATE_DIR = os.path.join(PACKAGE_DIR, 'compiled_templates')
+
+# Options for the shared environment, also used when precompiling the templates
+ENVIRONMENT_OPTIONS = {
+    'auto_reload': False,
+    'cache_size': 400
+}
+
+# Jinja2 environment shared by all report generators. Compiled template bytecode is
+# persisted across runs (the cache directory is created on the first write), and
+# templates are not re-checked for changes on each render.
+if os.path.isdir(COMPILED_TEMPLATE_DIR):
+    # Templates missing from the compiled set are still loaded from source
+    _loader = ChoiceLoader([ModuleLoader(COMPILED_TEMPLATE_DIR), FileSystemLoader(TEMPLATE_DIR)])
+else:
+    _loader = FileSystemLoader(TEMPLATE_DIR)
+_ENV = Environment(loader=_loader, bytecode_cache=LazyFileSystemBytecodeCache(), **ENVIRONMENT_OPTIONS)
+
+# Buffer size for writing rendered reports, well above io.DEFAULT_BUFFER_SIZE
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Rendered template fragments joined per write, and the level for the .gz copy
+_RENDER_CHUNK_ITEMS = 64
+_GZIP_LEVEL = 6
+
+
+@dataclass(slots=True)
+class ReportData:
+    """Data collected for one HTML report"""
+    service_costs: List[Dict[str, Any]] = field(default_factory=list)
+    daily_costs: List[Tuple[str, float, str]] = field(default_factory=list)
+    total_cost: float = 0
+    start_date: str = ''
+    end_date: str = ''
+    service_paths: Mapping[str, str] = field(default_factory=dict)
+    service_resources: Mapping[str, Mapping[str, Any]] = field(default_factory=dict)
+    service_relationships: Mapping[str, str] = field(default_factory=dict)
+    
+    def as_context(self) -> Dict[str, Any]:
+        """Template variables for this data (a shallow mapping, unlike dataclasses.asdict)"""
+        return {f.name: getattr(self, f.name) for f in fields(self)}
 
 
 class HTMLReportGenerator:
@@ -14,21 +67,12 @@ class HTMLReportGenerator:
     
     def __init__(self):
         """Initialize the HTML Report Generator"""
-        self.report_data = {
-            'service_costs': [],
-            'daily_costs': [],
-            'total_cost': 0,
-            'start_date': '',
-            'end_date': '',
-            'service_paths': {},
-            'service_resources': {},
-            'service_relationships': {}
-        }
+        self.report_data = ReportData()
         
-        # Set up Jinja2 environment
-        package_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        self.template_dir = os.path.join(package_dir, 'templates')
-        self.env = Environment(loader=FileSystemLoader(self.template_dir))
+        # Use the shared Jinja2 environment and load the template once
+        self.template_dir = TEMPLATE_DIR
+        self.env = _ENV
+        self.template = self.env.get_template('report_template.html')
     
     def add_service_costs(self, services: List[Dict[str, Any]], start_date: str, end_date: str) -> None:
         """
@@ -39,9 +83,9 @@ class HTMLReportGenerator:
             start_date: Start date in YYYY-MM-DD format
             end_date: End date in YYYY-MM-DD format
         """
-        self.report_data['service_costs'] = services
-        self.report_data['start_date'] = start_date
-        self.report_data['end_date'] = end_date
+        self.report_data.service_costs = services
+        self.report_data.start_date = start_date
+        self.report_data.end_date = end_date
     
     def add_daily_costs(self, daily_costs: List[Tuple[str, float, str]]) -> None:
         """
@@ -50,7 +94,7 @@ class HTMLReportGenerator:
         Args:
             daily_costs: List of (date, cost, service) tuples
         """
-        self.report_data['daily_costs'] = daily_costs
+        self.report_data.daily_costs = daily_costs
     
     def add_total_cost(self, total_cost: float) -> None:
         """
@@ -59,34 +103,34 @@ class HTMLReportGenerator:
         Args:
             total_cost: Total cost amount
         """
-        self.report_data['total_cost'] = total_cost
+        self.report_data.total_cost = total_cost
     
-    def add_service_paths(self, service_paths: Dict[str, str]) -> None:
+    def add_service_paths(self, service_paths: Mapping[str, str]) -> None:
         """
         Add service paths for direct links
         
         Args:
             service_paths: Dictionary mapping service names to console URLs
         """
-        self.report_data['service_paths'] = service_paths
+        self.report_data.service_paths = service_paths
     
-    def add_service_resources(self, service_resources: Dict[str, Dict]) -> None:
+    def add_service_resources(self, service_resources: Mapping[str, Mapping[str, Any]]) -> None:
         """
         Add service resources for cancellation links
         
         Args:
             service_resources: Nested dictionary of service resources
         """
-        self.report_data['service_resources'] = service_resources
+        self.report_data.service_resources = service_resources
     
-    def add_service_relationships(self, service_relationships: Dict[str, str]) -> None:
+    def add_service_relationships(self, service_relationships: Mapping[str, str]) -> None:
         """
         Add service relationships for consolidation
         
         Args:
             service_relationships: Dictionary mapping services to parent services
         """
-        self.report_data['service_relationships'] = service_relationships
+        self.report_data.service_relationships = service_relationships
     
     def generate_html_report(self, output_path: Optional[str] = None) -> str:
         """
@@ -105,24 +149,26 @@ class HTMLReportGenerator:
             os.makedirs(os.path.dirname(os.path.abspath(report_path)), exist_ok=True)
         else:
             # Default path in data/reports directory
-            base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-            reports_dir = os.path.join(base_dir, 'data', 'reports')
-            os.makedirs(reports_dir, exist_ok=True)
+            os.makedirs(REPORTS_DIR, exist_ok=True)
             
             # Generate report filename with today's date
             today = datetime.date.today().strftime('%Y-%m-%d')
             report_filename = f'aws_cost_report_{today}.html'
-            report_path = os.path.join(reports_dir, report_filename)
-        
-        # Get the template
-        template = self.env.get_template('report_template.html')
-        
-        # Render the template with data
-        html_content = template.render(**self.report_data)
+            report_path = os.path.join(REPORTS_DIR, report_filename)
         
-        # Write the HTML to file
-        with open(report_path, 'w') as f:
-            f.write(html_content)
+        # Stream the rendered template to disk instead of building the whole page in memory.
+        # A gzip copy and a SHA-256 ETag are written alongside it for serving the report.
+        stream = self.template.stream(**self.report_data.as_context())
+        stream.enable_buffering(size=_RENDER_CHUNK_ITEMS)
+        digest = hashlib.sha256()
+        with open(report_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f, \
+                gzip.open(f'{report_path}.gz', 'wb', compresslevel=_GZIP_LEVEL) as gz:
+            for chunk in stream:
+                data = chunk.encode('utf-8')
+                f.write(data)
+                gz.write(data)
+                digest.update(data)
+        Path(f'{report_path}.etag').write_text(digest.hexdigest())
         
         print(f"Report generated at: {report_path}")
         return report_path
@@ -8,6 +8,7 @@ import boto3
 import datetime
 import json
 import time
+from operator import itemgetter
 from typing import Dict, List, Any, Optional, Tuple
 import logging
 
@@ -303,7 +304,7 @@ class AWSBillingDetective:
                         region_costs.append({"region": region_code, "cost": cost})
             
             # Sort by cost descending and add to billing data
-            billing_data["regions_with_costs"] = sorted(region_costs, key=lambda x: x["cost"], reverse=True)
+            billing_data["regions_with_costs"] = sorted(region_costs, key=itemgetter("cost"), reverse=True)
             
             # Next, get costs by usage type for more details
             response_by_usage = ce.get_cost_and_usage(
@@ -341,7 +342,7 @@ class AWSBillingDetective:
                     if cost > 0.01:  # Ignore tiny costs
                         usage_costs.append({"usage_type": usage_type, "cost": cost})
             
-            billing_data["usage_types"] = sorted(usage_costs, key=lambda x: x["cost"], reverse=True)
+            billing_data["usage_types"] = sorted(usage_costs, key=itemgetter("cost"), reverse=True)
             
             return billing_data
             
@@ -0,0 +1,25 @@
+"""
+AWS identity - Tell apart the accounts and credentials a boto3 session uses
+"""
+import hashlib
+from typing import Any
+
+
+def credential_scope(session: Any) -> str:
+    """
+    Get a short id for the profile, region and access key of a session
+
+    Cached AWS responses are stored under this id, so switching AWS_PROFILE,
+    region or credentials never serves another account's data. The access key
+    is hashed, not stored, and no network call is made.
+
+    Args:
+        session: A boto3 Session
+
+    Returns:
+        Hex id that differs whenever the profile, region or access key differs
+    """
+    credentials = session.get_credentials()
+    access_key = credentials.access_key if credentials is not None else ''
+    identity = f"{session.profile_name}|{session.region_name}|{access_key}"
+    return hashlib.blake2b(identity.encode(), digest_size=8).hexdigest()
@@ -2,21 +2,21 @@
 AWS Resource Scanner - Utility to scan for AWS resources across regions and identify billing sources
 """
 import boto3
+import copy
 import datetime
 import time
 import concurrent.futures
 import os
 import json
-from pathlib import Path
-from dotenv import load_dotenv
 from typing import Dict, List, Tuple, Any, Optional
 import logging
 import urllib.parse
 from functools import lru_cache
 
+from .env import load_env
+
 # Load environment variables
-dotenv_path = Path(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))).joinpath('.env')
-load_dotenv(dotenv_path)
+load_env()
 
 logger = logging.getLogger(__name__)
 
@@ -118,6 +118,8 @@ class AWSResourceScanner:
         """Initialize the scanner with AWS session"""
         self.session = boto3.Session()
         self.regions = self._get_all_regions()
+        # Cancellation URLs by service name, built once per scanner
+        self._cancellation_urls = {}
         self.nova_sdk_token = os.getenv('NOVA_SDK_TOKEN')
         self.fallback_console_urls = {
             "AWS Cost Explorer": "https://console.aws.amazon.com/cost-management/home",
@@ -495,12 +497,22 @@ class AWSResourceScanner:
         """
         Get service-specific cancellation URLs for AWS console navigation
 
+        Results are cached per service name, since every report asks for the same services.
+        Reports keep and may modify the list, so every caller gets its own copy.
+
         Args:
             service_name: Name of the AWS service
 
         Returns:
             List of URLs with instructions for service cancellation
         """
+        urls = self._cancellation_urls.get(service_name)
+        if urls is None:
+            urls = self._cancellation_urls[service_name] = self._build_cancellation_urls(service_name)
+        return copy.deepcopy(urls)
+
+    def _build_cancellation_urls(self, service_name: str) -> List[Dict[str, Any]]:
+        """Build the cancellation URLs for a service (see get_service_specific_cancellation_urls)"""
         urls = []
 
         # List of pay-as-you-go services that need special handling
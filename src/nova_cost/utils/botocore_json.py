@@ -0,0 +1,64 @@
+"""
+Botocore JSON parsing - Decode JSON-protocol responses with orjson when available
+"""
+import logging
+from typing import Any, Dict
+
+from botocore.parsers import JSONParser, ResponseParserFactory
+
+logger = logging.getLogger(__name__)
+
+# orjson is optional; without it clients keep botocore's standard json parsing
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+class OrjsonJSONParser(JSONParser):
+    """JSONParser that decodes response bodies with orjson instead of json"""
+
+    def _parse_body_as_json(self, body_contents: bytes) -> Dict[str, Any]:
+        if not body_contents:
+            return {}
+        try:
+            return orjson.loads(body_contents)
+        except orjson.JSONDecodeError:
+            # Same as botocore: keep an unparseable body as the message
+            return {'message': body_contents.decode(self.DEFAULT_ENCODING)}
+
+
+class OrjsonResponseParserFactory(ResponseParserFactory):
+    """ResponseParserFactory that builds OrjsonJSONParser for the JSON protocol"""
+
+    def create_parser(self, protocol_name: str) -> Any:
+        if protocol_name == 'json':
+            return OrjsonJSONParser(**self._defaults)
+        return super().create_parser(protocol_name)
+
+
+def use_fast_json_parser(client: Any) -> Any:
+    """
+    Switch a JSON-protocol client (e.g. Cost Explorer) to orjson response parsing
+
+    botocore builds a fresh parser for every response from the endpoint's
+    response parser factory, so that factory is replaced. Responses in other
+    protocols are parsed as before, and a factory botocore may substitute in
+    future is left untouched.
+
+    Args:
+        client: A botocore/boto3 client
+
+    Returns:
+        The same client
+    """
+    endpoint = getattr(client, '_endpoint', None)
+    factory = getattr(endpoint, '_response_parser_factory', None)
+    if ORJSON_AVAILABLE and type(factory) is ResponseParserFactory:
+        fast_factory = OrjsonResponseParserFactory()
+        # Keep the timestamp/blob parser settings of the client's factory
+        fast_factory.set_parser_defaults(**factory._defaults)
+        endpoint._response_parser_factory = fast_factory
+        logger.debug("Using orjson for %s responses", client.meta.service_model.service_name)
+    return client
@@ -0,0 +1,33 @@
+"""
+Environment loading - Load the project .env file once per process
+"""
+import functools
+import logging
+from pathlib import Path
+from typing import Optional
+
+from dotenv import load_dotenv
+
+logger = logging.getLogger(__name__)
+
+# The .env file lives at the project root (src/nova_cost/utils/env.py -> parents[3])
+DOTENV_PATH = Path(__file__).resolve().parents[3] / '.env'
+
+
+@functools.lru_cache(maxsize=1)
+def load_env() -> Optional[Path]:
+    """
+    Load environment variables from the project .env file
+
+    Only the first call reads the file; later calls return the cached result.
+
+    Returns:
+        Path of the loaded .env file, or None if there is none
+    """
+    if not DOTENV_PATH.exists():
+        logger.debug(f"No .env file found at {DOTENV_PATH}")
+        return None
+
+    load_dotenv(dotenv_path=DOTENV_PATH)
+    logger.debug(f"Loaded environment variables from: {DOTENV_PATH}")
+    return DOTENV_PATH
@@ -0,0 +1,35 @@
+"""
+Jinja bytecode cache - Persist compiled templates in a per-user directory created on demand
+"""
+import logging
+import os
+
+from jinja2 import FileSystemBytecodeCache
+from jinja2.bccache import Bucket
+
+logger = logging.getLogger(__name__)
+
+# Compiled template bytecode lives under the user's cache directory
+BYTECODE_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'nova_cost', 'jinja')
+
+
+class LazyFileSystemBytecodeCache(FileSystemBytecodeCache):
+    """FileSystemBytecodeCache that creates its directory on the first write, not at import"""
+
+    def __init__(self, directory: str = BYTECODE_CACHE_DIR):
+        super().__init__(directory=directory, pattern='%s.cache')
+
+    def load_bytecode(self, bucket: Bucket) -> None:
+        try:
+            super().load_bytecode(bucket)
+        except OSError as e:
+            # e.g. a path component that is not a directory; compile the template instead
+            logger.debug(f"Could not read Jinja bytecode cache: {e}")
+
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        try:
+            os.makedirs(self.directory, mode=0o700, exist_ok=True)
+            super().dump_bytecode(bucket)
+        except OSError as e:
+            # The template still renders; it is just compiled again next run
+            logger.debug(f"Could not write Jinja bytecode cache: {e}")
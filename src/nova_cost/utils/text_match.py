@@ -0,0 +1,38 @@
+"""
+Text matching - Find the highest-priority keyword that occurs in a name
+"""
+from typing import Iterable, Optional
+
+
+class KeywordMatcher:
+    """Pick the highest-priority keyword occurring anywhere in a string"""
+
+    __slots__ = ('_keywords',)
+
+    def __init__(self, keywords: Iterable[str]):
+        """
+        Store the keywords for lookup
+
+        Args:
+            keywords: Keywords in priority order, highest first
+        """
+        self._keywords = tuple(keywords)
+
+    def first(self, text: str) -> Optional[str]:
+        """
+        Get the highest-priority keyword found in text
+
+        Keywords are checked one at a time in priority order rather than with a
+        single regex alternation: a non-overlapping scan would consume a longer,
+        lower-priority keyword and miss a higher-priority one nested inside it.
+
+        Args:
+            text: String to search, e.g. a service name
+
+        Returns:
+            The keyword, or None if none occurs
+        """
+        for keyword in self._keywords:
+            if keyword in text:
+                return keyword
+        return None
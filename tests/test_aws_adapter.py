@@ -5,12 +5,14 @@ These tests ensure that the AWS adapter correctly implements the CostDataPort
 interface and properly handles fallback to sample data when AWS credentials are invalid.
 """
 import os
+import tempfile
 import unittest
+from pathlib import Path
 from unittest.mock import patch, MagicMock
 import boto3
 from botocore.exceptions import ClientError
 
-from src.nova_cost.adapters.aws_cost_adapter import AWSCostAdapter
+from src.nova_cost.adapters.aws_cost_adapter import AWSCostAdapter, AccessDeniedError, RetryableCEError
 
 
 class TestAWSCostAdapter(unittest.TestCase):
@@ -40,11 +42,11 @@ class TestAWSCostAdapter(unittest.TestCase):
             'ResultsByTime': [{
                 'Groups': [
                     {
-                        'Keys': ['AWS Lambda'],
+                        'Keys': ['AWS Lambda', 'Usage'],
                         'Metrics': {'BlendedCost': {'Amount': '10.50'}}
                     },
                     {
-                        'Keys': ['Amazon S3'],
+                        'Keys': ['Amazon S3', 'Usage'],
                         'Metrics': {'BlendedCost': {'Amount': '5.25'}}
                     }
                 ]
@@ -134,6 +136,182 @@ class TestAWSCostAdapter(unittest.TestCase):
             self.assertRegex(date, r'^\d{4}-\d{2}-\d{2}$')
             self.assertGreaterEqual(cost, 0)
 
+    
+    def test_ce_call_caches_completed_windows(self):
+        """Test that Cost Explorer responses for past windows are served from cache"""
+        mock_ce = MagicMock()
+        mock_ce.get_cost_and_usage.return_value = {
+            'ResultsByTime': [],
+            'ResponseMetadata': {'RequestId': 'abc'}
+        }
+        self.adapter.ce_client = mock_ce
+        params = {
+            'TimePeriod': {'Start': '2025-01-01', 'End': '2025-02-01'},
+            'Granularity': 'MONTHLY',
+            'Metrics': ['BlendedCost']
+        }
+        
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with patch.object(AWSCostAdapter, '_CE_CACHE_DIR', Path(cache_dir)):
+                first = self.adapter._ce_call('get_cost_and_usage', **params)
+                second = self.adapter._ce_call('get_cost_and_usage', **params)
+                
+                # A fresh adapter should be served from the on-disk cache
+                other = AWSCostAdapter()
+                other.ce_client = mock_ce
+                third = other._ce_call('get_cost_and_usage', **params)
+        
+        self.assertEqual(mock_ce.get_cost_and_usage.call_count, 1)
+        self.assertEqual(first, {'ResultsByTime': []})
+        self.assertEqual(second, first)
+        self.assertEqual(third, first)
+
+    
+    def test_ce_cache_is_scoped_to_credentials(self):
+        """Test that cached Cost Explorer responses are not shared across accounts or profiles"""
+        mock_ce = MagicMock()
+        mock_ce.get_cost_and_usage.return_value = {'ResultsByTime': []}
+        params = {
+            'TimePeriod': {'Start': '2025-01-01', 'End': '2025-02-01'},
+            'Granularity': 'MONTHLY',
+            'Metrics': ['BlendedCost']
+        }
+        
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with patch.object(AWSCostAdapter, '_CE_CACHE_DIR', Path(cache_dir)):
+                with patch('src.nova_cost.adapters.aws_cost_adapter.credential_scope', return_value='account-a'):
+                    self.adapter.ce_client = mock_ce
+                    self.adapter._ce_call('get_cost_and_usage', **params)
+                
+                with patch('src.nova_cost.adapters.aws_cost_adapter.credential_scope', return_value='account-b'):
+                    other = AWSCostAdapter()
+                    other.ce_client = mock_ce
+                    other._ce_call('get_cost_and_usage', **params)
+        
+        self.assertEqual(mock_ce.get_cost_and_usage.call_count, 2)
+
+    
+    def test_daily_service_breakdown(self):
+        """Test that the daily breakdown names the top services by cost with and without pandas"""
+        results_by_time = [
+            {
+                'TimePeriod': {'Start': '2025-04-01'},
+                'Groups': [
+                    {'Keys': [name], 'Metrics': {'BlendedCost': {'Amount': amount}}}
+                    for name, amount in [('A', '1.00'), ('B', '5.00'), ('C', '0'), ('D', '2.00'), ('E', '3.00')]
+                ]
+            },
+            {'TimePeriod': {'Start': '2025-04-02'}, 'Groups': []}
+        ]
+        expected = {
+            '2025-04-01': 'B ($5.00), E ($3.00), D ($2.00), +1 more',
+            '2025-04-02': 'No significant costs'
+        }
+        
+        self.assertEqual(self.adapter._get_daily_service_breakdown(results_by_time), expected)
+        with patch('src.nova_cost.adapters.aws_cost_adapter.PANDAS_AVAILABLE', False):
+            self.assertEqual(self.adapter._get_daily_service_breakdown(results_by_time), expected)
+
+    
+    def test_get_cost_and_usage_follows_pagination(self):
+        """Test that all pages are fetched and groups split across pages are merged"""
+        def group(name):
+            return {'Keys': [name], 'Metrics': {'BlendedCost': {'Amount': '1.00'}}}
+        
+        mock_ce = MagicMock()
+        mock_ce.get_cost_and_usage.side_effect = [
+            {
+                'ResultsByTime': [{'TimePeriod': {'Start': '2025-01-01'}, 'Groups': [group('A')]}],
+                'NextPageToken': 'page-2'
+            },
+            {
+                'ResultsByTime': [{'TimePeriod': {'Start': '2025-01-01'}, 'Groups': [group('B')]}]
+            }
+        ]
+        self.adapter.ce_client = mock_ce
+        
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with patch.object(AWSCostAdapter, '_CE_CACHE_DIR', Path(cache_dir)):
+                response = self.adapter._get_cost_and_usage(
+                    TimePeriod={'Start': '2025-01-01', 'End': '2025-02-01'},
+                    Granularity='MONTHLY',
+                    Metrics=['BlendedCost'],
+                    GroupBy=[{'Type': 'DIMENSION', 'Key': 'SERVICE'}]
+                )
+        
+        self.assertEqual(mock_ce.get_cost_and_usage.call_count, 2)
+        self.assertEqual(mock_ce.get_cost_and_usage.call_args.kwargs['NextPageToken'], 'page-2')
+        self.assertEqual(len(response['ResultsByTime']), 1)
+        self.assertEqual([g['Keys'][0] for g in response['ResultsByTime'][0]['Groups']], ['A', 'B'])
+
+    
+    def test_dimension_services_skip_zero_cost(self):
+        """Test that dimension-only services are added only when a filtered query finds a positive cost"""
+        def group(name, amount):
+            return {'Keys': [name], 'Metrics': {'BlendedCost': {'Amount': amount}}}
+        
+        mock_ce = MagicMock()
+        mock_ce.get_dimension_values.return_value = {'DimensionValues': [
+            {'Value': 'AWS Lambda'}, {'Value': 'Amazon Polly'}, {'Value': 'AWS Glue'}, {'Value': 'Amazon SNS'}
+        ]}
+        mock_ce.get_cost_and_usage.return_value = {'ResultsByTime': [{
+            'TimePeriod': {'Start': '2025-01-01'},
+            'Groups': [group('Amazon Polly', '2.50'), group('AWS Glue', '0')]
+        }]}
+        self.adapter.ce_client = mock_ce
+        
+        services = []
+        service_set = set()
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with patch.object(AWSCostAdapter, '_CE_CACHE_DIR', Path(cache_dir)):
+                self.adapter._add_dimension_services(
+                    services, service_set, {'AWS Lambda': 0.0}, '2025-01-01', '2025-02-01'
+                )
+        
+        # Lambda already had a (zero) cost row, so only the other names are re-queried
+        self.assertEqual(
+            mock_ce.get_cost_and_usage.call_args.kwargs['Filter'],
+            {'Dimensions': {'Key': 'SERVICE', 'Values': ['Amazon Polly', 'AWS Glue', 'Amazon SNS']}}
+        )
+        self.assertEqual([(s['name'], s['cost']) for s in services], [('Amazon Polly', 2.5)])
+        
+        # Nothing left to re-query when every listed service already has a cost row
+        mock_ce.reset_mock()
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with patch.object(AWSCostAdapter, '_CE_CACHE_DIR', Path(cache_dir)):
+                self.adapter._add_dimension_services(
+                    [], set(), {'AWS Lambda': 1.0, 'Amazon Polly': 0.0, 'AWS Glue': 0.0, 'Amazon SNS': 0.0},
+                    '2025-01-01', '2025-02-01'
+                )
+        mock_ce.get_cost_and_usage.assert_not_called()
+
+    
+    def test_classify_service_status(self):
+        """Test the status assigned to tax, pay-as-you-go and known cancelled services"""
+        self.assertEqual(self.adapter._classify('Tax'), ('Required', None))
+        self.assertEqual(self.adapter._classify('Amazon Rekognition'), ('Pay-As-You-Go', None))
+        self.assertEqual(self.adapter._classify('Claude 3.7 Sonnet (Amazon Bedrock Edition)'), ('Cancelled', '2025-04-21'))
+        self.assertEqual(self.adapter._classify('Amazon Simple Storage Service'), ('Cancelled', '2025-04-21'))
+
+    
+    def test_ce_request_types_client_errors(self):
+        """Test that throttling and access errors surface as typed errors without extra retries"""
+        def client_error(code):
+            return ClientError({'Error': {'Code': code, 'Message': code}}, 'GetCostAndUsage')
+        
+        mock_ce = MagicMock()
+        mock_ce.get_cost_and_usage.side_effect = client_error('ThrottlingException')
+        self.adapter.ce_client = mock_ce
+        
+        # botocore's adaptive retries are the only retry layer
+        with self.assertRaises(RetryableCEError):
+            self.adapter._ce_request('get_cost_and_usage')
+        self.assertEqual(mock_ce.get_cost_and_usage.call_count, 1)
+        
+        mock_ce.get_cost_and_usage.side_effect = client_error('AccessDeniedException')
+        with self.assertRaises(AccessDeniedError):
+            self.adapter._ce_request('get_cost_and_usage')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -10,6 +10,7 @@ from io import StringIO
 from unittest.mock import patch, MagicMock
 
 from src.nova_cost.adapters.cli_adapter import CLIAdapter, main
+from src.nova_cost.cli import _parse_fast, main as cli_main
 
 
 class TestCLIAdapter(unittest.TestCase):
@@ -199,5 +200,40 @@ class TestCLIArgumentValidation(unittest.TestCase):
                 sys.stderr = sys.__stderr__
 
 
+
+class TestFastArgumentParsing(unittest.TestCase):
+    """Test cases for the argparse-free fast path of the nova_cost CLI"""
+    
+    def test_parses_common_invocations(self):
+        """Test that well-formed commands are parsed with their defaults"""
+        args = _parse_fast(["report", "--days", "15", "--output=/custom/path.html", "--open"])
+        self.assertEqual((args.command, args.days, args.output, args.open), ("report", 15, "/custom/path.html", True))
+        
+        args = _parse_fast(["analyze", "--threshold", "5.0"])
+        self.assertEqual((args.command, args.threshold, args.days), ("analyze", 5.0, 30))
+    
+    def test_defers_to_argparse(self):
+        """Test that help, unknown options and malformed values fall back to argparse"""
+        for argv in ([], ["--help"], ["report", "-h"], ["report", "--da", "5"],
+                     ["analyze", "--threshold", "invalid"], ["report", "--days"], ["report", "--open=yes"]):
+            self.assertIsNone(_parse_fast(argv), argv)
+    
+    @patch('src.nova_cost.api.reports.AWSCostMonitor')
+    def test_main_runs_analyze_command(self, mock_monitor_class):
+        """Test that nova_cost.cli.main imports the report API and runs analyze"""
+        mock_monitor_class.return_value.get_service_costs.return_value = [
+            {"service": "AWS Lambda", "cost": 10.50},
+            {"service": "Amazon S3", "cost": 5.25}
+        ]
+        
+        with patch('sys.stdout', new_callable=StringIO) as captured_output:
+            exit_code = cli_main(["analyze", "--threshold", "6.0", "--days", "15"])
+        
+        self.assertEqual(exit_code, 0)
+        mock_monitor_class.return_value.get_service_costs.assert_called_once_with(days_back=15)
+        self.assertIn("AWS Lambda", captured_output.getvalue())
+        self.assertNotIn("Amazon S3", captured_output.getvalue())
+
+
 if __name__ == '__main__':
     unittest.main()
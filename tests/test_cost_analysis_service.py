@@ -7,7 +7,7 @@ the core business logic for analyzing AWS costs and generating reports.
 import unittest
 from unittest.mock import MagicMock, patch
 
-from src.nova_cost.domain.services import CostAnalysisService
+from src.nova_cost.domain.services import CostAnalysisService, VECTORIZE_MIN_ROWS, total_daily_cost
 
 
 class TestCostAnalysisService(unittest.TestCase):
@@ -78,6 +78,27 @@ class TestCostAnalysisService(unittest.TestCase):
         # Assertions
         self.assertEqual(len(high_cost_services), 0)
     
+    def test_analyze_costs_large_service_list(self):
+        """Test that the vectorized filter keeps the same services, in order"""
+        services = [
+            {"service": f"Service {i}", "cost": float(i % 20), "details": "", "status": "Active"}
+            for i in range(VECTORIZE_MIN_ROWS + 10)
+        ]
+        self.mock_cost_data.get_service_costs.return_value = services
+        
+        high_cost_services = self.service.analyze_costs(days_back=30, threshold=10.0)
+        
+        # Assertions
+        self.assertEqual(high_cost_services, [s for s in services if s["cost"] > 10.0])
+    
+    def test_total_daily_cost(self):
+        """Test that small and vectorized daily cost totals agree"""
+        daily_costs = [("2025-04-01", 0.25, "AWS Services")] * (VECTORIZE_MIN_ROWS + 4)
+        
+        # Assertions
+        self.assertAlmostEqual(total_daily_cost(self.sample_daily_costs), 35.79)
+        self.assertAlmostEqual(total_daily_cost(daily_costs), 0.25 * len(daily_costs))
+    
     def test_generate_cost_report(self):
         """Test report generation with all data correctly passed to the report generator"""
         # Configure the mock report generator
@@ -113,5 +134,25 @@ class TestCostAnalysisService(unittest.TestCase):
         self.mock_report_generator.add_total_cost.assert_called_once_with(expected_total)
 
 
+class TestReportAPI(unittest.TestCase):
+    """Test cases for the report entry points exported by the nova_cost.api package"""
+    
+    @patch('src.nova_cost.api.reports.AWSCostMonitor')
+    def test_analyze_costs_via_api_package(self, mock_monitor_class):
+        """Test that nova_cost.api.analyze_costs resolves and filters by threshold"""
+        from src.nova_cost import api
+        
+        mock_monitor_class.return_value.get_service_costs.return_value = [
+            {"service": "AWS Lambda", "cost": 10.50},
+            {"service": "Amazon S3", "cost": 5.25}
+        ]
+        
+        with patch('builtins.print'):
+            result = api.analyze_costs(threshold=6.0, days_back=15)
+        
+        self.assertEqual([s["service"] for s in result], ["AWS Lambda"])
+        mock_monitor_class.return_value.get_service_costs.assert_called_once_with(days_back=15)
+
+
 if __name__ == '__main__':
     unittest.main()
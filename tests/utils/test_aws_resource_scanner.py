@@ -221,6 +221,19 @@ class TestAWSResourceScanner(unittest.TestCase):
         urls = scanner.get_service_specific_cancellation_urls("Some Other Service")
         assert isinstance(urls, list), "Should return a list even for other services"
 
+    def test_get_service_specific_cancellation_urls_returns_copies(self):
+        """Test that cached URLs are built once and not shared between callers."""
+        scanner = AWSResourceScanner()
+        with patch.object(scanner, '_build_cancellation_urls',
+                          return_value=[{"name": "Console", "url": "https://console.aws.amazon.com"}]) as build:
+            first = scanner.get_service_specific_cancellation_urls("Amazon Rekognition")
+            first.append({"name": "Extra"})
+            first[0]["url"] = "changed"
+            second = scanner.get_service_specific_cancellation_urls("Amazon Rekognition")
+        
+        self.assertEqual(build.call_count, 1)
+        self.assertEqual(second, [{"name": "Console", "url": "https://console.aws.amazon.com"}])
+
     def test_get_opensearch_navigation_info(self):
         """Test retrieving navigation information for OpenSearch."""
         scanner = AWSResourceScanner()
@@ -0,0 +1,90 @@
+"""
+Tests for the botocore orjson response parser
+"""
+import unittest
+from unittest.mock import patch
+import sys
+from pathlib import Path
+
+import boto3
+from botocore.awsrequest import AWSResponse
+from botocore.parsers import JSONParser, ResponseParserFactory
+
+# Add the src directory to the path so we can import the modules
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from src.nova_cost.utils import botocore_json
+from src.nova_cost.utils.botocore_json import (
+    OrjsonJSONParser, OrjsonResponseParserFactory, use_fast_json_parser
+)
+
+
+class _RawBody:
+    """Minimal urllib3-style body for a stubbed HTTP response"""
+    
+    def __init__(self, body):
+        self._body = body
+    
+    def stream(self, **kwargs):
+        yield self._body
+
+
+def _ce_client(body):
+    """Build a real Cost Explorer client whose HTTP layer answers with body"""
+    client = boto3.session.Session(
+        aws_access_key_id='testing', aws_secret_access_key='testing', region_name='us-east-1'
+    ).client('ce')
+    client.meta.events.register(
+        'before-send.cost-explorer',
+        lambda request, **kwargs: AWSResponse(request.url, 200, {}, _RawBody(body))
+    )
+    return client
+
+@unittest.skipUnless(botocore_json.ORJSON_AVAILABLE, "orjson is not installed")
+class TestOrjsonJSONParser(unittest.TestCase):
+    """Test suite for OrjsonJSONParser and use_fast_json_parser"""
+    
+    def test_parse_body(self):
+        """Test that bodies decode like botocore's own JSON parser"""
+        parser = OrjsonJSONParser()
+        body = b'{"ResultsByTime": [{"Total": {"BlendedCost": {"Amount": "1.5"}}}]}'
+        
+        self.assertEqual(parser._parse_body_as_json(body), JSONParser()._parse_body_as_json(body))
+        self.assertEqual(parser._parse_body_as_json(b''), {})
+        self.assertEqual(parser._parse_body_as_json(b'not json'), {'message': 'not json'})
+    
+    def test_use_fast_json_parser_parses_real_responses(self):
+        """Test that a real client's responses are decoded by OrjsonJSONParser"""
+        client = use_fast_json_parser(_ce_client(b'{"ResultsByTime": [{"Estimated": true}]}'))
+        
+        with patch.object(OrjsonJSONParser, '_parse_body_as_json',
+                          autospec=True, side_effect=OrjsonJSONParser._parse_body_as_json) as spy:
+            response = client.get_cost_and_usage(
+                TimePeriod={'Start': '2025-01-01', 'End': '2025-01-02'},
+                Granularity='DAILY', Metrics=['BlendedCost']
+            )
+        
+        self.assertEqual(response['ResultsByTime'], [{'Estimated': True}])
+        spy.assert_called()
+    
+    def test_use_fast_json_parser_keeps_parser_settings(self):
+        """Test that the replacement factory keeps the client's parser defaults"""
+        client = _ce_client(b'{}')
+        defaults = dict(client._endpoint._response_parser_factory._defaults)
+        
+        use_fast_json_parser(client)
+        
+        factory = client._endpoint._response_parser_factory
+        self.assertIsInstance(factory, OrjsonResponseParserFactory)
+        self.assertEqual(factory._defaults, defaults)
+        self.assertIs(type(factory.create_parser('rest-xml')), type(ResponseParserFactory().create_parser('rest-xml')))
+    
+    @patch('src.nova_cost.utils.botocore_json.ORJSON_AVAILABLE', False)
+    def test_use_fast_json_parser_without_orjson(self):
+        """Test that clients keep botocore's parser factory when orjson is missing"""
+        client = use_fast_json_parser(_ce_client(b'{}'))
+        
+        self.assertIs(type(client._endpoint._response_parser_factory), ResponseParserFactory)
+
+if __name__ == '__main__':
+    unittest.main()
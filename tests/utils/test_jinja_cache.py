@@ -0,0 +1,54 @@
+"""
+Tests for the lazily created Jinja bytecode cache
+"""
+import os
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+
+from jinja2 import DictLoader, Environment
+
+# Add the src directory to the path so we can import the modules
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from src.nova_cost.utils.jinja_cache import LazyFileSystemBytecodeCache
+
+class TestLazyFileSystemBytecodeCache(unittest.TestCase):
+    """Test suite for LazyFileSystemBytecodeCache"""
+    
+    def setUp(self):
+        """Set up a cache directory that does not exist yet"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.temp_dir.name, 'nova_cost', 'jinja')
+    
+    def tearDown(self):
+        self.temp_dir.cleanup()
+    
+    def render(self):
+        """Render a template through a fresh environment using the cache"""
+        env = Environment(loader=DictLoader({'t.html': 'Hello {{ name }}'}),
+                          bytecode_cache=LazyFileSystemBytecodeCache(self.cache_dir))
+        return env.get_template('t.html').render(name='Nova')
+    
+    def test_directory_created_on_first_write(self):
+        """Test that the directory only appears once a template is compiled"""
+        LazyFileSystemBytecodeCache(self.cache_dir)
+        self.assertFalse(os.path.exists(self.cache_dir))
+        
+        self.assertEqual(self.render(), 'Hello Nova')
+        self.assertTrue(any(name.endswith('.cache') for name in os.listdir(self.cache_dir)))
+        
+        # A second environment loads the stored bytecode
+        self.assertEqual(self.render(), 'Hello Nova')
+    
+    def test_unwritable_directory_still_renders(self):
+        """Test that a cache directory that cannot be created does not break rendering"""
+        blocker = os.path.join(self.temp_dir.name, 'file')
+        Path(blocker).write_text('')
+        self.cache_dir = os.path.join(blocker, 'jinja')
+        
+        self.assertEqual(self.render(), 'Hello Nova')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,7 @@
 """
 Unit tests for the Service Cancellation API
 """
+import asyncio
 import unittest
 from unittest.mock import patch, MagicMock
 import boto3
@@ -71,8 +72,8 @@ class TestServiceCancellationAPI(unittest.TestCase):
         self.assertEqual(result['details']['instance_id'], "i-12345")
         mock_cancel.assert_called_once()
     
-    @patch('boto3.Session')
-    def test_cancel_service_error(self, mock_session):
+    @patch.object(ServiceCancellationAPI, '_client')
+    def test_cancel_service_error(self, mock_client_factory):
         """Test error handling in cancel_service"""
         # Mock a client error
         mock_client = MagicMock()
@@ -80,7 +81,7 @@ class TestServiceCancellationAPI(unittest.TestCase):
             {"Error": {"Code": "ResourceNotFoundException", "Message": "Domain not found"}},
             "DeleteDomain"
         )
-        mock_session.return_value.client.return_value = mock_client
+        mock_client_factory.return_value = mock_client
         
         # Call the API with an error-inducing input
         result = self.api.cancel_service("Amazon OpenSearch Service", "non-existent-domain", "us-east-1")
@@ -89,6 +90,44 @@ class TestServiceCancellationAPI(unittest.TestCase):
         self.assertFalse(result['success'])
         self.assertEqual(result['error_code'], "ResourceNotFoundException")
     
+    @patch.object(ServiceCancellationAPI, 'cancel_service')
+    def test_cancel_services_keeps_request_order(self, mock_cancel):
+        """Test that concurrent cancellations return results in request order"""
+        # Set up the mock
+        mock_cancel.side_effect = lambda name, service_id, region: {"details": {"service_id": service_id, "region": region}}
+        requests = [
+            {"service_name": "AWS Lambda", "service_id": f"function-{i}", "region": "us-west-2"}
+            for i in range(5)
+        ]
+        requests.append({"service_name": "Amazon S3", "service_id": "bucket"})
+        
+        # Call the API
+        results = self.api.cancel_services(requests, max_workers=4)
+        
+        # Verify the results
+        self.assertEqual(
+            [result['details']['service_id'] for result in results],
+            [f"function-{i}" for i in range(5)] + ["bucket"]
+        )
+        self.assertEqual(results[-1]['details']['region'], "us-east-1")
+        self.assertEqual(mock_cancel.call_count, 6)
+    
+    @patch.object(ServiceCancellationAPI, 'cancel_service')
+    def test_cancel_many_from_event_loop(self, mock_cancel):
+        """Test that the async entry point returns results in request order"""
+        # Set up the mock
+        mock_cancel.side_effect = lambda name, service_id, region: {"details": {"service_id": service_id}}
+        requests = [{"service_name": "AWS Lambda", "service_id": f"function-{i}"} for i in range(5)]
+        
+        # Call the API
+        results = asyncio.run(self.api.cancel_many(requests, max_concurrency=2))
+        
+        # Verify the results
+        self.assertEqual(
+            [result['details']['service_id'] for result in results],
+            [f"function-{i}" for i in range(5)]
+        )
+    
     def test_default_cancellation(self):
         """Test the default cancellation for unsupported services"""
         # Call the API with an unsupported service
@@ -98,8 +137,8 @@ class TestServiceCancellationAPI(unittest.TestCase):
         self.assertTrue(result['success'])  # It shouldn't fail, just return a not implemented message
         self.assertEqual(result['details']['action'], "not_implemented")
     
-    @patch('boto3.Session')
-    def test_opensearch_cancellation_implementation(self, mock_session):
+    @patch.object(ServiceCancellationAPI, '_client')
+    def test_opensearch_cancellation_implementation(self, mock_client_factory):
         """Test the OpenSearch cancellation implementation"""
         # Set up the mock
         mock_client = MagicMock()
@@ -107,15 +146,135 @@ class TestServiceCancellationAPI(unittest.TestCase):
             "DomainStatus": {"DomainName": "test-domain", "Processing": True},
             "DeletionDate": "2024-04-20T12:00:00Z"
         }
-        mock_session.return_value.client.return_value = mock_client
+        mock_client_factory.return_value = mock_client
         
         # Call the implementation directly
-        result = self.api._cancel_opensearch(mock_session.return_value, "test-domain", "us-east-1")
+        result = self.api._cancel_opensearch("test-domain", "us-east-1")
         
         # Verify the implementation
         self.assertEqual(result['domain_name'], "test-domain")
         self.assertEqual(result['action'], "deleted")
         mock_client.delete_domain.assert_called_once_with(DomainName="test-domain")
+        mock_client_factory.assert_called_once_with('opensearch', "us-east-1")
+    
+    def test_client_is_reused_per_service_and_region(self):
+        """Test that clients are created once per (service, region)"""
+        with patch.object(self.api.session, 'client') as mock_client:
+            first = self.api._client('lambda', 'us-east-1')
+            second = self.api._client('lambda', 'us-east-1')
+            self.api._client('lambda', 'us-west-2')
+        
+        # Verify one client per region, reused on the repeat call
+        self.assertIs(first, second)
+        self.assertEqual(
+            [call.kwargs['region_name'] for call in mock_client.call_args_list],
+            ['us-east-1', 'us-west-2']
+        )
+    
+    @patch.object(ServiceCancellationAPI, '_client')
+    def test_listings_are_cached_until_a_deletion(self, mock_client_factory):
+        """Test that list_only calls reuse the cached listing until a resource is deleted"""
+        # Set up the mock
+        mock_client = MagicMock()
+        mock_paginator = mock_client.get_paginator.return_value
+        mock_paginator.paginate.return_value = [
+            {"Functions": [{"FunctionName": "test-function"}]},
+            {"Functions": [{"FunctionName": "other-function"}]}
+        ]
+        mock_client_factory.return_value = mock_client
+        
+        # List twice, delete, then list again
+        first = self.api._cancel_lambda(None, "us-east-1")
+        second = self.api._cancel_lambda(None, "us-east-1")
+        self.api._cancel_lambda("test-function", "us-east-1")
+        self.api._cancel_lambda(None, "us-east-1")
+        
+        # Verify every page was listed, and only refetched after the deletion
+        self.assertEqual(first, second)
+        self.assertEqual(
+            first['functions'],
+            [{"FunctionName": "test-function"}, {"FunctionName": "other-function"}]
+        )
+        mock_client.get_paginator.assert_called_with('list_functions')
+        self.assertEqual(mock_paginator.paginate.call_count, 2)
+    
+    @patch('time.sleep')
+    @patch.object(ServiceCancellationAPI, '_client')
+    def test_redshift_deletion_backs_off_while_throttled(self, mock_client_factory, mock_sleep):
+        """Test that throttled cluster deletions are retried and other errors are not"""
+        def client_error(code):
+            return botocore.exceptions.ClientError({"Error": {"Code": code, "Message": code}}, "DeleteCluster")
+        
+        # Set up the mock to be throttled once
+        mock_client = MagicMock()
+        mock_client.delete_cluster.side_effect = [
+            client_error("Throttling"),
+            {"Cluster": {"ClusterStatus": "deleting"}}
+        ]
+        mock_client_factory.return_value = mock_client
+        
+        # Call the implementation directly
+        result = self.api._cancel_redshift("test-cluster", "us-east-1")
+        
+        # Verify the retry
+        self.assertEqual(result['deletion_status'], "deleting")
+        self.assertEqual(mock_client.delete_cluster.call_count, 2)
+        
+        # Verify other errors surface immediately with their code
+        mock_client.delete_cluster.side_effect = client_error("ClusterNotFound")
+        result = self.api.cancel_service("Amazon Redshift", "test-cluster", "us-east-1")
+        self.assertEqual(result['error_code'], "ClusterNotFound")
+        self.assertEqual(mock_client.delete_cluster.call_count, 3)
+    
+    @patch.object(ServiceCancellationAPI, '_client')
+    def test_ec2_cancellation_batches_instance_ids(self, mock_client_factory):
+        """Test that several EC2 instances are terminated in one call"""
+        # Set up the mock
+        mock_client = MagicMock()
+        mock_client.terminate_instances.return_value = {
+            "TerminatingInstances": [{"InstanceId": "i-1"}, {"InstanceId": "i-2"}]
+        }
+        mock_client_factory.return_value = mock_client
+        
+        # Call the implementation directly with comma-separated IDs
+        result = self.api._cancel_ec2("i-1, i-2", "us-east-1")
+        
+        # Verify the implementation
+        mock_client.terminate_instances.assert_called_once_with(InstanceIds=["i-1", "i-2"])
+        self.assertEqual(len(result['termination_status']), 2)
+        self.assertEqual(result['action'], "terminated")
+    
+    @patch.object(ServiceCancellationAPI, '_client')
+    def test_s3_cancellation_empties_bucket_in_batches(self, mock_client_factory):
+        """Test that every listed page is deleted in batches before the bucket"""
+        # Set up the mock with two object pages and one version page
+        mock_client = MagicMock()
+        pages = {
+            'list_objects_v2': [
+                {'Contents': [{'Key': f'key-{i}'} for i in range(1000)]},
+                {'Contents': [{'Key': 'last-key'}]}
+            ],
+            'list_object_versions': [
+                {'Versions': [{'Key': 'old-key', 'VersionId': 'v1'}]}
+            ]
+        }
+        mock_client.get_paginator.side_effect = lambda operation: MagicMock(
+            paginate=MagicMock(return_value=pages[operation])
+        )
+        mock_client.delete_objects.return_value = {}
+        mock_client_factory.return_value = mock_client
+        
+        # Call the implementation directly
+        result = self.api._cancel_s3("test-bucket", "us-east-1")
+        
+        # Verify the implementation
+        self.assertEqual(result['action'], "deleted")
+        self.assertEqual(mock_client.delete_objects.call_count, 3)
+        mock_client.delete_objects.assert_called_with(
+            Bucket="test-bucket",
+            Delete={'Objects': [{'Key': 'old-key', 'VersionId': 'v1'}], 'Quiet': True}
+        )
+        mock_client.delete_bucket.assert_called_once_with(Bucket="test-bucket")
     
     @patch('boto3.Session')
     def test_cancel_service_directly_function(self, mock_session):
@@ -128,7 +287,8 @@ class TestServiceCancellationAPI(unittest.TestCase):
             "details": {"service_id": "test-service", "action": "deleted"}
         }
         
-        with patch('src.nova_cost.api.service_cancellation.ServiceCancellationAPI', return_value=api_instance):
+        with patch('src.nova_cost.api.service_cancellation._API_SINGLETON', None), \
+                patch('src.nova_cost.api.service_cancellation.ServiceCancellationAPI', return_value=api_instance):
             # Call the function
             result = cancel_service_directly("Test Service", "test-service", "us-east-1")
             
@@ -136,6 +296,10 @@ class TestServiceCancellationAPI(unittest.TestCase):
             self.assertTrue(result['success'])
             self.assertEqual(result['details']['service_id'], "test-service")
             api_instance.cancel_service.assert_called_once_with("Test Service", "test-service", "us-east-1")
+            
+            # Verify the instance is reused by later calls
+            cancel_service_directly("Test Service", "test-service", "us-east-1")
+            self.assertEqual(api_instance.cancel_service.call_count, 2)
 
 
 if __name__ == '__main__':
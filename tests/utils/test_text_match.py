@@ -0,0 +1,47 @@
+"""
+Tests for the KeywordMatcher utility
+"""
+import unittest
+import sys
+from pathlib import Path
+
+# Add the src directory to the path so we can import the modules
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from src.nova_cost.utils.text_match import KeywordMatcher
+
+class TestKeywordMatcher(unittest.TestCase):
+    """Test suite for KeywordMatcher"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.matcher = KeywordMatcher(["Bedrock", "Claude", "S3", "Simple"])
+    
+    def test_first_prefers_priority_over_position(self):
+        """Test that the highest-priority keyword wins wherever it occurs"""
+        self.assertEqual(self.matcher.first("Claude 3.7 Sonnet (Amazon Bedrock Edition)"), "Bedrock")
+        self.assertEqual(self.matcher.first("Amazon Simple Storage Service (S3)"), "S3")
+        self.assertEqual(self.matcher.first("Amazon Simple Notification Service"), "Simple")
+    
+    def test_first_without_match(self):
+        """Test that names without any keyword return None"""
+        self.assertIsNone(self.matcher.first("AWS Lambda"))
+        self.assertIsNone(self.matcher.first(""))
+    
+    def test_longer_keyword_is_not_cut_short(self):
+        """Test that a keyword containing another keyword still matches"""
+        matcher = KeywordMatcher(["Cost Explorer", "Cost"])
+        self.assertEqual(matcher.first("AWS Cost Explorer"), "Cost Explorer")
+    
+    def test_nested_keyword_keeps_its_priority(self):
+        """Test that a higher-priority keyword inside a longer one still wins"""
+        matcher = KeywordMatcher(["S3", "S3 Glacier"])
+        self.assertEqual(matcher.first("Amazon S3 Glacier"), "S3")
+    
+    def test_overlapping_keywords_keep_their_priority(self):
+        """Test that a keyword overlapping an earlier match is still found"""
+        matcher = KeywordMatcher(["Explorer Tools", "Cost Explorer"])
+        self.assertEqual(matcher.first("Cost Explorer Tools"), "Explorer Tools")
+
+if __name__ == '__main__':
+    unittest.main()